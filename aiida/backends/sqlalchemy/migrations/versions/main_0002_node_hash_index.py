@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=invalid-name,no-member
+"""Add an expression index on the `_aiida_hash` key of `db_dbnode.extras`
+
+This index is used to look up cache sources for a node by its hash.
+
+Revision ID: main_0002
+Revises: main_0001
+Create Date: 2022-03-01
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = 'main_0002'
+down_revision = 'main_0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(
+        'ix_db_dbnode_extras_aiida_hash',
+        'db_dbnode',
+        [sa.text("(extras ->> '_aiida_hash')")],
+        unique=False,
+        postgresql_using='btree',
+    )
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index('ix_db_dbnode_extras_aiida_hash', table_name='db_dbnode')
@@ -9,6 +9,7 @@
 ###########################################################################
 # pylint: disable=import-error,no-name-in-module
 """Module to manage nodes for the SQLA backend."""
+from sqlalchemy import DDL, event
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.schema import Column
@@ -19,6 +20,10 @@ from aiida.backends.sqlalchemy.models.base import Base
 from aiida.common import timezone
 from aiida.common.utils import get_new_uuid
 
+# The keys in the extras that are used to store the hash of the node and whether it should be used in caching.
+HASH_EXTRA_KEY = '_aiida_hash'
+VALID_CACHE_EXTRA_KEY = '_aiida_valid_cache'
+
 
 class DbNode(Base):
     """Database model to store nodes.
@@ -169,6 +174,16 @@ class DbNode(Base):
         return f'{simplename} node [{self.pk}]'
 
 
+# An expression index on the hash stored in the extras, to make looking up cache sources efficient. It is created
+# through a DDL event, rather than an ``Index`` in the ``__table_args__``, since the expression is specific to
+# PostgreSQL and the table definitions are also used to generate the SQLite schema of the archive format.
+HASH_INDEX_DDL = DDL(
+    f"CREATE INDEX ix_db_dbnode_extras_aiida_hash ON %(table)s USING btree ((extras ->> '{HASH_EXTRA_KEY}'))"
+)
+
+event.listen(DbNode.__table__, 'after_create', HASH_INDEX_DDL.execute_if(dialect='postgresql'))
+
+
 class DbLink(Base):
     """Database model to store links between nodes.
 
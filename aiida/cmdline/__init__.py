@@ -14,8 +14,11 @@
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .params import *
-from .utils import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .params import *
+    from .utils import *
 
 __all__ = (
     'AbsolutePathParamType',
@@ -50,4 +53,56 @@ __all__ = (
     'with_dbenv',
 )
 
+_LAZY_IMPORTS = {
+    'AbsolutePathParamType': 'params',
+    'CalculationParamType': 'params',
+    'CodeParamType': 'params',
+    'ComputerParamType': 'params',
+    'ConfigOptionParamType': 'params',
+    'DataParamType': 'params',
+    'EmailType': 'params',
+    'EntryPointType': 'params',
+    'FileOrUrl': 'params',
+    'GroupParamType': 'params',
+    'HostnameType': 'params',
+    'IdentifierParamType': 'params',
+    'LabelStringType': 'params',
+    'LazyChoice': 'params',
+    'MpirunCommandParamType': 'params',
+    'MultipleValueParamType': 'params',
+    'NodeParamType': 'params',
+    'NonEmptyStringParamType': 'params',
+    'PathOrUrl': 'params',
+    'PluginParamType': 'params',
+    'ProcessParamType': 'params',
+    'ProfileParamType': 'params',
+    'ShebangParamType': 'params',
+    'UserParamType': 'params',
+    'WorkflowParamType': 'params',
+    'dbenv': 'utils',
+    'format_call_graph': 'utils',
+    'is_verbose': 'utils',
+    'only_if_daemon_running': 'utils',
+    'with_dbenv': 'utils',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
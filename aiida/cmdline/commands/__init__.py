@@ -9,29 +9,6 @@
 ###########################################################################
 """Sub commands of the ``verdi`` command line interface.
 
-The commands need to be imported here for them to be registered with the top-level command group.
+The modules of the commands are only imported when the corresponding command is invoked, at which point the command is
+registered with the top-level command group. See :data:`aiida.cmdline.commands.cmd_verdi.VERDI_COMMANDS`.
 """
-from aiida.cmdline.commands import (
-    cmd_archive,
-    cmd_calcjob,
-    cmd_code,
-    cmd_computer,
-    cmd_config,
-    cmd_daemon,
-    cmd_data,
-    cmd_database,
-    cmd_devel,
-    cmd_group,
-    cmd_help,
-    cmd_node,
-    cmd_plugin,
-    cmd_process,
-    cmd_profile,
-    cmd_restapi,
-    cmd_run,
-    cmd_setup,
-    cmd_shell,
-    cmd_status,
-    cmd_storage,
-    cmd_user,
-)
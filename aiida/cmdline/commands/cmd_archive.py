@@ -129,6 +129,19 @@ def inspect(archive, version, meta_data, database):
     help='Include or exclude authentication information for computer(s) in export.'
 )
 @click.option('--compress', default=6, show_default=True, type=int, help='Level of compression to use (0-9).')
+@click.option(
+    '--workers',
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help='Number of threads to compress the repository files with.'
+)
+@click.option(
+    '--checkpoint',
+    is_flag=True,
+    help='Keep a checkpoint of the repository files written to the archive, such that an interrupted export resumes '
+    'from it when the command is run again with the same output file.'
+)
 @click.option(
     '-b', '--batch-size', default=1000, type=int, help='Stream database rows in batches, to reduce memory usage.'
 )
@@ -137,7 +150,7 @@ def inspect(archive, version, meta_data, database):
 def create(
     output_file, all_entries, codes, computers, groups, nodes, force, input_calc_forward, input_work_forward,
     create_backward, return_backward, call_calc_backward, call_work_backward, include_comments, include_logs,
-    include_authinfos, compress, batch_size, test_run
+    include_authinfos, compress, workers, checkpoint, batch_size, test_run
 ):
     """Write subsets of the provenance graph to a single file.
 
@@ -184,6 +197,8 @@ def create(
         'include_logs': include_logs,
         'overwrite': force,
         'compression': compress,
+        'workers': workers,
+        'checkpoint': checkpoint,
         'batch_size': batch_size,
         'test_run': test_run
     }
@@ -463,15 +478,15 @@ def _import_archive_and_migrate(archive: str, web_based: bool, import_kwargs: di
                     new_path = temp_folder.get_abs_path('migrated_archive.aiida')
                     archive_format.migrate(archive_path, new_path, archive_format.latest_version, compression=0)
                     archive_path = new_path
-                except Exception as exception:
-                    _echo_exception(f'an exception occurred while migrating the archive {archive}', exception)
+                except Exception as sub_exception:
+                    _echo_exception(f'an exception occurred while migrating the archive {archive}', sub_exception)
 
                 echo.echo_report('proceeding with import of migrated archive')
                 try:
                     _import_archive(archive_path, archive_format=archive_format, **import_kwargs)
-                except Exception as exception:
+                except Exception as sub_exception:
                     _echo_exception(
-                        f'an exception occurred while trying to import the migrated archive {archive}', exception
+                        f'an exception occurred while trying to import the migrated archive {archive}', sub_exception
                     )
             else:
                 _echo_exception(f'an exception occurred while trying to import the archive {archive}', exception)
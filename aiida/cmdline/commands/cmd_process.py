@@ -41,10 +41,22 @@ def verdi_process():
 @options.PAST_DAYS()
 @options.LIMIT()
 @options.RAW()
+@click.option(
+    '--page-size',
+    type=click.IntRange(min=1),
+    help='Retrieve the entries in pages of this size and print each page as soon as it has been retrieved, instead of '
+    'retrieving all entries before printing them. The width of the columns is determined by the first page.'
+)
+@click.option(
+    '--count-approximate',
+    is_flag=True,
+    help='Also report the number of all the entries that match the filters, regardless of the limit, as estimated by '
+    'the query planner of the database, which is much faster than counting them exactly for large databases.'
+)
 @decorators.with_dbenv()
 def process_list(
     all_entries, group, process_state, process_label, paused, exit_status, failed, past_days, limit, project, raw,
-    order_by, order_dir
+    order_by, order_dir, page_size, count_approximate
 ):
     """Show a list of running or terminated processes.
 
@@ -53,7 +65,7 @@ def process_list(
     # pylint: disable=too-many-locals
     from tabulate import tabulate
 
-    from aiida.cmdline.utils.common import check_worker_load, print_last_process_state_change
+    from aiida.cmdline.utils.common import check_worker_load, echo_tabulated_pages, print_last_process_state_change
     from aiida.engine.daemon.client import get_daemon_client
 
     relationships = {}
@@ -64,33 +76,44 @@ def process_list(
     builder = CalculationQueryBuilder()
     filters = builder.get_filters(all_entries, process_state, process_label, paused, exit_status, failed)
     query_set = builder.get_query_set(
-        relationships=relationships, filters=filters, order_by={order_by: order_dir}, past_days=past_days, limit=limit
+        relationships=relationships,
+        filters=filters,
+        order_by={order_by: order_dir},
+        past_days=past_days,
+        limit=limit,
+        projections=project,
+        page_size=page_size
     )
-    projected = builder.get_projected(query_set, projections=project)
-
-    headers = projected.pop(0)
+    headers = [builder.mapper.get_label(projection) for projection in project]
+    projected = builder.iter_projected(query_set, projections=project)
 
-    if raw:
-        tabulated = tabulate(projected, tablefmt='plain')
-        echo.echo(tabulated)
+    if page_size is not None:
+        count = echo_tabulated_pages(projected, None if raw else headers, page_size)
     else:
-        tabulated = tabulate(projected, headers=headers)
-        echo.echo(tabulated)
-        echo.echo(f'\nTotal results: {len(projected)}\n')
+        projected = list(projected)
+        count = len(projected)
+
+        if raw:
+            echo.echo(tabulate(projected, tablefmt='plain'))
+        else:
+            echo.echo(tabulate(projected, headers=headers))
+
+    if not raw:
+        if count_approximate:
+            total = builder.get_count(relationships, filters, past_days, approximate=True)
+            echo.echo(f'\nTotal results: {count} of approximately {total}\n')
+        else:
+            echo.echo(f'\nTotal results: {count}\n')
         print_last_process_state_change()
 
         if not get_daemon_client().is_daemon_running:
             echo.echo_warning('the daemon is not running', bold=True)
         else:
             # Second query to get active process count
-            # Currently this is slow but will be fixed with issue #2770
             # We place it at the end so that the user can Ctrl+C after getting the process table.
             builder = CalculationQueryBuilder()
             filters = builder.get_filters(process_state=('created', 'waiting', 'running'))
-            query_set = builder.get_query_set(filters=filters)
-            projected = builder.get_projected(query_set, projections=['pk'])
-            worker_slot_use = len(projected) - 1
-            check_worker_load(worker_slot_use)
+            check_worker_load(builder.get_count(filters=filters))
 
 
 @verdi_process.command('show')
@@ -9,6 +9,8 @@
 ###########################################################################
 """The main `verdi` click group."""
 import difflib
+import importlib
+from typing import Dict, Optional, Tuple
 
 import click
 
@@ -32,10 +34,48 @@ GIU = (
     'taTUXFY4a4l$v=N-+f+w&wuH;Z(6p6#=n8XwlZ;*L&-rcL~T_vEm@#-Xi8&g06!MO+R(<NRBkE$(0Y_~^2C_k<o~_a3*HAHukZKXCs8^y%UZZVvze'
 )
 
+# The sub commands of ``verdi`` mapped onto the module that defines them and their short help. The modules are only
+# imported when the corresponding command is invoked, since importing all of them considerably slows down the startup
+# of ``verdi``. The short help is used to list the commands in the help without having to import them.
+VERDI_COMMANDS = {
+    'archive': ('aiida.cmdline.commands.cmd_archive', 'Create, inspect and import AiiDA archives.'),
+    'calcjob': ('aiida.cmdline.commands.cmd_calcjob', 'Inspect and manage calcjobs.'),
+    'code': ('aiida.cmdline.commands.cmd_code', 'Setup and manage codes.'),
+    'computer': ('aiida.cmdline.commands.cmd_computer', 'Setup and manage computers.'),
+    'config': ('aiida.cmdline.commands.cmd_config', 'Manage the AiiDA configuration.'),
+    'daemon': ('aiida.cmdline.commands.cmd_daemon', 'Inspect and manage the daemon.'),
+    'data': ('aiida.cmdline.commands.cmd_data', 'Inspect, create and manage data nodes.'),
+    'database': ('aiida.cmdline.commands.cmd_database', 'Inspect and manage the database.'),
+    'devel': ('aiida.cmdline.commands.cmd_devel', 'Commands for developers.'),
+    'group': ('aiida.cmdline.commands.cmd_group', 'Create, inspect and manage groups of nodes.'),
+    'help': ('aiida.cmdline.commands.cmd_help', 'Show help for given command.'),
+    'node': ('aiida.cmdline.commands.cmd_node', 'Inspect, create and manage nodes.'),
+    'plugin': ('aiida.cmdline.commands.cmd_plugin', 'Inspect AiiDA plugins.'),
+    'process': ('aiida.cmdline.commands.cmd_process', 'Inspect and manage processes.'),
+    'profile': ('aiida.cmdline.commands.cmd_profile', 'Inspect and manage the configured profiles.'),
+    'quicksetup': ('aiida.cmdline.commands.cmd_setup', 'Setup a new profile in a fully automated fashion.'),
+    'restapi': ('aiida.cmdline.commands.cmd_restapi', 'Run the AiiDA REST API server.'),
+    'run': ('aiida.cmdline.commands.cmd_run', 'Execute scripts with preloaded AiiDA environment.'),
+    'setup': ('aiida.cmdline.commands.cmd_setup', 'Setup a new profile.'),
+    'shell': ('aiida.cmdline.commands.cmd_shell', 'Start a python shell with preloaded AiiDA environment.'),
+    'status': ('aiida.cmdline.commands.cmd_status', 'Print status of AiiDA services.'),
+    'storage': ('aiida.cmdline.commands.cmd_storage', 'Inspect and manage stored data for a profile.'),
+    'user': ('aiida.cmdline.commands.cmd_user', 'Inspect and manage users.'),
+}
+
 
 class VerdiCommandGroup(click.Group):
     """Custom class for ``verdi`` top-level command group."""
 
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None, **kwargs):
+        """Construct a new instance.
+
+        :param lazy_commands: mapping of the names of sub commands onto a tuple of the module that defines the command
+            and its short help. The module is only imported when the command is requested, which registers it.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
     @staticmethod
     def add_verbosity_option(cmd):
         """Apply the ``verbosity`` option to the command, which is common to all ``verdi`` commands."""
@@ -61,11 +101,50 @@ class VerdiCommandGroup(click.Group):
         else:
             ctx.fail(f'`{cmd_name}` is not a {self.name} command.\n\nNo similar commands found.')
 
+    def list_commands(self, ctx):
+        """Return the names of the sub commands, including the lazy commands that have not yet been loaded."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def load_command(self, cmd_name):
+        """Import the module of the lazy command ``cmd_name``, if not loaded yet, which registers it with this group."""
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            importlib.import_module(self.lazy_commands[cmd_name][0])
+
+    def format_commands(self, ctx, formatter):
+        """Write the sub commands and their short help, without loading the lazy commands that have not been loaded."""
+        commands = []
+
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+                commands.append((cmd_name, self.lazy_commands[cmd_name][1]))
+                continue
+
+            cmd = self.get_command(ctx, cmd_name)
+
+            if cmd is not None and not cmd.hidden:
+                commands.append((cmd_name, cmd))
+
+        if not commands:
+            return
+
+        limit = formatter.width - 6 - max(len(cmd_name) for cmd_name, _ in commands)
+        rows = []
+
+        for cmd_name, cmd in commands:
+            if isinstance(cmd, str):
+                rows.append((cmd_name, click.utils.make_default_short_help(cmd, limit)))
+            else:
+                rows.append((cmd_name, cmd.get_short_help_str(limit)))
+
+        with formatter.section('Commands'):
+            formatter.write_dl(rows)
+
     def get_command(self, ctx, cmd_name):
         """Return the command that corresponds to the requested ``cmd_name``.
 
-        This method is overridden from the base class in order to two functionalities:
+        This method is overridden from the base class in order to three functionalities:
 
+            * If the command is a lazy command, import its module such that it is registered.
             * If the command is found, automatically add the verbosity option.
             * If the command is not found, attempt to provide a list of suggestions with existing commands that resemble
               the requested command name.
@@ -79,6 +158,7 @@ class VerdiCommandGroup(click.Group):
             click.echo(gzip.decompress(base64.b85decode(GIU.encode('utf-8'))).decode('utf-8'))
             return None
 
+        self.load_command(cmd_name)
         cmd = super().get_command(ctx, cmd_name)
 
         if cmd is not None:
@@ -104,7 +184,7 @@ class VerdiCommandGroup(click.Group):
 
 
 # Pass the version explicitly to ``version_option`` otherwise editable installs can show the wrong version number
-@click.command(cls=VerdiCommandGroup, context_settings={'help_option_names': ['--help']})
+@click.command(cls=VerdiCommandGroup, lazy_commands=VERDI_COMMANDS, context_settings={'help_option_names': ['--help']})
 @options.PROFILE(type=types.ProfileParamType(load_profile=True), expose_value=False)
 @options.VERBOSITY()
 @click.version_option(__version__, package_name='aiida_core', message='AiiDA version %(version)s')
@@ -14,7 +14,10 @@
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .types import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .types import *
 
 __all__ = (
     'AbsolutePathParamType',
@@ -44,4 +47,51 @@ __all__ = (
     'WorkflowParamType',
 )
 
+_LAZY_IMPORTS = {
+    'AbsolutePathParamType': 'types',
+    'CalculationParamType': 'types',
+    'CodeParamType': 'types',
+    'ComputerParamType': 'types',
+    'ConfigOptionParamType': 'types',
+    'DataParamType': 'types',
+    'EmailType': 'types',
+    'EntryPointType': 'types',
+    'FileOrUrl': 'types',
+    'GroupParamType': 'types',
+    'HostnameType': 'types',
+    'IdentifierParamType': 'types',
+    'LabelStringType': 'types',
+    'LazyChoice': 'types',
+    'MpirunCommandParamType': 'types',
+    'MultipleValueParamType': 'types',
+    'NodeParamType': 'types',
+    'NonEmptyStringParamType': 'types',
+    'PathOrUrl': 'types',
+    'PluginParamType': 'types',
+    'ProcessParamType': 'types',
+    'ProfileParamType': 'types',
+    'ShebangParamType': 'types',
+    'UserParamType': 'types',
+    'WorkflowParamType': 'types',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
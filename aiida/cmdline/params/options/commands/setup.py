@@ -16,8 +16,8 @@ import click
 
 from aiida.cmdline.params import options, types
 from aiida.manage.configuration import Profile, get_config, get_config_option
+from aiida.manage.external.defaults import BROKER_DEFAULTS
 from aiida.manage.external.postgres import DEFAULT_DBINFO
-from aiida.manage.external.rmq import BROKER_DEFAULTS
 
 PASSWORD_UNCHANGED = '***'  # noqa
 
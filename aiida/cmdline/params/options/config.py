@@ -13,7 +13,6 @@
     :synopsis: Convenience class for configuration file option
 """
 import click_config_file
-import yaml
 
 from .overridable import OverridableOption
 
@@ -22,6 +21,7 @@ __all__ = ('ConfigFileOption',)
 
 def yaml_config_file_provider(handle, cmd_name):  # pylint: disable=unused-argument
     """Read yaml config file from file handle."""
+    import yaml
     return yaml.safe_load(handle)
 
 
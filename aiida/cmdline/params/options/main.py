@@ -12,7 +12,7 @@ import click
 from pgsu import DEFAULT_DSN as DEFAULT_DBINFO  # pylint: disable=no-name-in-module
 
 from aiida.common.log import LOG_LEVELS, configure_logging
-from aiida.manage.external.rmq import BROKER_DEFAULTS
+from aiida.manage.external.defaults import BROKER_DEFAULTS
 
 from .. import types
 from ...utils import defaults, echo  # pylint: disable=no-name-in-module
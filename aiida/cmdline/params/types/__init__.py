@@ -14,23 +14,26 @@
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .calculation import *
-from .choice import *
-from .code import *
-from .computer import *
-from .config import *
-from .data import *
-from .group import *
-from .identifier import *
-from .multiple import *
-from .node import *
-from .path import *
-from .plugin import *
-from .process import *
-from .profile import *
-from .strings import *
-from .user import *
-from .workflow import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .calculation import *
+    from .choice import *
+    from .code import *
+    from .computer import *
+    from .config import *
+    from .data import *
+    from .group import *
+    from .identifier import *
+    from .multiple import *
+    from .node import *
+    from .path import *
+    from .plugin import *
+    from .process import *
+    from .profile import *
+    from .strings import *
+    from .user import *
+    from .workflow import *
 
 __all__ = (
     'AbsolutePathParamType',
@@ -60,4 +63,51 @@ __all__ = (
     'WorkflowParamType',
 )
 
+_LAZY_IMPORTS = {
+    'AbsolutePathParamType': 'path',
+    'CalculationParamType': 'calculation',
+    'CodeParamType': 'code',
+    'ComputerParamType': 'computer',
+    'ConfigOptionParamType': 'config',
+    'DataParamType': 'data',
+    'EmailType': 'strings',
+    'EntryPointType': 'strings',
+    'FileOrUrl': 'path',
+    'GroupParamType': 'group',
+    'HostnameType': 'strings',
+    'IdentifierParamType': 'identifier',
+    'LabelStringType': 'strings',
+    'LazyChoice': 'choice',
+    'MpirunCommandParamType': 'computer',
+    'MultipleValueParamType': 'multiple',
+    'NodeParamType': 'node',
+    'NonEmptyStringParamType': 'strings',
+    'PathOrUrl': 'path',
+    'PluginParamType': 'plugin',
+    'ProcessParamType': 'process',
+    'ProfileParamType': 'profile',
+    'ShebangParamType': 'computer',
+    'UserParamType': 'user',
+    'WorkflowParamType': 'workflow',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
@@ -15,9 +15,12 @@
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .ascii_vis import *
-from .common import *
-from .decorators import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .ascii_vis import *
+    from .common import *
+    from .decorators import *
 
 __all__ = (
     'dbenv',
@@ -27,4 +30,31 @@ __all__ = (
     'with_dbenv',
 )
 
+_LAZY_IMPORTS = {
+    'dbenv': 'decorators',
+    'format_call_graph': 'ascii_vis',
+    'is_verbose': 'common',
+    'only_if_daemon_running': 'decorators',
+    'with_dbenv': 'decorators',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
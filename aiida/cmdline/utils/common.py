@@ -580,3 +580,52 @@ def get_database_summary(querybuilder: Callable, verbose: bool) -> dict:
     data['Links'] = {'count': count}
 
     return data
+
+
+def echo_tabulated_pages(rows, headers, page_size):
+    """Echo the rows as a table, where each page of rows is printed as soon as it has been retrieved.
+
+    The width and alignment of the columns are determined by the headers and the first page of rows, such that the
+    output is identical to that of ``tabulate`` in the ``simple`` format, or ``plain`` if no headers are given, as long
+    as the values of the subsequent pages fit in the columns.
+
+    :param rows: iterable of rows, where each row is a list of values.
+    :param headers: list of column headers, or None to print the rows only.
+    :param page_size: the number of rows to retrieve before printing them.
+    :return: the number of rows that were printed.
+    """
+    import itertools
+
+    rows = iter(rows)
+    count = 0
+    columns = None
+
+    def format_row(row):
+        return '  '.join(getattr(value, align)(width) for value, (width, align) in zip(row, columns)).rstrip()
+
+    while True:
+        page = list(itertools.islice(rows, page_size))
+        formatted = [['' if value is None else str(value) for value in row] for row in page]
+
+        if columns is None:
+            # Numbers are aligned to the right, as by ``tabulate``, everything else to the left
+            first = page[0] if page else headers or []
+            aligns = [
+                'rjust' if isinstance(value, (int, float)) and not isinstance(value, bool) else 'ljust'
+                for value in first
+            ]
+            # The headers are padded with two spaces, as by ``tabulate``
+            lines = formatted + ([[f'{header}  ' for header in headers]] if headers is not None else [])
+            columns = [(max(len(line[index]) for line in lines), align) for index, align in enumerate(aligns)]
+
+            if headers is not None:
+                echo.echo(format_row(headers))
+                echo.echo(format_row(['-' * width for width, _ in columns]))
+
+        for row in formatted:
+            echo.echo(format_row(row))
+
+        count += len(page)
+
+        if len(page) < page_size:
+            return count
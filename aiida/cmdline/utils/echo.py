@@ -13,7 +13,6 @@ import enum
 import sys
 
 import click
-import yaml
 
 from aiida.common.log import AIIDA_LOGGER
 
@@ -225,11 +224,13 @@ def _format_dictionary_json_date(dictionary, sort_keys=True):
 
 def _format_yaml(dictionary, sort_keys=True):
     """Return a dictionary formatted as a string using the YAML format."""
+    import yaml
     return yaml.dump(dictionary, sort_keys=sort_keys)
 
 
 def _format_yaml_expanded(dictionary, sort_keys=True):
     """Return a dictionary formatted as a string using the expanded YAML format."""
+    import yaml
     return yaml.dump(dictionary, sort_keys=sort_keys, default_flow_style=False)
 
 
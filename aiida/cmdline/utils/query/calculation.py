@@ -15,9 +15,9 @@ from aiida.common.lang import classproperty
 class CalculationQueryBuilder:
     """Utility class to construct a QueryBuilder instance for Calculation nodes and project the query set."""
 
-    # This tuple serves to mark compound projections that cannot explicitly be projected in the QueryBuilder, but will
-    # have to be manually projected from composing its individual projection constituents
-    _compound_projections = ('state',)
+    # This mapping serves to mark compound projections that cannot explicitly be projected in the QueryBuilder, but will
+    # have to be manually projected from composing its individual projection constituents, which are the values
+    _compound_projections = {'state': ('process_state', 'paused', 'exit_status')}
     _default_projections = ('pk', 'ctime', 'process_label', 'state', 'process_status')
     _valid_projections = (
         'pk', 'uuid', 'ctime', 'mtime', 'state', 'process_state', 'process_status', 'exit_status', 'sealed',
@@ -102,7 +102,16 @@ class CalculationQueryBuilder:
 
         return filters
 
-    def get_query_set(self, relationships=None, filters=None, order_by=None, past_days=None, limit=None):
+    def get_query_set(
+        self,
+        relationships=None,
+        filters=None,
+        order_by=None,
+        past_days=None,
+        limit=None,
+        projections=None,
+        page_size=None
+    ):
         """
         Return the query set of calculations for the given filters and query parameters
 
@@ -113,26 +122,55 @@ class CalculationQueryBuilder:
         :param order_by: order the query set by this criterion
         :param past_days: only include entries from the last past days
         :param limit: limit the query set to this number of entries
-        :return: the query set, a list of dictionaries
+        :param projections: only project the attributes that are required for these projections, by default the
+            attributes of all valid projections are projected
+        :param page_size: if specified, the query set is retrieved in pages of this number of entries, each with a
+            separate query. The pages are determined by keyset pagination on the ordering attribute and the pk, such
+            that each query only has to scan the entries after the last entry of the previous page. This requires that
+            ``order_by`` contains a single attribute.
+        :return: the query set, an iterator of dictionaries
         """
         import datetime
 
-        from aiida import orm
         from aiida.common import timezone
 
-        # Define the list of projections for the QueryBuilder, which are all valid minus the compound projections
-        projected_attributes = [
-            self.mapper.get_attribute(projection)
-            for projection in self._valid_projections
-            if projection not in self._compound_projections
-        ]
-
         if filters is None:
             filters = {}
 
         if past_days is not None:
             filters['ctime'] = {'>': timezone.now() - datetime.timedelta(days=past_days)}
 
+        if order_by is None:
+            order_by = {'ctime': 'asc'}
+
+        if projections is None:
+            projections = self._valid_projections
+
+        # Define the list of projections for the QueryBuilder, which are the requested projections where the compound
+        # projections are replaced by their constituents. The pk and ordering attributes are required for pagination.
+        projected_attributes = ['id'] + list(order_by)
+
+        for projection in projections:
+            for constituent in self._compound_projections.get(projection, (projection,)):
+                projected_attributes.append(self.mapper.get_attribute(constituent))
+
+        projected_attributes = list(dict.fromkeys(projected_attributes))
+
+        if page_size is None:
+            builder = self._get_builder(relationships, filters, order_by, projected_attributes)
+
+            if limit is not None:
+                builder.limit(limit)
+
+            return builder.iterdict()
+
+        return self._iter_pages(relationships, filters, order_by, projected_attributes, limit, page_size)
+
+    @staticmethod
+    def _get_builder(relationships, filters, order_by, projected_attributes):
+        """Return the ``QueryBuilder`` for the given relationships, filters, ordering and projections."""
+        from aiida import orm
+
         builder = orm.QueryBuilder()
         builder.append(cls=orm.ProcessNode, filters=filters, project=projected_attributes, tag='process')
 
@@ -142,23 +180,96 @@ class CalculationQueryBuilder:
 
         if order_by is not None:
             builder.order_by({'process': order_by})
-        else:
-            builder.order_by({'process': {'ctime': 'asc'}})
 
-        if limit is not None:
-            builder.limit(limit)
+        return builder
 
-        return builder.iterdict()
+    def _iter_pages(self, relationships, filters, order_by, projected_attributes, limit, page_size):
+        """Return an iterator over the query set that is retrieved in pages using keyset pagination.
 
-    def get_projected(self, query_set, projections):
+        The entries are ordered by the attribute in ``order_by`` and then by pk, such that the last entry of a page
+        uniquely determines where the next page starts.
         """
-        Project the query set for the given set of projections
+        [(attribute, direction)] = order_by.items()
+        direction = direction['order'] if isinstance(direction, dict) else direction
+        operator = '>' if direction == 'asc' else '<'
+        order_by = [{attribute: direction}] if attribute == 'id' else [{attribute: direction}, {'id': direction}]
+
+        keyset = None
+        remaining = limit
+
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            page_filters = filters
+
+            if keyset is not None:
+                page_filters = {'and': [filters, keyset]} if filters else keyset
+
+            builder = self._get_builder(relationships, page_filters, order_by, projected_attributes)
+            builder.limit(size)
+
+            count = 0
+            for count, result in enumerate(builder.iterdict(batch_size=size), start=1):
+                yield result
+
+            if count < size:
+                return
+
+            # Only include the entries that come after the last entry of this page in the next page
+            last = result['process']  # pylint: disable=undefined-loop-variable
+            keyset = {'id': {operator: last['id']}}
+            if attribute != 'id':
+                keyset = {'or': [{attribute: {operator: last[attribute]}}, {attribute: last[attribute], **keyset}]}
+
+            if remaining is not None:
+                remaining -= count
+
+    def get_count(self, relationships=None, filters=None, past_days=None, approximate=False):
         """
-        header = [self.mapper.get_label(projection) for projection in projections]
-        result = [header]
+        Return the number of calculations for the given filters and query parameters
+
+        :param relationships: a mapping of relationships to join on, see :meth:`get_query_set`
+        :param filters: rules to filter query results with
+        :param past_days: only include entries from the last past days
+        :param approximate: if True, return the number of entries estimated by the query planner of the database, which
+            does not require to scan all the matching entries. If the database does not support this, the exact number
+            is returned.
+        :return: the number of calculations
+        """
+        import datetime
+        import re
+
+        from aiida.common import timezone
+
+        if filters is None:
+            filters = {}
+
+        if past_days is not None:
+            filters['ctime'] = {'>': timezone.now() - datetime.timedelta(days=past_days)}
 
+        builder = self._get_builder(relationships, filters, None, ['id'])
+
+        if approximate:
+            try:
+                plan = builder.analyze_query(execute=False)
+            except NotImplementedError:
+                pass
+            else:
+                match = re.search(r'rows=(\d+)', plan)
+                if match:
+                    return int(match.group(1))
+
+        return builder.count()
+
+    def iter_projected(self, query_set, projections):
+        """
+        Return an iterator over the rows of the query set projected for the given set of projections
+        """
         for query_result in query_set:
-            result_row = [self.mapper.format(projection, query_result['process']) for projection in projections]
-            result.append(result_row)
+            yield [self.mapper.format(projection, query_result['process']) for projection in projections]
 
-        return result
+    def get_projected(self, query_set, projections):
+        """
+        Project the query set for the given set of projections
+        """
+        header = [self.mapper.get_label(projection) for projection in projections]
+        return [header] + list(self.iter_projected(query_set, projections))
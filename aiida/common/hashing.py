@@ -21,6 +21,7 @@ import time
 import typing
 import uuid
 
+import numpy
 import pytz
 
 from aiida.common.constants import AIIDA_FLOAT_PRECISION
@@ -158,6 +159,45 @@ def _single_digest(obj_type, obj_bytes=b''):
 
 _END_DIGEST = _single_digest(')')
 
+# Hashers that are initialised with the parameters of ``_single_digest`` for the scalar types that are hashed in bulk by
+# ``_bulk_digests``. Copying an initialised hasher is considerably cheaper than constructing a new one for each value.
+_BULK_HASHERS = {
+    float: hashlib.blake2b(person=b'float', node_depth=0, **BLAKE2B_OPTIONS),
+    int: hashlib.blake2b(person=b'int', node_depth=0, **BLAKE2B_OPTIONS),
+}
+
+
+def _bulk_digests(sequence_obj):
+    """Return the digests of the elements of a sequence that only contains ``float`` and ``int`` values.
+
+    This is a fast path for large numeric sequences, e.g. parsed band energies or forces, which returns the same digests
+    as calling ``_make_hash`` on each element, but skips the dispatching and the construction of a hasher per element.
+
+    :param sequence_obj: the sequence whose elements to digest.
+    :return: the list of digests, or None if the sequence contains values of other types, including subclasses.
+    """
+    types = set(map(type, sequence_obj))
+
+    if not types or not types.issubset(_BULK_HASHERS):
+        return None
+
+    # Adding zero converts ``-0.`` to ``0.`` and leaves all other values unchanged, like the check in ``float_to_text``
+    format_float = f'{{:.{AIIDA_FLOAT_PRECISION}g}}'.format
+    float_hasher = _BULK_HASHERS[float]
+    int_hasher = _BULK_HASHERS[int]
+    digests = []
+
+    for value in sequence_obj:
+        if type(value) is float:  # pylint: disable=unidiomatic-typecheck
+            hasher = float_hasher.copy()
+            hasher.update(format_float(value + 0.).encode('utf-8'))
+        else:
+            hasher = int_hasher.copy()
+            hasher.update(str(value).encode('utf-8'))
+        digests.append(hasher.digest())
+
+    return digests
+
 
 @_make_hash.register(bytes)
 def _(bytes_obj, **kwargs):
@@ -173,9 +213,34 @@ def _(val, **kwargs):
 
 @_make_hash.register(abc.Sequence)
 def _(sequence_obj, **kwargs):
-    # unpack the list and use the elements
-    return [_single_digest('list(')] + list(chain.from_iterable(_make_hash(i, **kwargs) for i in sequence_obj)
-                                            ) + [_END_DIGEST]
+    """Hash sequences by their elements, where the elements of sequences of numbers are digested in bulk."""
+    digests = _bulk_digests(sequence_obj)
+
+    if digests is None:
+        digests = list(chain.from_iterable(_make_hash(i, **kwargs) for i in sequence_obj))
+
+    return [_single_digest('list(')] + digests + [_END_DIGEST]
+
+
+@_make_hash.register(numpy.ndarray)
+def _(array, **kwargs):
+    """Hash numpy arrays like the nested list of their elements, as returned by ``tolist``.
+
+    The elements of non-empty integer and float arrays are digested in bulk, after which the digests are nested
+    according to the shape of the array, which avoids hashing each row of a multidimensional array separately.
+    """
+    if array.ndim == 0 or array.size == 0 or array.dtype.kind not in 'iuf':
+        return _make_hash(array.tolist(), **kwargs)
+
+    digests = _bulk_digests(array.ravel().tolist())
+    start, end = [_single_digest('list(')], [_END_DIGEST]
+    length = array.shape[-1]
+    nested = [start + digests[index:index + length] + end for index in range(0, len(digests), length)]
+
+    for length in reversed(array.shape[:-1]):
+        nested = [list(chain(start, *nested[index:index + length], end)) for index in range(0, len(nested), length)]
+
+    return nested[0]
 
 
 @_make_hash.register(abc.Set)
@@ -209,6 +209,9 @@ def configure_logging(with_orm=False, daemon=False, daemon_log_file=None):
         config['handlers'][handler_dblogger] = {
             'level': get_config_option('logging.db_loglevel'),
             'class': 'aiida.orm.utils.log.DBLogHandler',
+            'batch_size': get_config_option('logging.db_log_batch_size'),
+            'flush_interval': get_config_option('logging.db_log_flush_interval'),
+            'max_queue_size': get_config_option('logging.db_log_max_queue_size'),
         }
         config['loggers']['aiida']['handlers'].append(handler_dblogger)
 
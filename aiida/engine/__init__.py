@@ -40,6 +40,7 @@ __all__ = (
     'InterruptableFuture',
     'JobManager',
     'JobsList',
+    'JobsPollCoordinator',
     'ObjectLoader',
     'OutputPort',
     'PORT_NAMESPACE_SEPARATOR',
@@ -226,9 +226,11 @@ def upload_calculation(
 
     # In a dry_run, the working directory is the raw input folder, which will already contain these resources
     if not dry_run:
+        list_of_pairs = []
         for filename in folder.get_content_list():
             logger.debug(f'[submission of calculation {node.pk}] copying file/folder {filename}...')
-            transport.put(folder.get_abs_path(filename), filename)
+            list_of_pairs.append((folder.get_abs_path(filename), filename))
+        transport.put_many(list_of_pairs)
 
         for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_copy_list:
             if remote_computer_uuid == computer.uuid:
@@ -366,6 +368,38 @@ def submit_calculation(calculation: CalcJobNode, transport: Transport) -> str:
     return job_id
 
 
+def submit_calculations(calculations: List[CalcJobNode], transport: Transport) -> List[Union[str, Exception]]:
+    """Submit previously uploaded `CalcJob`s of the same computer to the scheduler in batch.
+
+    The calculations that already have a job id are not submitted again, see :func:`submit_calculation`. The other ones
+    are submitted through a single :meth:`~aiida.schedulers.scheduler.Scheduler.submit_from_scripts` call.
+
+    :param calculations: the instances of CalcJobNode to submit, which should all use the same computer.
+    :param transport: an already opened transport to use to submit the calculations.
+    :return: for each calculation, the job id as returned by the scheduler, or the exception raised by its submission
+    """
+    results: List[Union[str, Exception]] = [calculation.get_job_id() for calculation in calculations]
+    indices = [index for index, job_id in enumerate(results) if job_id is None]
+
+    if not indices:
+        return results
+
+    scheduler = calculations[0].computer.get_scheduler()
+    scheduler.set_transport(transport)
+
+    working_directories_and_scripts = [
+        (calculations[index].get_remote_workdir(), calculations[index].get_option('submit_script_filename'))
+        for index in indices
+    ]
+
+    for index, result in zip(indices, scheduler.submit_from_scripts(working_directories_and_scripts)):
+        if not isinstance(result, Exception):
+            calculations[index].set_job_id(result)
+        results[index] = result
+
+    return results
+
+
 def stash_calculation(calculation: CalcJobNode, transport: Transport) -> None:
     """Stash files from the working directory of a completed calculation to a permanent remote folder.
 
@@ -553,6 +587,8 @@ def retrieve_files_from_list(
     :param folder: an absolute path to a folder that contains the files to copy.
     :param retrieve_list: the list of files to retrieve.
     """
+    list_of_pairs = []
+
     for item in retrieve_list:
         if isinstance(item, (list, tuple)):
             tmp_rname, tmp_lname, depth = item
@@ -582,4 +618,6 @@ def retrieve_files_from_list(
 
         for rem, loc in zip(remote_names, local_names):
             transport.logger.debug(f"[retrieval of calc {calculation.pk}] Trying to retrieve remote item '{rem}'")
-            transport.get(rem, os.path.join(folder, loc), ignore_nonexisting=True)
+            list_of_pairs.append((rem, os.path.join(folder, loc)))
+
+    transport.get_many(list_of_pairs, ignore_nonexisting=True)
@@ -68,9 +68,30 @@ def get_object_loader() -> ObjectLoader:
 
 
 class AiiDAPersister(plumpy.persistence.Persister):
-    """Persister to take saved process instance states and persisting them to the database."""
+    """Persister to take saved process instance states and persisting them to the database.
 
-    def save_checkpoint(self, process: 'Process', tag: Optional[str] = None):  # type: ignore[override] # pylint: disable=no-self-use
+    The checkpoints are stored in the ``checkpoints`` attribute of the process node, either as a yaml dump or as a
+    compressed pickle, which is more compact and faster to serialize for processes with a large state. Checkpoints are
+    always loaded in the format that they were written in, independent of the format used by the persister.
+    """
+
+    CHECKPOINT_FORMATS = ('yaml', 'pickle')
+
+    def __init__(self, checkpoint_format: str = 'yaml'):
+        """Construct a new instance.
+
+        :param checkpoint_format: the format in which to write checkpoints, one of ``CHECKPOINT_FORMATS``.
+        """
+        if checkpoint_format not in self.CHECKPOINT_FORMATS:
+            raise ValueError(f'invalid checkpoint format `{checkpoint_format}`, choose from {self.CHECKPOINT_FORMATS}')
+        self._checkpoint_format = checkpoint_format
+
+    @property
+    def checkpoint_format(self) -> str:
+        """Return the format in which checkpoints are written."""
+        return self._checkpoint_format
+
+    def save_checkpoint(self, process: 'Process', tag: Optional[str] = None):  # type: ignore[override]
         """Persist a Process instance.
 
         :param process: :class:`aiida.engine.Process`
@@ -89,7 +110,11 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f"Failed to create a bundle for '{process}': {traceback.format_exc()}")
 
         try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
+            if self._checkpoint_format == 'pickle':
+                checkpoint = serialize.serialize_binary(bundle)
+            else:
+                checkpoint = serialize.serialize(bundle)
+            process.node.set_checkpoint(checkpoint)
         except Exception:
             raise PersistenceError(f"Failed to store a checkpoint for '{process}': {traceback.format_exc()}")
 
@@ -121,7 +146,10 @@ class AiiDAPersister(plumpy.persistence.Persister):
             raise PersistenceError(f'Calculation<{calculation.pk}> does not have a saved checkpoint')
 
         try:
-            bundle = serialize.deserialize_unsafe(checkpoint)
+            if serialize.is_serialized_binary(checkpoint):
+                bundle = serialize.deserialize_binary_unsafe(checkpoint)
+            else:
+                bundle = serialize.deserialize_unsafe(checkpoint)
         except Exception:
             raise PersistenceError(f'Failed to load the checkpoint for process<{pid}>: {traceback.format_exc()}')
 
@@ -39,6 +39,7 @@ __all__ = (
     'InputPort',
     'JobManager',
     'JobsList',
+    'JobsPollCoordinator',
     'OutputPort',
     'PORT_NAMESPACE_SEPARATOR',
     'PortNamespace',
@@ -15,6 +15,7 @@
 # pylint: disable=wildcard-import
 
 from .calcjob import *
+from .coordinator import *
 from .importer import *
 from .manager import *
 
@@ -23,6 +24,7 @@ __all__ = (
     'CalcJobImporter',
     'JobManager',
     'JobsList',
+    'JobsPollCoordinator',
 )
 
 # yapf: enable
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Coordination of the scheduler polling of calculation jobs between the daemon workers of a profile."""
+import contextlib
+import pathlib
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Dict, Hashable, Iterator, Optional, Tuple, Union
+import uuid
+
+from aiida.common import json
+
+if TYPE_CHECKING:
+    from aiida.schedulers.datastructures import JobInfo
+
+__all__ = ('JobsPollCoordinator',)
+
+
+class JobsPollCoordinator:
+    """Coordinator that lets the daemon workers of a profile share a single scheduler poll per ``AuthInfo``.
+
+    The coordinator stores, for each authinfo, a snapshot of the job information returned by the last scheduler poll
+    in a SQLite database that is shared by all the workers on the machine. Before polling the scheduler, a worker has
+    to acquire the lease of the authinfo, which is only granted to one worker at a time and only once the minimum job
+    poll interval has elapsed since the last snapshot. The other workers instead wait for the snapshot published by the
+    worker holding the lease. If a worker dies while polling, its lease expires after ``lease_duration`` seconds.
+
+    Note that a snapshot can only be used by all workers if it contains all the jobs of the user, i.e. if the scheduler
+    can be queried by user, otherwise it only contains the jobs of the worker that polled the scheduler.
+    """
+
+    def __init__(self, filepath: Union[str, pathlib.Path], lease_duration: float = 120., wait_interval: float = 1.):
+        """Construct a new instance.
+
+        :param filepath: path of the SQLite database, which is created if it does not yet exist.
+        :param lease_duration: time in seconds after which the lease of a worker to poll the scheduler expires.
+        :param wait_interval: time in seconds between checks for a new snapshot while another worker holds the lease.
+        """
+        self._filepath = str(filepath)
+        self._lease_duration = lease_duration
+        self._wait_interval = wait_interval
+        self._identifier = uuid.uuid4().hex
+
+        with self._connection() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS snapshots ('
+                'authinfo_id INTEGER PRIMARY KEY, polled_at REAL, jobs TEXT, poller TEXT, lease_until REAL NOT NULL)'
+            )
+
+    @property
+    def wait_interval(self) -> float:
+        """Return the time in seconds between checks for a new snapshot while another worker holds the lease."""
+        return self._wait_interval
+
+    @contextlib.contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Return a connection to the database, committing the changes on exit, unless an exception was raised."""
+        connection = sqlite3.connect(self._filepath, timeout=30., isolation_level=None)
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                yield connection
+            except Exception:
+                connection.execute('ROLLBACK')
+                raise
+            else:
+                connection.execute('COMMIT')
+        finally:
+            connection.close()
+
+    def get_snapshot(self, authinfo_id: int) -> Optional[Tuple[float, Dict[Hashable, 'JobInfo']]]:
+        """Return the last snapshot of the job information published for the given authinfo.
+
+        :param authinfo_id: the primary key of the authinfo.
+        :return: tuple of the time at which the scheduler was polled and the mapping of job ids to job information, or
+            None if no snapshot was published yet.
+        """
+        from aiida.schedulers.datastructures import JobInfo
+
+        with self._connection() as connection:
+            query = 'SELECT polled_at, jobs FROM snapshots WHERE authinfo_id = ?'
+            row = connection.execute(query, (authinfo_id,)).fetchone()
+
+        if row is None or row[0] is None:
+            return None
+
+        polled_at, jobs = row
+
+        return polled_at, {job_id: JobInfo.load_from_dict(data) for job_id, data in json.loads(jobs).items()}
+
+    def acquire(self, authinfo_id: int, minimum_interval: float) -> bool:
+        """Try to acquire the lease to poll the scheduler for the given authinfo.
+
+        :param authinfo_id: the primary key of the authinfo.
+        :param minimum_interval: the minimum time in seconds between two polls of the scheduler.
+        :return: whether the lease was acquired, in which case the caller should poll the scheduler and then call
+            :meth:`publish`, or :meth:`release` if the poll failed.
+        """
+        now = time.time()
+
+        with self._connection() as connection:
+            row = connection.execute(
+                'SELECT polled_at, poller, lease_until FROM snapshots WHERE authinfo_id = ?', (authinfo_id,)
+            ).fetchone()
+
+            if row is not None:
+                polled_at, poller, lease_until = row
+
+                if poller != self._identifier and lease_until > now:
+                    return False
+
+                if polled_at is not None and now - polled_at < minimum_interval:
+                    return False
+
+            connection.execute(
+                'INSERT OR IGNORE INTO snapshots (authinfo_id, lease_until) VALUES (?, 0)', (authinfo_id,)
+            )
+            connection.execute(
+                'UPDATE snapshots SET poller = ?, lease_until = ? WHERE authinfo_id = ?',
+                (self._identifier, now + self._lease_duration, authinfo_id)
+            )
+
+        return True
+
+    def publish(self, authinfo_id: int, polled_at: float, jobs: Dict[Hashable, 'JobInfo']) -> None:
+        """Publish the job information polled from the scheduler for the given authinfo and release the lease.
+
+        :param authinfo_id: the primary key of the authinfo.
+        :param polled_at: the time at which the scheduler was polled.
+        :param jobs: mapping of job ids to job information as returned by the scheduler.
+        """
+        serialized = json.dumps({job_id: job_info.get_dict() for job_id, job_info in jobs.items()})
+
+        with self._connection() as connection:
+            connection.execute(
+                'UPDATE snapshots SET polled_at = ?, jobs = ?, poller = NULL, lease_until = 0 '
+                'WHERE authinfo_id = ? AND poller = ?', (polled_at, serialized, authinfo_id, self._identifier)
+            )
+
+    def release(self, authinfo_id: int) -> None:
+        """Release the lease to poll the scheduler for the given authinfo without publishing a snapshot.
+
+        :param authinfo_id: the primary key of the authinfo.
+        """
+        with self._connection() as connection:
+            connection.execute(
+                'UPDATE snapshots SET poller = NULL, lease_until = 0 WHERE authinfo_id = ? AND poller = ?',
+                (authinfo_id, self._identifier)
+            )
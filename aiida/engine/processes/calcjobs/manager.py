@@ -11,17 +11,20 @@
 import asyncio
 import contextlib
 import contextvars
+import functools
 import logging
 import time
-from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterator, List, Optional, Tuple
 
 from aiida.common import lang
-from aiida.orm import AuthInfo
+from aiida.orm import AuthInfo, CalcJobNode
 
 if TYPE_CHECKING:
     from aiida.engine.transports import TransportQueue
     from aiida.schedulers.datastructures import JobInfo
 
+    from .coordinator import JobsPollCoordinator
+
 __all__ = ('JobsList', 'JobManager')
 
 
@@ -40,14 +43,34 @@ class JobsList:
     launched with that particular authinfo. If multiple authinfo instances with the same computer, have active jobs
     these limitations are not respected between them, since there is no communication between ``JobsList`` instances.
     See the :py:class:`~aiida.engine.processes.calcjobs.manager.JobManager` for example usage.
+
+    If a :py:class:`~aiida.engine.processes.calcjobs.coordinator.JobsPollCoordinator` is given, the instances of the
+    different daemon workers for the same authinfo share their scheduler updates: only one of them polls the scheduler,
+    at most once per minimum polling interval, and the others get the job information from the snapshot it publishes.
+    This requires the scheduler to be queryable by user, otherwise each instance polls the scheduler itself.
+
+    Similarly, the submissions of calculation jobs that are requested within ``submit_batch_window`` seconds of the
+    first one are submitted to the scheduler together, using a single remote command. The window is waited for even if
+    the transport is already open, since a request for an open transport resolves without yielding to the event loop,
+    such that no other submissions would be gathered.
     """
 
-    def __init__(self, authinfo: AuthInfo, transport_queue: 'TransportQueue', last_updated: Optional[float] = None):
+    def __init__(
+        self,
+        authinfo: AuthInfo,
+        transport_queue: 'TransportQueue',
+        last_updated: Optional[float] = None,
+        coordinator: Optional['JobsPollCoordinator'] = None,
+        submit_batch_window: float = 0.
+    ):
         """Construct an instance for the given authinfo and transport queue.
 
         :param authinfo: The authinfo used to check the jobs list
         :param transport_queue: A transport queue
         :param last_updated: initialize the last updated timestamp
+        :param coordinator: optional coordinator to share the scheduler updates with other daemon workers
+        :param submit_batch_window: time in seconds during which submission requests are gathered to be submitted
+            together, 0 only gathers those that are made before the event loop gets to the submission
 
         """
         lang.type_check(last_updated, float, allow_none=True)
@@ -59,6 +82,11 @@ class JobsList:
 
         self._jobs_cache: Dict[Hashable, 'JobInfo'] = {}
         self._job_update_requests: Dict[Hashable, asyncio.Future] = {}  # Mapping: {job_id: Future}
+        self._job_update_request_times: Dict[Hashable, float] = {}  # Mapping: {job_id: time of the request}
+        self._coordinator = coordinator
+        self._job_submit_requests: Dict[Hashable, Tuple[CalcJobNode, asyncio.Future]] = {}  # Mapping: {pk: request}
+        self._submit_batch_window = submit_batch_window
+        self._submit_handle: Optional[asyncio.TimerHandle] = None
         self._last_updated = last_updated
         self._update_handle: Optional[asyncio.TimerHandle] = None
 
@@ -118,6 +146,50 @@ class JobsList:
 
             return jobs_cache
 
+    async def _get_jobs_from_coordinator(self) -> Dict[Hashable, 'JobInfo']:
+        """Get the current jobs list from the snapshot shared through the coordinator.
+
+        If there is no snapshot more recent than the last update of this instance, this instance tries to acquire the
+        lease to poll the scheduler itself and publish the result, or otherwise waits for the worker holding the lease.
+
+        :return: a mapping of job ids to :py:class:`~aiida.schedulers.datastructures.JobInfo` instances
+
+        """
+        coordinator = self._coordinator
+        assert coordinator is not None
+
+        # The calls to the coordinator can block while other workers hold the lock of its database, so they are run in
+        # the default executor of the loop, such that they do not block the other tasks of this worker
+        run = functools.partial(self._loop.run_in_executor, None)
+
+        while True:
+            snapshot = await run(coordinator.get_snapshot, self._authinfo.pk)
+
+            if snapshot is not None and (self._last_updated is None or snapshot[0] > self._last_updated):
+                self._last_updated, jobs_cache = snapshot
+                self.logger.info(f'AuthInfo<{self._authinfo.pk}>: retrieved status of active jobs from shared snapshot')
+                return jobs_cache
+
+            if await run(coordinator.acquire, self._authinfo.pk, self.get_minimum_update_interval()):
+                try:
+                    jobs_cache = await self._get_jobs_from_scheduler()
+                except Exception:
+                    await run(coordinator.release, self._authinfo.pk)
+                    raise
+
+                assert self._last_updated is not None
+                await run(coordinator.publish, self._authinfo.pk, self._last_updated, jobs_cache)
+                return jobs_cache
+
+            await asyncio.sleep(coordinator.wait_interval)
+
+    def _is_shared(self) -> bool:
+        """Return whether the scheduler updates are shared with other daemon workers through the coordinator."""
+        if self._coordinator is None:
+            return False
+
+        return self._authinfo.computer.get_scheduler().get_feature('can_query_by_user')
+
     async def _update_job_info(self) -> None:
         """Update all of the job information objects.
 
@@ -126,10 +198,15 @@ class JobsList:
         """
         try:
             if not self._update_requests_outstanding():
+                self._job_update_requests = {}
+                self._job_update_request_times = {}
                 return
 
             # Update our cache of the job states
-            self._jobs_cache = await self._get_jobs_from_scheduler()
+            if self._is_shared():
+                self._jobs_cache = await self._get_jobs_from_coordinator()
+            else:
+                self._jobs_cache = await self._get_jobs_from_scheduler()
         except Exception as exception:
             # Set the exception on all the update futures
             for future in self._job_update_requests.values():
@@ -141,14 +218,26 @@ class JobsList:
             # `_ensure_updating` will falsely conclude we are still updating, since the handle is not `None` and so it
             # will not schedule the next update, causing the job update futures to never be resolved.
             self._update_handle = None
+            self._job_update_requests = {}
+            self._job_update_request_times = {}
 
             raise
         else:
+            job_update_requests = {}
+
             for job_id, future in self._job_update_requests.items():
-                if not future.done():
+                if future.done():
+                    continue
+                if job_id not in self._jobs_cache and self._job_update_request_times[job_id] > self._last_updated:
+                    # A shared snapshot can predate the request, in which case a missing job may simply be too recent
+                    job_update_requests[job_id] = future
+                else:
                     future.set_result(self._jobs_cache.get(job_id, None))
-        finally:
-            self._job_update_requests = {}
+
+            self._job_update_requests = job_update_requests
+            self._job_update_request_times = {
+                job_id: self._job_update_request_times[job_id] for job_id in job_update_requests
+            }
 
     @contextlib.contextmanager
     def request_job_info_update(self, job_id: Hashable) -> Iterator['asyncio.Future[JobInfo]']:
@@ -160,6 +249,8 @@ class JobsList:
         :return: future that will resolve to a `JobInfo` object when the job changes state
         """
         # Get or create the future
+        if job_id not in self._job_update_requests:
+            self._job_update_request_times[job_id] = time.time()
         request = self._job_update_requests.setdefault(job_id, asyncio.Future())
         assert not request.done(), 'Expected pending job info future, found in done state.'
 
@@ -169,6 +260,75 @@ class JobsList:
         finally:
             pass
 
+    @contextlib.contextmanager
+    def request_job_submission(self, node: CalcJobNode) -> Iterator['asyncio.Future[str]']:
+        """Request the submission of a calculation job, which is submitted in batch with the other requested ones.
+
+        If the context is left before the job is submitted, for example because the task was interrupted, the request
+        is cancelled.
+
+        :param node: the calculation job to submit, which should have been uploaded
+        :return: future that will resolve to the job id returned by the scheduler
+        """
+        request: asyncio.Future = asyncio.Future()
+        self._job_submit_requests[node.pk] = (node, request)
+
+        if self._submit_handle is None:
+            self._submit_handle = self._loop.call_later(
+                self._submit_batch_window,
+                asyncio.ensure_future,
+                self._submit_jobs(),
+                context=contextvars.Context(),  #  type: ignore[call-arg]
+            )
+
+        try:
+            yield request
+        finally:
+            if not request.done():
+                request.cancel()
+
+    async def _submit_jobs(self) -> None:
+        """Submit all the calculation jobs whose submission has been requested and set the result of their requests.
+
+        The requests made while waiting for the transport are included, while those made once the jobs are being
+        submitted will be part of the next batch.
+        """
+        from aiida.engine.daemon import execmanager
+
+        requests: Dict[Hashable, Tuple[CalcJobNode, asyncio.Future]] = {}
+
+        try:
+            with self._transport_queue.request_transport(self._authinfo) as request:
+                transport = await request
+
+                requests, self._job_submit_requests = self._job_submit_requests, {}
+                self._submit_handle = None
+
+                requests = {pk: (node, future) for pk, (node, future) in requests.items() if not future.done()}
+                nodes = [node for node, _ in requests.values()]
+
+                if nodes:
+                    self.logger.info(f'AuthInfo<{self._authinfo.pk}>: submitting a batch of {len(nodes)} jobs')
+                    results = execmanager.submit_calculations(nodes, transport)
+                else:
+                    results = []
+        except Exception as exception:  # pylint: disable=broad-except
+            if not requests:
+                requests, self._job_submit_requests = self._job_submit_requests, {}
+                self._submit_handle = None
+
+            for _, future in requests.values():
+                if not future.done():
+                    future.set_exception(exception)
+        else:
+            for (_, future), result in zip(requests.values(), results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
     def _ensure_updating(self) -> None:
         """Ensure that we are updating the job list from the remote resource.
 
@@ -261,8 +421,22 @@ class JobManager:
     only hold per runner.
     """
 
-    def __init__(self, transport_queue: 'TransportQueue') -> None:
+    def __init__(
+        self,
+        transport_queue: 'TransportQueue',
+        coordinator: Optional['JobsPollCoordinator'] = None,
+        submit_batch_window: float = 0.
+    ) -> None:
+        """Construct a new instance.
+
+        :param transport_queue: the transport queue used by the jobs lists
+        :param coordinator: optional coordinator to share the scheduler updates with other daemon workers
+        :param submit_batch_window: time in seconds during which submission requests are gathered to be submitted
+            together by the jobs lists
+        """
         self._transport_queue = transport_queue
+        self._coordinator = coordinator
+        self._submit_batch_window = submit_batch_window
         self._job_lists: Dict[Hashable, 'JobInfo'] = {}
 
     def get_jobs_list(self, authinfo: AuthInfo) -> JobsList:
@@ -272,10 +446,25 @@ class JobManager:
         :return: a `JobsList` instance
         """
         if authinfo.id not in self._job_lists:
-            self._job_lists[authinfo.id] = JobsList(authinfo, self._transport_queue)
+            self._job_lists[authinfo.id] = JobsList(
+                authinfo,
+                self._transport_queue,
+                coordinator=self._coordinator,
+                submit_batch_window=self._submit_batch_window,
+            )
 
         return self._job_lists[authinfo.id]
 
+    @contextlib.contextmanager
+    def request_job_submission(self, authinfo: AuthInfo, node: CalcJobNode) -> Iterator['asyncio.Future[str]']:
+        """Get a future that will resolve to the job id of the calculation job once it has been submitted in batch.
+
+        This is a context manager so that if the user leaves the context the request is automatically cancelled.
+
+        """
+        with self.get_jobs_list(authinfo).request_job_submission(node) as request:
+            yield request
+
     @contextlib.contextmanager
     def request_job_info_update(self, authinfo: AuthInfo, job_id: Hashable) -> Iterator['asyncio.Future[JobInfo]']:
         """Get a future that will resolve to information about a given job.
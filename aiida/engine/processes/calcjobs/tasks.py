@@ -110,16 +110,18 @@ async def task_upload_job(process: 'CalcJob', transport_queue: TransportQueue, c
         return skip_submit
 
 
-async def task_submit_job(node: CalcJobNode, transport_queue: TransportQueue, cancellable: InterruptableFuture):
+async def task_submit_job(node: CalcJobNode, job_manager, cancellable: InterruptableFuture):
     """Transport task that will attempt to submit a job calculation.
 
-    The task will first request a transport from the queue. Once the transport is yielded, the relevant execmanager
-    function is called, wrapped in the exponential_backoff_retry coroutine, which, in case of a caught exception, will
-    retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
-    If all retries fail, the task will raise a TransportTaskException
+    The task will request the submission of the job from the job manager, which submits it together with the other
+    jobs of the same authinfo whose submission was requested at the same time. The request is wrapped in the
+    exponential_backoff_retry coroutine, which, in case of a caught exception, will retry after an interval that
+    increases exponentially with the number of retries, for a maximum number of retries. If all retries fail, the task
+    will raise a TransportTaskException
 
     :param node: the node that represents the job calculation
-    :param transport_queue: the TransportQueue from which to request a Transport
+    :param job_manager: The job manager
+    :type job_manager: :class:`aiida.engine.processes.calcjobs.manager.JobManager`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
 
     :raises: TransportTaskException if after the maximum number of retries the transport task still excepted
@@ -135,9 +137,8 @@ async def task_submit_job(node: CalcJobNode, transport_queue: TransportQueue, ca
     authinfo = node.get_authinfo()
 
     async def do_submit():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = await cancellable.with_interrupt(request)
-            return execmanager.submit_calculation(node, transport)
+        with job_manager.request_job_submission(authinfo, node) as request:
+            return await cancellable.with_interrupt(request)
 
     try:
         logger.info(f'scheduled request to submit CalcJob<{node.pk}>')
@@ -430,7 +431,7 @@ class Waiting(plumpy.process_states.Waiting):
 
             elif command == SUBMIT_COMMAND:
                 node.set_process_status(process_status)
-                await self._launch_task(task_submit_job, node, transport_queue)
+                await self._launch_task(task_submit_job, node, self.process.runner.job_manager)
                 result = self.update()
 
             elif command == UPDATE_COMMAND:
@@ -10,11 +10,9 @@
 # pylint: disable=global-statement
 """Runners that can run and submit processes."""
 import asyncio
-import functools
 import logging
 import signal
-import threading
-from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Type, Union
 import uuid
 
 import kiwipy
@@ -24,12 +22,13 @@ from plumpy.persistence import Persister
 from plumpy.process_comms import RemoteProcessThreadController
 
 from aiida.common import exceptions
-from aiida.orm import ProcessNode, load_node
+from aiida.orm import ProcessNode
 from aiida.plugins.utils import PluginVersionProvider
 
 from . import transports, utils
 from .processes import Process, ProcessBuilder, ProcessState, futures
 from .processes.calcjobs import manager
+from .processes.calcjobs.coordinator import JobsPollCoordinator
 
 __all__ = ('Runner',)
 
@@ -51,12 +50,127 @@ TYPE_RUN_PROCESS = Union[Process, Type[Process], ProcessBuilder]  # pylint: disa
 TYPE_SUBMIT_PROCESS = Union[Process, Type[Process], ProcessBuilder]  # pylint: disable=invalid-name
 
 
+class ProcessFinishRegistry:
+    """Registry of callbacks to be called when processes terminate, shared by all the callers of a runner.
+
+    A single broadcast subscriber listens for the termination of any process and dispatches to the callbacks
+    registered for the sender of the broadcast. As a fail-safe, should a broadcast be missed, the process state of all
+    pending processes is polled with a single query, once upon registration and then every poll interval.
+    """
+
+    TERMINAL_STATES = (ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED)
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, communicator: kiwipy.Communicator, poll_interval: Union[int, float]
+    ):
+        """Construct a new registry.
+
+        :param loop: the event loop on which the callbacks are scheduled
+        :param communicator: the communicator to subscribe to the broadcasts of the process state changes
+        :param poll_interval: interval in seconds between polling the state of the pending processes
+        """
+        self._loop = loop
+        self._communicator = communicator
+        self._poll_interval = poll_interval
+        self._callbacks: Dict[int, List[Callable[[], Any]]] = {}
+        self._subscriber_identifier: Optional[str] = None
+        self._poll_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def pending(self) -> Set[int]:
+        """Return the pks of the processes for which callbacks are pending."""
+        return set(self._callbacks)
+
+    def add(self, pk: int, callback: Callable[[], Any]) -> None:
+        """Register a callback to be called once when the process with the given pk is terminated.
+
+        :param pk: pk of the process
+        :param callback: function to be called upon process termination
+        :raises `~aiida.common.exceptions.NotExistent`: if no process with the given pk exists
+        """
+        from aiida.orm import QueryBuilder
+
+        # Fail straight away for a process that does not exist, instead of when the callback is called
+        if not QueryBuilder().append(ProcessNode, filters={'id': pk}).count():
+            raise exceptions.NotExistent(f'no process with pk<{pk}> exists')
+
+        if self._subscriber_identifier is None:
+            broadcast_filter = kiwipy.BroadcastFilter(self._on_broadcast)
+            for state in self.TERMINAL_STATES:
+                broadcast_filter.add_subject_filter(f'state_changed.*.{state.value}')
+            self._subscriber_identifier = str(uuid.uuid4())
+            self._communicator.add_broadcast_subscriber(broadcast_filter, self._subscriber_identifier)
+
+        LOGGER.info('adding callback for the termination of %d', pk)
+        self._callbacks.setdefault(pk, []).append(callback)
+
+        # Poll as soon as possible, such that processes that already terminated are detected immediately. All callbacks
+        # that are registered before the poll is executed are checked with the same query.
+        if self._poll_handle is None:
+            self._poll_handle = self._loop.call_soon(self._poll)
+
+    def close(self) -> None:
+        """Stop polling the pending processes and remove the broadcast subscriber from the communicator."""
+        if self._poll_handle is not None:
+            self._poll_handle.cancel()
+            self._poll_handle = None
+
+        if self._subscriber_identifier is not None:
+            self._communicator.remove_broadcast_subscriber(self._subscriber_identifier)
+            self._subscriber_identifier = None
+
+    def _on_broadcast(self, _communicator, _body, sender, subject, _correlation_id) -> None:
+        """Dispatch the broadcast of a terminated process to the callbacks registered for it."""
+        if sender in self._callbacks:
+            LOGGER.info('received broadcast `%s` of %d', subject, sender)
+            self._dispatch(sender)
+
+    def _poll(self) -> None:
+        """Check the process state of all pending processes, dispatching those that are terminated and reschedule."""
+        from aiida.orm import QueryBuilder
+
+        self._poll_handle = None
+
+        if not self._callbacks:
+            return
+
+        pks = list(self._callbacks)
+        states = {state.value for state in self.TERMINAL_STATES}
+        filters = {'id': {'in': pks}}
+        builder = QueryBuilder().append(ProcessNode, filters=filters, project=['id', 'attributes.process_state'])
+        found = set()
+
+        for pk, state in builder.iterall():
+            found.add(pk)
+            if state in states:
+                LOGGER.info('process<%d> confirmed to be terminated by backup polling mechanism', pk)
+                self._dispatch(pk)
+
+        for pk in set(pks) - found:
+            # The process was deleted after the callback was registered: call the callbacks, which will fail to load the
+            # node, instead of waiting indefinitely
+            LOGGER.error('process<%d> for which a termination callback was registered no longer exists', pk)
+            self._dispatch(pk)
+
+        if self._callbacks:
+            self._poll_handle = self._loop.call_later(self._poll_interval, self._poll)
+
+    def _dispatch(self, pk: int) -> None:
+        """Schedule the callbacks registered for the process with the given pk and remove them from the registry.
+
+        :param pk: pk of the process
+        """
+        for callback in self._callbacks.pop(pk, []):
+            self._loop.call_soon(callback)
+
+
 class Runner:  # pylint: disable=too-many-public-methods
     """Class that can launch processes by running in the current interpreter or by submitting them to the daemon."""
 
     _persister: Optional[Persister] = None
     _communicator: Optional[kiwipy.Communicator] = None
     _controller: Optional[RemoteProcessThreadController] = None
+    _process_finish_registry: Optional[ProcessFinishRegistry] = None
     _closed: bool = False
 
     def __init__(
@@ -65,7 +179,10 @@ class Runner:  # pylint: disable=too-many-public-methods
         loop: Optional[asyncio.AbstractEventLoop] = None,
         communicator: Optional[kiwipy.Communicator] = None,
         rmq_submit: bool = False,
-        persister: Optional[Persister] = None
+        persister: Optional[Persister] = None,
+        transport_keep_alive_timeout: float = 0.,
+        job_poll_coordinator: Optional[JobsPollCoordinator] = None,
+        job_submit_batch_window: float = 0.
     ):
         """Construct a new runner.
 
@@ -74,6 +191,9 @@ class Runner:  # pylint: disable=too-many-public-methods
         :param communicator: the communicator to use
         :param rmq_submit: if True, processes will be submitted to RabbitMQ, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
+        :param transport_keep_alive_timeout: time in seconds that an unused transport is kept open to be reused
+        :param job_poll_coordinator: optional coordinator to share the scheduler updates with other daemon workers
+        :param job_submit_batch_window: time in seconds during which job submissions are gathered to submit together
 
         """
         assert not (rmq_submit and persister is None), \
@@ -83,14 +203,17 @@ class Runner:  # pylint: disable=too-many-public-methods
         self._loop = loop if loop is not None else asyncio.get_event_loop()
         self._poll_interval = poll_interval
         self._rmq_submit = rmq_submit
-        self._transport = transports.TransportQueue(self._loop)
-        self._job_manager = manager.JobManager(self._transport)
+        self._transport = transports.TransportQueue(self._loop, keep_alive_timeout=transport_keep_alive_timeout)
+        self._job_manager = manager.JobManager(
+            self._transport, coordinator=job_poll_coordinator, submit_batch_window=job_submit_batch_window
+        )
         self._persister = persister
         self._plugin_version_provider = PluginVersionProvider()
 
         if communicator is not None:
             self._communicator = wrap_communicator(communicator, self._loop)
             self._controller = RemoteProcessThreadController(communicator)
+            self._process_finish_registry = ProcessFinishRegistry(self._loop, self._communicator, self._poll_interval)
         elif self._rmq_submit:
             LOGGER.warning('Disabling RabbitMQ submission, no communicator provided')
             self._rmq_submit = False
@@ -161,6 +284,10 @@ class Runner:  # pylint: disable=too-many-public-methods
         """Close the runner by stopping the loop."""
         assert not self._closed
         self.stop()
+        self._transport.close()
+        if self._process_finish_registry is not None:
+            self._process_finish_registry.close()
+        utils.flush_process_state_change_timestamps()
         reset_event_loop_policy()
         self._closed = True
 
@@ -292,41 +419,17 @@ class Runner:  # pylint: disable=too-many-public-methods
     def call_on_process_finish(self, pk: int, callback: Callable[[], Any]) -> None:
         """Schedule a callback when the process of the given pk is terminated.
 
-        This method will add a broadcast subscriber that will listen for state changes of the target process to be
-        terminated. As a fail-safe, a polling-mechanism is used to check the state of the process, should the broadcast
-        message be missed by the subscriber, in order to prevent the caller to wait indefinitely.
+        The callback is registered with the registry of the runner, which has a single broadcast subscriber that listens
+        for state changes of all processes to be terminated. As a fail-safe, the registry polls the state of all pending
+        processes at once, should the broadcast message be missed, in order to prevent the caller to wait indefinitely.
 
         :param pk: pk of the process
         :param callback: function to be called upon process termination
+        :raises `~aiida.common.exceptions.NotExistent`: if no process with the given pk exists
         """
         assert self.communicator is not None, 'communicator not set for runner'
-
-        node = load_node(pk=pk)
-        subscriber_identifier = str(uuid.uuid4())
-        event = threading.Event()
-
-        def inline_callback(event, *args, **kwargs):  # pylint: disable=unused-argument
-            """Callback to wrap the actual callback, that will always remove the subscriber that will be registered.
-
-            As soon as the callback is called successfully once, the `event` instance is toggled, such that if this
-            inline callback is called a second time, the actual callback is not called again.
-            """
-            if event.is_set():
-                return
-
-            try:
-                callback()
-            finally:
-                event.set()
-                self.communicator.remove_broadcast_subscriber(subscriber_identifier)  # type: ignore[union-attr]
-
-        broadcast_filter = kiwipy.BroadcastFilter(functools.partial(inline_callback, event), sender=pk)
-        for state in [ProcessState.FINISHED, ProcessState.KILLED, ProcessState.EXCEPTED]:
-            broadcast_filter.add_subject_filter(f'state_changed.*.{state.value}')
-
-        LOGGER.info('adding subscriber for broadcasts of %d', pk)
-        self.communicator.add_broadcast_subscriber(broadcast_filter, subscriber_identifier)
-        self._poll_process(node, functools.partial(inline_callback, event))
+        assert self._process_finish_registry is not None
+        self._process_finish_registry.add(pk, callback)
 
     def get_process_future(self, pk: int) -> futures.ProcessFuture:
         """Return a future for a process.
@@ -336,16 +439,3 @@ class Runner:  # pylint: disable=too-many-public-methods
         :return: A future representing the completion of the process node
         """
         return futures.ProcessFuture(pk, self._loop, self._poll_interval, self._communicator)
-
-    def _poll_process(self, node, callback):
-        """Check whether the process state of the node is terminated and call the callback or reschedule it.
-
-        :param node: the process node
-        :param callback: callback to be called when process is terminated
-        """
-        if node.is_terminated:
-            args = [node.__class__.__name__, node.pk]
-            LOGGER.info('%s<%d> confirmed to be terminated by backup polling mechanism', *args)
-            self._loop.call_soon(callback)
-        else:
-            self._loop.call_later(self._poll_interval, self._poll_process, node, callback)
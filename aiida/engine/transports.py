@@ -25,9 +25,17 @@ class TransportRequest:
     """ Information kept about request for a transport object """
 
     def __init__(self):
+        """Construct a new request, whose future is resolved once the transport is opened."""
         super().__init__()
         self.future: asyncio.Future = asyncio.Future()
         self.count = 0
+        self.open_callback_handle: Optional[asyncio.Handle] = None
+        self.close_callback_handle: Optional[asyncio.Handle] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether the transport of this request has been opened successfully."""
+        return self.future.done() and not self.future.cancelled() and self.future.exception() is None
 
 
 class TransportQueue:
@@ -40,20 +48,46 @@ class TransportQueue:
     it will open the transport and give it to all the clients that asked for it
     up to that point.  This way opening of transports (a costly operation) can
     be minimised.
+
+    Once no client is using an open transport any more, it is kept open for ``keep_alive_timeout`` seconds, such that
+    clients requesting it in the meantime get it immediately, after a check that the connection is still alive.
     """
 
-    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None, keep_alive_timeout: float = 0.):
         """
         :param loop: An asyncio event, will use `asyncio.get_event_loop()` if not supplied
+        :param keep_alive_timeout: time in seconds that an unused transport is kept open, 0 closes it immediately
         """
         self._loop = loop if loop is not None else asyncio.get_event_loop()
+        self._keep_alive_timeout = keep_alive_timeout
         self._transport_requests: Dict[Hashable, TransportRequest] = {}
+        self._metrics: Dict[str, int] = {
+            'opened': 0,
+            'reused': 0,
+            'closed': 0,
+            'closed_idle': 0,
+            'open_failed': 0,
+            'health_check_failed': 0,
+        }
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
         """ Get the loop being used by this transport queue """
         return self._loop
 
+    @property
+    def metrics(self) -> Dict[str, int]:
+        """Return the counters of the transports opened, reused and closed by this queue and those currently open.
+
+        :return: dictionary with the counters, including ``open`` and ``idle`` for the transports currently open and
+            those of which that are not used by any client.
+        """
+        requests = [request for request in self._transport_requests.values() if request.is_open]
+        metrics = dict(self._metrics)
+        metrics['open'] = len(requests)
+        metrics['idle'] = len([request for request in requests if request.count == 0])
+        return metrics
+
     @contextlib.contextmanager
     def request_transport(self, authinfo: AuthInfo) -> Iterator[Awaitable[Transport]]:
         """
@@ -69,41 +103,15 @@ class TransportQueue:
         :param authinfo: The authinfo to be used to get transport
         :return: A future that can be yielded to give the transport
         """
-        open_callback_handle = None
         transport_request = self._transport_requests.get(authinfo.id, None)
 
+        if transport_request is not None and transport_request.close_callback_handle is not None:
+            # The transport is open but unused, so it can be reused if it is still alive
+            transport_request = self._reuse_idle(authinfo, transport_request)
+
         if transport_request is None:
             # There is no existing request for this transport (i.e. on this authinfo)
-            transport_request = TransportRequest()
-            self._transport_requests[authinfo.id] = transport_request
-
-            transport = authinfo.get_transport()
-            safe_open_interval = transport.get_safe_open_interval()
-
-            def do_open():
-                """ Actually open the transport """
-                if transport_request and transport_request.count > 0:
-                    # The user still wants the transport so open it
-                    _LOGGER.debug('Transport request opening transport for %s', authinfo)
-                    try:
-                        transport.open()
-                    except Exception as exception:  # pylint: disable=broad-except
-                        _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
-                        transport_request.future.set_exception(exception)
-
-                        # Cleanup of the stale TransportRequest with the excepted transport future
-                        self._transport_requests.pop(authinfo.id, None)
-                    else:
-                        transport_request.future.set_result(transport)
-
-            # Save the handle so that we can cancel the callback if the user no longer wants it
-            # Note: Don't pass the Process context, since (a) it is not needed by `do_open` and (b) the transport is
-            # passed around to many places, including outside aiida-core (e.g. paramiko). Anyone keeping a reference
-            # to this handle would otherwise keep the Process context (and thus the process itself) in memory.
-            # See https://github.com/aiidateam/aiida-core/issues/4698
-            open_callback_handle = self._loop.call_later(
-                safe_open_interval, do_open, context=contextvars.Context()
-            )  #  type: ignore[call-arg]
+            transport_request = self._schedule_open(authinfo)
 
         try:
             transport_request.count += 1
@@ -121,10 +129,110 @@ class TransportQueue:
             assert transport_request.count >= 0, 'Transport request count dropped below 0!'
             # Check if there are no longer any users that want the transport
             if transport_request.count == 0:
-                if transport_request.future.done():
-                    _LOGGER.debug('Transport request closing transport for %s', authinfo)
-                    transport_request.future.result().close()
-                elif open_callback_handle is not None:
-                    open_callback_handle.cancel()
+                self._release(authinfo, transport_request)
+
+    def close(self) -> None:
+        """Close all the transports that are open but not used by any client."""
+        for authinfo_id, transport_request in list(self._transport_requests.items()):
+            if transport_request.close_callback_handle is not None:
+                transport_request.close_callback_handle.cancel()
+                self._close(authinfo_id)
 
-                self._transport_requests.pop(authinfo.id, None)
+    def _reuse_idle(self, authinfo: AuthInfo, transport_request: TransportRequest) -> Optional[TransportRequest]:
+        """Take the unused open transport of the given request back into use if it is still alive.
+
+        :param authinfo: the authinfo of the transport.
+        :param transport_request: the request whose transport is open but not used by any client.
+        :return: the request if its transport is still alive, otherwise ``None`` after the transport has been closed.
+        """
+        transport_request.close_callback_handle.cancel()
+        transport_request.close_callback_handle = None
+
+        if transport_request.future.result().is_alive:
+            self._metrics['reused'] += 1
+            return transport_request
+
+        _LOGGER.debug('Transport request discarding dead transport for %s', authinfo)
+        self._metrics['health_check_failed'] += 1
+        self._close(authinfo.id)
+        return None
+
+    def _schedule_open(self, authinfo: AuthInfo) -> TransportRequest:
+        """Create a new request for the transport of the given authinfo, that is opened after the safe open interval.
+
+        :param authinfo: the authinfo of the transport.
+        :return: the new request, whose future is resolved once the transport is opened.
+        """
+        transport_request = TransportRequest()
+        self._transport_requests[authinfo.id] = transport_request
+
+        transport = authinfo.get_transport()
+        safe_open_interval = transport.get_safe_open_interval()
+
+        def do_open():
+            """ Actually open the transport """
+            if transport_request.count > 0:
+                # The user still wants the transport so open it
+                _LOGGER.debug('Transport request opening transport for %s', authinfo)
+                try:
+                    transport.open()
+                except Exception as exception:  # pylint: disable=broad-except
+                    _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
+                    self._metrics['open_failed'] += 1
+                    transport_request.future.set_exception(exception)
+
+                    # Cleanup of the stale TransportRequest with the excepted transport future
+                    self._transport_requests.pop(authinfo.id, None)
+                else:
+                    self._metrics['opened'] += 1
+                    transport_request.future.set_result(transport)
+
+        # Save the handle so that we can cancel the callback if the user no longer wants it
+        # Note: Don't pass the Process context, since (a) it is not needed by `do_open` and (b) the transport is
+        # passed around to many places, including outside aiida-core (e.g. paramiko). Anyone keeping a reference
+        # to this handle would otherwise keep the Process context (and thus the process itself) in memory.
+        # See https://github.com/aiidateam/aiida-core/issues/4698
+        transport_request.open_callback_handle = self._loop.call_later(
+            safe_open_interval, do_open, context=contextvars.Context()
+        )  #  type: ignore[call-arg]
+
+        return transport_request
+
+    def _release(self, authinfo: AuthInfo, transport_request: TransportRequest) -> None:
+        """Keep alive, close or cancel the transport of the given request, that is no longer used by any client.
+
+        :param authinfo: the authinfo of the transport.
+        :param transport_request: the request that no longer has any clients.
+        """
+        if transport_request.is_open and self._keep_alive_timeout > 0:
+            _LOGGER.debug('Transport request keeping transport alive for %s', authinfo)
+            transport_request.close_callback_handle = self._loop.call_later(
+                self._keep_alive_timeout, self._close_idle, authinfo.id, context=contextvars.Context()
+            )  #  type: ignore[call-arg]
+        elif transport_request.is_open:
+            _LOGGER.debug('Transport request closing transport for %s', authinfo)
+            self._close(authinfo.id)
+        elif not transport_request.future.done():
+            transport_request.open_callback_handle.cancel()
+            self._transport_requests.pop(authinfo.id, None)
+
+    def _close_idle(self, authinfo_id: Hashable) -> None:
+        """Close the transport of the given authinfo, that has not been used for the keep alive timeout."""
+        _LOGGER.debug('Transport request closing idle transport for authinfo<%s>', authinfo_id)
+        self._metrics['closed_idle'] += 1
+        self._close(authinfo_id)
+
+    def _close(self, authinfo_id: Hashable) -> None:
+        """Close the transport of the given authinfo and remove its request.
+
+        :param authinfo_id: the primary key of the authinfo.
+        """
+        transport_request = self._transport_requests.pop(authinfo_id)
+        transport = transport_request.future.result()
+        self._metrics['closed'] += 1
+
+        if transport.is_open:
+            try:
+                transport.close()
+            except Exception as exception:  # pylint: disable=broad-except
+                _LOGGER.warning('exception occurred while trying to close transport:\n %s', exception)
@@ -14,9 +14,12 @@ import asyncio
 import contextlib
 from datetime import datetime
 import logging
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterator, List, Optional, Tuple, Type, Union
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 if TYPE_CHECKING:
+    from aiida.orm.implementation import Backend
+
     from .processes import Process, ProcessBuilder
     from .runners import Runner
 
@@ -246,12 +249,96 @@ def loop_scope(loop) -> Iterator[None]:
         asyncio.set_event_loop(current)
 
 
+class ProcessStateChangeTimestamps:
+    """Coalesce the writes of the global settings that reflect the last time a process changed state.
+
+    Since these settings are shared by all processes, writing them on every state change makes them a point of
+    contention between all the processes that are running. Instead, a setting is written at most once every given
+    interval: the first state change after the interval has elapsed is written immediately, whereas the subsequent
+    ones are kept pending and the last one of those is written once the interval has elapsed, or when :meth:`flush` is
+    called, for example when a process terminates or the runner is closed.
+    """
+
+    def __init__(self):
+        self._written: Dict[str, float] = {}
+        self._pending: Dict[str, Tuple['Backend', str, str]] = {}
+        self._handle: Optional[asyncio.TimerHandle] = None
+
+    def set(  # pylint: disable=too-many-arguments
+        self,
+        backend: 'Backend',
+        key: str,
+        value: str,
+        description: str,
+        interval: float,
+        loop: asyncio.AbstractEventLoop,
+        flush: bool = False
+    ) -> None:
+        """Set the global setting with the given key, or schedule it to be set if it was set less than interval ago.
+
+        :param backend: the backend in which to set the global setting.
+        :param key: the key of the setting.
+        :param value: the value of the setting.
+        :param description: the description of the setting.
+        :param interval: the minimum time in seconds between two writes of the setting.
+        :param loop: the event loop on which to schedule the write of a pending setting.
+        :param flush: write this and all other pending settings right away, independent of the interval.
+        """
+        elapsed = time.monotonic() - self._written.get(key, float('-inf'))
+
+        if elapsed >= interval:
+            self._pending.pop(key, None)
+            self._write(backend, key, value, description)
+            return
+
+        self._pending[key] = (backend, value, description)
+
+        if flush:
+            self.flush()
+            return
+
+        if self._handle is None:
+            self._handle = loop.call_later(interval - elapsed, self.flush)
+
+    def flush(self) -> None:
+        """Write all pending settings."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        pending, self._pending = self._pending, {}
+
+        for key, (backend, value, description) in pending.items():
+            try:
+                self._write(backend, key, value, description)
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception('failed to set the process state change timestamp `%s`', key)
+
+    def _write(self, backend: 'Backend', key: str, value: str, description: str) -> None:
+        """Write the global setting and record the time at which it was written."""
+        self._written[key] = time.monotonic()
+        backend.set_global_variable(key, value, description)
+
+
+_PROCESS_STATE_CHANGE_TIMESTAMPS = ProcessStateChangeTimestamps()
+
+
+def flush_process_state_change_timestamps() -> None:
+    """Write the process state change timestamps that are pending, see :func:`set_process_state_change_timestamp`."""
+    _PROCESS_STATE_CHANGE_TIMESTAMPS.flush()
+
+
 def set_process_state_change_timestamp(process: 'Process') -> None:
     """
     Set the global setting that reflects the last time a process changed state, for the process type
     of the given process, to the current timestamp. The process type will be determined based on
     the class of the calculation node it has as its database container.
 
+    To limit the contention on the setting, it is written at most once every ``runner.state_change_interval``
+    seconds by this interpreter, see :class:`ProcessStateChangeTimestamps`. Once the process terminates, all pending
+    settings are written right away, since the event loop may not run again to write them later, for example at the end
+    of a script that runs a process.
+
     :param process: the Process instance that changed its state
     """
     from aiida.common import timezone
@@ -272,8 +359,11 @@ def set_process_state_change_timestamp(process: 'Process') -> None:
     description = PROCESS_STATE_CHANGE_DESCRIPTION.format(process_type)
     value = timezone.datetime_to_isoformat(timezone.now())
 
-    backend = get_manager().get_profile_storage()
-    backend.set_global_variable(key, value, description)
+    manager = get_manager()
+    interval = manager.get_option('runner.state_change_interval')
+    backend = manager.get_profile_storage()
+    flush = process.has_terminated()
+    _PROCESS_STATE_CHANGE_TIMESTAMPS.set(backend, key, value, description, interval, process.loop, flush=flush)
 
 
 def get_process_state_change_timestamp(process_type: Optional[str] = None) -> Optional[datetime]:
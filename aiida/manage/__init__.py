@@ -25,10 +25,13 @@ Managing an AiiDA instance:
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .caching import *
-from .configuration import *
-from .external import *
-from .manager import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .caching import *
+    from .configuration import *
+    from .external import *
+    from .manager import *
 
 __all__ = (
     'BROKER_DEFAULTS',
@@ -61,4 +64,54 @@ __all__ = (
     'upgrade_config',
 )
 
+_LAZY_IMPORTS = {
+    'BROKER_DEFAULTS': 'external',
+    'CURRENT_CONFIG_VERSION': 'configuration',
+    'CommunicationTimeout': 'external',
+    'Config': 'configuration',
+    'ConfigValidationError': 'configuration',
+    'DEFAULT_DBINFO': 'external',
+    'DeliveryFailed': 'external',
+    'MIGRATIONS': 'configuration',
+    'OLDEST_COMPATIBLE_CONFIG_VERSION': 'configuration',
+    'Option': 'configuration',
+    'Postgres': 'external',
+    'PostgresConnectionMode': 'external',
+    'ProcessLauncher': 'external',
+    'Profile': 'configuration',
+    'RemoteException': 'external',
+    'check_and_migrate_config': 'configuration',
+    'config_needs_migrating': 'configuration',
+    'config_schema': 'configuration',
+    'disable_caching': 'caching',
+    'downgrade_config': 'configuration',
+    'enable_caching': 'caching',
+    'get_current_version': 'configuration',
+    'get_manager': 'manager',
+    'get_option': 'configuration',
+    'get_option_names': 'configuration',
+    'get_use_cache': 'caching',
+    'parse_option': 'configuration',
+    'upgrade_config': 'configuration',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
@@ -10,13 +10,17 @@
 """Definition of caching mechanism and configuration for calculations."""
 from collections import namedtuple
 from contextlib import contextmanager, suppress
+import copy
 from enum import Enum
+from functools import lru_cache
 import keyword
 import re
 
 from aiida.common import exceptions
 from aiida.common.lang import type_check
+from aiida.manage import configuration
 from aiida.manage.configuration import get_config_option
+from aiida.manage.manager import get_manager
 from aiida.plugins.entry_point import ENTRY_POINT_GROUP_TO_MODULE_PATH_MAP, ENTRY_POINT_STRING_SEPARATOR
 
 __all__ = ('get_use_cache', 'enable_caching', 'disable_caching')
@@ -31,12 +35,19 @@ class ConfigKeys(Enum):
 
 
 class _ContextCache:
-    """Cache options, accounting for when in enable_caching or disable_caching contexts."""
+    """Cache options, accounting for when in enable_caching or disable_caching contexts.
+
+    The options are compiled into a :class:`_PatternTable` that memoizes the decision for each identifier. The table is
+    discarded when the context overrides change, and recompiled when the options in the configuration change.
+    """
 
     def __init__(self):
+        """Construct an instance without any overrides and without a compiled table."""
         self._default_all = None
         self._enable = []
         self._disable = []
+        self._table = None
+        self._table_key = None
 
     def clear(self):
         """Clear caching overrides."""
@@ -44,19 +55,35 @@ class _ContextCache:
 
     def enable_all(self):
         self._default_all = 'enable'
+        self._table = None
 
     def disable_all(self):
         self._default_all = 'disable'
+        self._table = None
 
     def enable(self, identifier):
         self._enable.append(identifier)
         with suppress(ValueError):
             self._disable.remove(identifier)
+        self._table = None
 
     def disable(self, identifier):
         self._disable.append(identifier)
         with suppress(ValueError):
             self._enable.remove(identifier)
+        self._table = None
+
+    def get_table(self):
+        """Return the pattern table for the current options, which is only compiled again if the options changed.
+
+        :return: instance of :class:`_PatternTable`.
+        :raises: `~aiida.common.exceptions.ConfigurationError` if the enable or disable list contains invalid patterns.
+        """
+        if self._table is None or (self._default_all is None and _get_options_key() != self._table_key):
+            self._table = _PatternTable(*self.get_options())
+            self._table_key = copy.deepcopy(_get_options_key())
+
+        return self._table
 
     def get_options(self):
         """Return the options, applying any context overrides."""
@@ -91,6 +118,92 @@ class _ContextCache:
         return default, enabled, disabled
 
 
+class _PatternTable:
+    """Table of the compiled enable and disable patterns, which memoizes the caching decision for each identifier."""
+
+    def __init__(self, default, enabled, disabled):
+        """Construct a new instance.
+
+        :param default: whether caching is enabled for identifiers that do not match any pattern.
+        :param enabled: patterns of the identifiers for which caching is enabled.
+        :param disabled: patterns of the identifiers for which caching is disabled.
+        """
+        self.default = default
+        self._enabled = enabled
+        self._disabled = disabled
+        self._decisions = {}
+
+    def get_use_cache(self, identifier):
+        """Return whether caching should be used for the given identifier.
+
+        The decision is memoized, except when the configuration is ambiguous for the identifier, such that the error is
+        raised again for each call.
+
+        :param identifier: Process type string of the node
+        :return: boolean, True if caching is enabled, False otherwise
+        :raises: `~aiida.common.exceptions.ConfigurationError` if the identifier matches patterns in both the enable
+            and the disable list, but none of them is the unique most specific pattern.
+        """
+        try:
+            return self._decisions[identifier]
+        except KeyError:
+            use_cache = self._decisions[identifier] = self._get_decision(identifier)
+            return use_cache
+
+    def _get_decision(self, identifier):
+        """Return whether caching should be used for the given identifier, by matching it against the patterns."""
+        enable_matches = [pattern for pattern in self._enabled if _match_wildcard(string=identifier, pattern=pattern)]
+        disable_matches = [pattern for pattern in self._disabled if _match_wildcard(string=identifier, pattern=pattern)]
+
+        if enable_matches and disable_matches:
+            # If both enable and disable have matching identifier, we search for
+            # the most specific one. This is determined by checking whether
+            # all other patterns match the specific pattern.
+            PatternWithResult = namedtuple('PatternWithResult', ['pattern', 'use_cache'])
+            most_specific = []
+            for specific_pattern in enable_matches:
+                if all(
+                    _match_wildcard(string=specific_pattern, pattern=other_pattern)
+                    for other_pattern in enable_matches + disable_matches
+                ):
+                    most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=True))
+            for specific_pattern in disable_matches:
+                if all(
+                    _match_wildcard(string=specific_pattern, pattern=other_pattern)
+                    for other_pattern in enable_matches + disable_matches
+                ):
+                    most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=False))
+
+            if len(most_specific) > 1:
+                raise exceptions.ConfigurationError((
+                    'Invalid configuration: multiple matches for identifier {}'
+                    ', but the most specific identifier is not unique. Candidates: {}'
+                ).format(identifier, [match.pattern for match in most_specific]))
+            if not most_specific:
+                raise exceptions.ConfigurationError(
+                    'Invalid configuration: multiple matches for identifier {}, but none of them is most specific.'.
+                    format(identifier)
+                )
+            return most_specific[0].use_cache
+        if enable_matches:
+            return True
+        if disable_matches:
+            return False
+        return self.default
+
+
+def _get_options_key():
+    """Return the values of the caching options that are set in the loaded profile and the loaded configuration.
+
+    This is much cheaper than getting the options through ``get_config_option`` and it changes whenever one of the
+    options returned by it changes, since the other values of the options are the defaults of the configuration schema.
+    """
+    sources = (get_manager().get_profile(), configuration.CONFIG)
+    return [source.options.get(name) for source in sources if source is not None for name in _OPTION_NAMES]
+
+
+_OPTION_NAMES = tuple(key.value for key in ConfigKeys)
+
 _CONTEXT_CACHE = _ContextCache()
 
 
@@ -147,49 +260,12 @@ def get_use_cache(*, identifier=None):
     """
     type_check(identifier, str, allow_none=True)
 
-    default, enabled, disabled = _CONTEXT_CACHE.get_options()
-
-    if identifier is not None:
-        type_check(identifier, str)
+    table = _CONTEXT_CACHE.get_table()
 
-        enable_matches = [pattern for pattern in enabled if _match_wildcard(string=identifier, pattern=pattern)]
-        disable_matches = [pattern for pattern in disabled if _match_wildcard(string=identifier, pattern=pattern)]
-
-        if enable_matches and disable_matches:
-            # If both enable and disable have matching identifier, we search for
-            # the most specific one. This is determined by checking whether
-            # all other patterns match the specific pattern.
-            PatternWithResult = namedtuple('PatternWithResult', ['pattern', 'use_cache'])
-            most_specific = []
-            for specific_pattern in enable_matches:
-                if all(
-                    _match_wildcard(string=specific_pattern, pattern=other_pattern)
-                    for other_pattern in enable_matches + disable_matches
-                ):
-                    most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=True))
-            for specific_pattern in disable_matches:
-                if all(
-                    _match_wildcard(string=specific_pattern, pattern=other_pattern)
-                    for other_pattern in enable_matches + disable_matches
-                ):
-                    most_specific.append(PatternWithResult(pattern=specific_pattern, use_cache=False))
+    if identifier is None:
+        return table.default
 
-            if len(most_specific) > 1:
-                raise exceptions.ConfigurationError((
-                    'Invalid configuration: multiple matches for identifier {}'
-                    ', but the most specific identifier is not unique. Candidates: {}'
-                ).format(identifier, [match.pattern for match in most_specific]))
-            if not most_specific:
-                raise exceptions.ConfigurationError(
-                    'Invalid configuration: multiple matches for identifier {}, but none of them is most specific.'.
-                    format(identifier)
-                )
-            return most_specific[0].use_cache
-        if enable_matches:
-            return True
-        if disable_matches:
-            return False
-    return default
+    return table.get_use_cache(identifier)
 
 
 def _match_wildcard(*, string, pattern):
@@ -197,8 +273,13 @@ def _match_wildcard(*, string, pattern):
     Helper function to check whether a given name matches a pattern
     which can contain '*' wildcards.
     """
-    regexp = '.*'.join(re.escape(part) for part in pattern.split('*'))
-    return re.fullmatch(pattern=regexp, string=string) is not None
+    return _compile_wildcard(pattern).fullmatch(string) is not None
+
+
+@lru_cache(maxsize=None)
+def _compile_wildcard(pattern):
+    """Return the compiled regular expression for a pattern which can contain '*' wildcards."""
+    return re.compile('.*'.join(re.escape(part) for part in pattern.split('*')))
 
 
 def _validate_identifier_pattern(*, identifier):
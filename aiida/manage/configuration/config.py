@@ -15,8 +15,6 @@ import shutil
 import tempfile
 from typing import Any, Dict, Optional, Sequence, Tuple
 
-import jsonschema
-
 from aiida.common import json
 from aiida.common.exceptions import ConfigurationError
 
@@ -125,6 +123,8 @@ class Config:  # pylint: disable=too-many-public-methods
     @staticmethod
     def validate(config: dict, filepath: Optional[str] = None):
         """Validate a configuration dictionary."""
+        import jsonschema
+
         try:
             jsonschema.validate(instance=config, schema=config_schema())
         except jsonschema.ValidationError as error:
@@ -14,8 +14,12 @@
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .postgres import *
-from .rmq import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .defaults import *
+    from .postgres import *
+    from .rmq import *
 
 __all__ = (
     'BROKER_DEFAULTS',
@@ -28,4 +32,34 @@ __all__ = (
     'RemoteException',
 )
 
+_LAZY_IMPORTS = {
+    'BROKER_DEFAULTS': 'defaults',
+    'CommunicationTimeout': 'rmq',
+    'DEFAULT_DBINFO': 'postgres',
+    'DeliveryFailed': 'rmq',
+    'Postgres': 'postgres',
+    'PostgresConnectionMode': 'postgres',
+    'ProcessLauncher': 'rmq',
+    'RemoteException': 'rmq',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Default connection parameters of the external services.
+
+These are defined separately from the clients in :mod:`aiida.manage.external.rmq`, such that they can be imported by
+the command line interface without having to import the communication libraries.
+"""
+from aiida.common.extendeddicts import AttributeDict
+
+__all__ = ('BROKER_DEFAULTS',)
+
+BROKER_DEFAULTS = AttributeDict({
+    'protocol': 'amqp',
+    'username': 'guest',
+    'password': 'guest',
+    'host': '127.0.0.1',
+    'port': 5672,
+    'virtual_host': '',
+    'heartbeat': 600,
+})
@@ -18,9 +18,9 @@ from kiwipy import Future, communications
 import pamqp.encode
 import plumpy
 
-from aiida.common.extendeddicts import AttributeDict
+from .defaults import BROKER_DEFAULTS
 
-__all__ = ('RemoteException', 'CommunicationTimeout', 'DeliveryFailed', 'ProcessLauncher', 'BROKER_DEFAULTS')
+__all__ = ('RemoteException', 'CommunicationTimeout', 'DeliveryFailed', 'ProcessLauncher')
 
 # The following statement enables support for RabbitMQ 3.5 because without it, connections established by `aiormq` will
 # fail because the interpretation of the types of integers passed in connection parameters has changed after that
@@ -38,16 +38,6 @@ _LAUNCH_QUEUE = 'process.queue'
 _MESSAGE_EXCHANGE = 'messages'
 _TASK_EXCHANGE = 'tasks'
 
-BROKER_DEFAULTS = AttributeDict({
-    'protocol': 'amqp',
-    'username': 'guest',
-    'password': 'guest',
-    'host': '127.0.0.1',
-    'port': 5672,
-    'virtual_host': '',
-    'heartbeat': 600,
-})
-
 
 def get_rmq_url(protocol=None, username=None, password=None, host=None, port=None, virtual_host=None, **kwargs):
     """Return the URL to connect to RabbitMQ.
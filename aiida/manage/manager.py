@@ -245,7 +245,7 @@ class Manager:
         from aiida.engine import persistence
 
         if self._persister is None:
-            self._persister = persistence.AiiDAPersister()
+            self._persister = persistence.AiiDAPersister(checkpoint_format=self.get_option('runner.checkpoint_format'))
 
         return self._persister
 
@@ -372,7 +372,12 @@ class Manager:
             )
         poll_interval = 0.0 if profile.is_test_profile else self.get_option('runner.poll.interval')
 
-        settings = {'rmq_submit': False, 'poll_interval': poll_interval}
+        settings = {
+            'rmq_submit': False,
+            'poll_interval': poll_interval,
+            'transport_keep_alive_timeout': self.get_option('transport.keep_alive_timeout'),
+            'job_submit_batch_window': self.get_option('runner.submit_batch_window'),
+        }
         settings.update(kwargs)
 
         if 'communicator' not in settings:
@@ -399,7 +404,13 @@ class Manager:
         from aiida.engine import persistence
         from aiida.manage.external import rmq
 
-        runner = self.create_runner(rmq_submit=True, loop=loop)
+        settings = {}
+
+        if self.get_option('daemon.shared_job_polling'):
+            from aiida.engine.processes.calcjobs.coordinator import JobsPollCoordinator
+            settings['job_poll_coordinator'] = JobsPollCoordinator(self.get_profile().filepaths['daemon']['jobs'])
+
+        runner = self.create_runner(rmq_submit=True, loop=loop, **settings)
         runner_loop = runner.loop
 
         # Listen for incoming launch requests
@@ -107,6 +107,7 @@ __all__ = (
     'load_node',
     'load_node_class',
     'pycifrw_from_cif',
+    'store_many',
     'to_aiida_type',
     'validate_link',
 )
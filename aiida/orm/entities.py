@@ -233,6 +233,14 @@ class Entity(abc.ABC, Generic[BackendEntityType]):
         """
         return self.id
 
+    def refresh(self) -> None:
+        """Refresh the entity with the current state of the storage.
+
+        This is only needed within the snapshot mode of the storage, in which the values of a stored entity that can no
+        longer change are not retrieved from the storage each time that they are accessed.
+        """
+        self._backend_entity.refresh()
+
     def store(self: EntityType) -> EntityType:
         """Store the entity."""
         self._backend_entity.store()
@@ -9,7 +9,7 @@
 ###########################################################################
 """AiiDA Group entites"""
 from abc import ABCMeta
-from typing import TYPE_CHECKING, ClassVar, Optional, Sequence, Tuple, Type, TypeVar, Union, cast
+from typing import TYPE_CHECKING, ClassVar, Iterable, Optional, Sequence, Tuple, Type, TypeVar, Union, cast
 import warnings
 
 from aiida.common import exceptions
@@ -19,7 +19,7 @@ from aiida.manage import get_manager
 from . import convert, entities, users
 
 if TYPE_CHECKING:
-    from aiida.orm import Node, User
+    from aiida.orm import Node, QueryBuilder, User
     from aiida.orm.implementation import Backend, BackendGroup
 
 __all__ = ('Group', 'AutoGroup', 'ImportGroup', 'UpfFamily')
@@ -312,6 +312,82 @@ class Group(entities.Entity['BackendGroup'], entities.EntityExtrasMixin, metacla
 
         self._backend_entity.remove_nodes([node.backend_entity for node in nodes])
 
+    def add_nodes_by_pk(self, pks: Union[Iterable[int], 'QueryBuilder'], chunk_size: int = 10000) -> int:
+        """Add the nodes with the given primary keys to the group, without loading them.
+
+        This is considerably faster than :meth:`add_nodes` for large numbers of nodes, since the nodes are added in
+        chunks of a single database statement each. The progress is reported through the progress reporter of
+        :mod:`aiida.common.progress_reporter`. Nodes that are already in the group and primary keys that do not
+        correspond to a node are ignored.
+
+        :note: the group has to be stored.
+
+        :param pks: an iterable of node primary keys, or a ``QueryBuilder`` that projects only the ``id`` of a node,
+            in which case the primary keys are never loaded from the database.
+        :param chunk_size: the maximum number of nodes that are added in a single database statement.
+        :return: the number of nodes that were added to the group.
+        """
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot add nodes to an unstored group')
+
+        return self._modify_nodes_by_pk(self._backend_entity.add_nodes_by_pk, pks, chunk_size, 'Adding nodes')
+
+    def remove_nodes_by_pk(self, pks: Union[Iterable[int], 'QueryBuilder'], chunk_size: int = 10000) -> int:
+        """Remove the nodes with the given primary keys from the group, without loading them.
+
+        This is considerably faster than :meth:`remove_nodes` for large numbers of nodes, since the nodes are removed
+        in chunks of a single database statement each. The progress is reported through the progress reporter of
+        :mod:`aiida.common.progress_reporter`. Primary keys of nodes that are not in the group are ignored.
+
+        :note: the group has to be stored.
+
+        :param pks: an iterable of node primary keys, or a ``QueryBuilder`` that projects only the ``id`` of a node,
+            in which case the primary keys are never loaded from the database.
+        :param chunk_size: the maximum number of nodes that are removed in a single database statement.
+        :return: the number of nodes that were removed from the group.
+        """
+        if not self.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot remove nodes from an unstored group')
+
+        return self._modify_nodes_by_pk(self._backend_entity.remove_nodes_by_pk, pks, chunk_size, 'Removing nodes')
+
+    @staticmethod
+    def _modify_nodes_by_pk(method, pks: Union[Iterable[int], 'QueryBuilder'], chunk_size: int, desc: str) -> int:
+        """Call the backend method that adds or removes nodes by primary key, reporting the progress.
+
+        :param method: the backend method to call.
+        :param pks: an iterable of node primary keys, or a ``QueryBuilder`` that projects only the ``id`` of a node.
+        :param chunk_size: the maximum number of nodes that are added or removed in a single database statement.
+        :param desc: the description of the progress.
+        :return: the number of nodes that were added or removed.
+        :raises ValueError: if the ``QueryBuilder`` does not project only the ``id`` of a node.
+        """
+        from collections.abc import Sized
+
+        from aiida.common.progress_reporter import get_progress_reporter
+
+        from .querybuilder import QueryBuilder
+
+        if isinstance(pks, QueryBuilder):
+            query = pks.as_dict()
+            orm_bases = {path['tag']: path['orm_base'] for path in query['path']}
+            projections = [(orm_bases[tag], list(projection))
+                           for tag, tag_projections in query['project'].items()
+                           for projection in tag_projections]
+
+            if projections not in ([('node', ['id'])], [('node', ['pk'])]):
+                raise ValueError('the `QueryBuilder` has to project only the `id` of a node')
+
+            total = pks.count()
+            pks = query
+        else:
+            if not isinstance(pks, Sized):
+                pks = list(pks)
+            total = len(pks)
+
+        with get_progress_reporter()(total=total, desc=desc) as progress:
+            return method(pks, chunk_size=chunk_size, callback=progress.update)
+
     def is_user_defined(self) -> bool:
         """
         :return: True if the group is user defined, False otherwise
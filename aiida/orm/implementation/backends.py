@@ -115,6 +115,13 @@ class Backend(abc.ABC):  # pylint: disable=too-many-public-methods
     def is_closed(self) -> bool:
         """Return whether the storage is closed."""
 
+    def release_thread_session(self) -> None:
+        """Release the resources held for the storage access of the current thread, such as its database session.
+
+        Threads other than the main thread that access the storage should call this before they finish. The default
+        implementation does nothing, for backends that do not hold any resources per thread.
+        """
+
     @abc.abstractmethod
     def _clear(self, recreate_user: bool = True) -> None:
         """Clear the storage, removing all data.
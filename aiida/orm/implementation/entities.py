@@ -53,6 +53,10 @@ class BackendEntity(abc.ABC):
         """
         return self.id
 
+    @abc.abstractmethod
+    def refresh(self) -> None:
+        """Refresh the entity with the current state of the backend, discarding the values that were loaded."""
+
     @abc.abstractmethod
     def store(self: EntityType) -> EntityType:
         """Store this entity in the backend.
@@ -9,12 +9,13 @@
 ###########################################################################
 """Backend group module"""
 import abc
-from typing import TYPE_CHECKING, List, Optional, Protocol, Sequence, Union
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Protocol, Sequence, Union
 
 from .entities import BackendCollection, BackendEntity, BackendEntityExtrasMixin
 from .nodes import BackendNode
 
 if TYPE_CHECKING:
+    from .querybuilder import QueryDictType
     from .users import BackendUser
 
 __all__ = ('BackendGroup', 'BackendGroupCollection')
@@ -140,6 +141,48 @@ class BackendGroup(BackendEntity, BackendEntityExtrasMixin):
         if any(not isinstance(node, BackendNode) for node in nodes):
             raise TypeError(f'nodes have to be of type {BackendNode}')
 
+    @abc.abstractmethod
+    def add_nodes_by_pk(
+        self,
+        pks: Union[Iterable[int], 'QueryDictType'],
+        chunk_size: int = 10000,
+        callback: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """Add the nodes with the given primary keys to the group, without loading them.
+
+        The nodes are added in chunks, where each chunk is added in a single statement. Nodes that are already in the
+        group and primary keys that do not correspond to a node are ignored.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node primary keys, or the dictionary representation of a query that projects only
+            the ``id`` of a node.
+        :param chunk_size: the maximum number of primary keys that are added in a single statement.
+        :param callback: optional callable that is called with the number of processed primary keys after each chunk.
+        :return: the number of nodes that were added to the group.
+        """
+
+    @abc.abstractmethod
+    def remove_nodes_by_pk(
+        self,
+        pks: Union[Iterable[int], 'QueryDictType'],
+        chunk_size: int = 10000,
+        callback: Optional[Callable[[int], None]] = None
+    ) -> int:
+        """Remove the nodes with the given primary keys from the group, without loading them.
+
+        The nodes are removed in chunks, where each chunk is removed in a single statement. Primary keys of nodes that
+        are not in the group are ignored.
+
+        :note: the group itself has to be stored.
+
+        :param pks: an iterable of node primary keys, or the dictionary representation of a query that projects only
+            the ``id`` of a node.
+        :param chunk_size: the maximum number of primary keys that are removed in a single statement.
+        :param callback: optional callable that is called with the number of processed primary keys after each chunk.
+        :return: the number of nodes that were removed from the group.
+        """
+
     def __repr__(self) -> str:
         return f'<{self.__class__.__name__}: {str(self)}>'
 
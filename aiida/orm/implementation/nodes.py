@@ -10,7 +10,7 @@
 """Abstract BackendNode and BackendNodeCollection implementation."""
 import abc
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 from .entities import BackendCollection, BackendEntity, BackendEntityExtrasMixin
 
@@ -337,3 +337,28 @@ class BackendNodeCollection(BackendCollection[BackendNode]):
 
         :param pk: id of the node to delete
         """
+
+    def store_many(self, entries: Sequence[Tuple[BackendNode, Sequence['LinkTriple']]], clean: bool = True) -> None:
+        """Store multiple nodes together with their incoming links in a single transaction.
+
+        The sources of all links should either already be stored or be one of the nodes that is being stored. The base
+        implementation simply stores the nodes one by one, but backends can override it to insert the rows in bulk.
+
+        :param entries: a sequence of tuples of an unstored node and the link triples of its incoming links
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        """
+        with self.backend.transaction():
+            for node, links in entries:
+                node.store(links, with_transaction=False, clean=clean)
+
+    @abc.abstractmethod
+    def iter_hash_matches(self, node_type: str, node_hash: str) -> Iterator[BackendNode]:
+        """Return an iterator over the stored nodes of the given type whose hash matches the given hash.
+
+        The hash is matched against the ``_aiida_hash`` extra of the nodes. Nodes whose ``_aiida_valid_cache`` extra is
+        explicitly set to ``False`` are excluded, such that all candidates are retrieved in a single query.
+
+        :param node_type: the exact node type of the nodes to match, subclasses are not included
+        :param node_hash: the hash to match
+        :return: an iterator over the matching nodes, ordered by their id
+        """
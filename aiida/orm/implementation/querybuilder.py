@@ -107,6 +107,13 @@ class BackendQueryBuilder(abc.ABC):
     def iterdict(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, Dict[str, Any]]]:
         """Return an iterator over all the results of a list of dictionaries."""
 
+    @abc.abstractmethod
+    def iter_columns(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, List[Any]]]:
+        """Return an iterator over batches of the results, where each batch is a dictionary of columns.
+
+        The columns are keyed by ``<tag>.<field>`` and are in the same order as the values in the rows of ``iterall``.
+        """
+
     def as_sql(self, data: QueryDictType, inline: bool = False) -> str:
         """Convert the query to an SQL string representation.
 
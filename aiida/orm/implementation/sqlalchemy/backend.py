@@ -24,7 +24,7 @@ from aiida.manage.configuration.profile import Profile
 from aiida.orm import User
 from aiida.orm.entities import EntityTypes
 
-from . import authinfos, comments, computers, convert, groups, logs, nodes, querybuilder, users
+from . import authinfos, comments, computers, convert, groups, logs, nodes, querybuilder, users, utils
 from ..backends import Backend
 from ..entities import BackendEntity
 
@@ -110,6 +110,10 @@ class PsqlDosBackend(Backend):  # pylint: disable=too-many-public-methods
             raise ClosedStorage(str(self))
         return self._session_factory()
 
+    def release_thread_session(self) -> None:
+        if self._session_factory is not None:
+            self._session_factory.remove()
+
     def close(self) -> None:
         if self._session_factory is None:
             return  # the instance is already closed, and so this is a no-op
@@ -228,6 +232,17 @@ class PsqlDosBackend(Backend):  # pylint: disable=too-many-public-methods
     def in_transaction(self) -> bool:
         return self.get_session().in_nested_transaction()
 
+    @contextmanager
+    def snapshot(self) -> Iterator[Session]:
+        """Put the session in snapshot mode, to be used as a context manager.
+
+        Within the context, the fields of stored data nodes and sealed process nodes are served from the rows that were
+        loaded, instead of being refreshed from the database each time they are retrieved. Call ``refresh`` on a node to
+        fetch the latest values of its fields. See :func:`aiida.orm.implementation.sqlalchemy.utils.snapshot`.
+        """
+        with utils.snapshot(self.get_session()) as session:
+            yield session
+
     @staticmethod
     @functools.lru_cache(maxsize=18)
     def _get_mapper_from_entity(entity_type: EntityTypes, with_pk: bool):
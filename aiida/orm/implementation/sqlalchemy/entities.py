@@ -88,6 +88,10 @@ class SqlaModelEntity(Generic[ModelType]):
         """
         return self._dbmodel.id is not None
 
+    def refresh(self):
+        """Refresh the fields of this entity with the current state of the database."""
+        self._dbmodel.refresh()
+
     def store(self):
         """
         Store this entity
@@ -274,6 +274,152 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], ExtrasMixin, BackendGroup):
 
             session.commit()
 
+    def add_nodes_by_pk(self, pks, chunk_size=10000, callback=None):
+        """Add the nodes with the given primary keys to the group, without loading them.
+
+        Each chunk is added with a single ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` statement, selecting the
+        primary keys from the node table such that primary keys that do not correspond to a node are ignored.
+
+        :param pks: an iterable of node primary keys, or the dictionary representation of a query that projects only
+            the ``id`` of a node.
+        :param chunk_size: the maximum number of primary keys that are added in a single statement.
+        :param callback: optional callable that is called with the number of processed primary keys after each chunk.
+        :return: the number of nodes that were added to the group.
+        """
+        from sqlalchemy import literal, select
+        from sqlalchemy.dialects.postgresql import insert  # pylint: disable=import-error, no-name-in-module
+
+        from aiida.backends.sqlalchemy.models.group import table_groups_nodes
+
+        def get_statement(chunk):
+            statement = insert(table_groups_nodes).from_select(['dbnode_id', 'dbgroup_id'],
+                                                               select(chunk.c.id, literal(self.id)))
+            return statement.on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id'])
+
+        return self._modify_nodes_by_pk(pks, get_statement, chunk_size, callback)
+
+    def remove_nodes_by_pk(self, pks, chunk_size=10000, callback=None):
+        """Remove the nodes with the given primary keys from the group, without loading them.
+
+        Each chunk is removed with a single ``DELETE`` statement.
+
+        :param pks: an iterable of node primary keys, or the dictionary representation of a query that projects only
+            the ``id`` of a node.
+        :param chunk_size: the maximum number of primary keys that are removed in a single statement.
+        :param callback: optional callable that is called with the number of processed primary keys after each chunk.
+        :return: the number of nodes that were removed from the group.
+        """
+        from sqlalchemy import select
+
+        from aiida.backends.sqlalchemy.models.group import table_groups_nodes
+
+        def get_statement(chunk):
+            return table_groups_nodes.delete().where(
+                table_groups_nodes.c.dbgroup_id == self.id, table_groups_nodes.c.dbnode_id.in_(select(chunk.c.id))
+            )
+
+        return self._modify_nodes_by_pk(pks, get_statement, chunk_size, callback)
+
+    def _modify_nodes_by_pk(self, pks, get_statement, chunk_size, callback):
+        """Execute a statement that adds or removes nodes of the group for each chunk of the given primary keys.
+
+        Each chunk is executed as a single query, where the statement is a data-modifying common table expression on
+        the common table expression of the primary keys of the chunk. If the primary keys are defined by a query, the
+        chunks are determined in the database, by ordering the primary keys and selecting those beyond the last primary
+        key of the previous chunk, such that the primary keys never need to be loaded in memory.
+
+        :param pks: an iterable of node primary keys, or the dictionary representation of a query that projects only
+            the ``id`` of a node.
+        :param get_statement: callable that returns the data-modifying statement for a common table expression with a
+            single column ``id`` of the primary keys of the chunk.
+        :param chunk_size: the maximum number of primary keys in a chunk.
+        :param callback: optional callable that is called with the number of processed primary keys after each chunk.
+        :return: the total number of rows that were modified by the statements.
+        """
+        from sqlalchemy import select
+
+        from aiida.backends.sqlalchemy.models.node import DbNode
+        from aiida.common.utils import grouper
+
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added or removed')
+
+        if chunk_size < 1:
+            raise ValueError('chunk_size has to be a positive integer')
+
+        modified_count = 0
+
+        if isinstance(pks, dict):
+            column = self._get_projected_pk_column(pks)
+            last_pk = None
+
+            while True:
+                chunk = select(column.label('id')).distinct().order_by(column).limit(chunk_size)
+                if last_pk is not None:
+                    chunk = chunk.where(column > last_pk)
+
+                processed, last_pk, modified = self._execute_chunk(get_statement, chunk.cte('chunk'))
+
+                if not processed:
+                    break
+
+                modified_count += modified
+
+                if callback is not None:
+                    callback(processed)
+        else:
+            for pks_chunk in grouper(chunk_size, pks):
+                chunk = select(DbNode.id).where(DbNode.id.in_(pks_chunk)).cte('chunk')
+                _, _, modified = self._execute_chunk(get_statement, chunk)
+                modified_count += modified
+
+                if callback is not None:
+                    callback(len(pks_chunk))
+
+        return modified_count
+
+    def _execute_chunk(self, get_statement, chunk):
+        """Execute the data-modifying statement for a chunk of primary keys.
+
+        :param get_statement: callable that returns the data-modifying statement for the chunk.
+        :param chunk: common table expression with a single column ``id`` of the primary keys of the chunk.
+        :return: tuple of the number of primary keys in the chunk, the largest primary key and the number of rows that
+            were modified.
+        """
+        from contextlib import nullcontext
+
+        from sqlalchemy import func, select
+
+        from aiida.backends.sqlalchemy.models.group import table_groups_nodes
+
+        modified = get_statement(chunk).returning(table_groups_nodes.c.dbnode_id).cte('modified')
+        statement = select(
+            func.count(chunk.c.id),
+            func.max(chunk.c.id),
+            select(func.count()).select_from(modified).scalar_subquery(),
+        )
+        with (nullcontext() if self.backend.in_transaction else self.backend.transaction()):
+            return self.backend.get_session().execute(statement).one()
+
+    def _get_projected_pk_column(self, query_dict):
+        """Return the column with the node primary keys that are projected by the query of the given dictionary.
+
+        :param query_dict: the dictionary representation of a query that projects only the ``id`` of a node.
+        :return: the column, labelled ``pk``, of a subquery of the query.
+        :raises ValueError: if the query does not project only the ``id`` of a node.
+        """
+        builder = self.backend.query()
+
+        with builder.use_query(query_dict) as query:
+            projected_fields = builder._get_projected_fields()  # pylint: disable=protected-access
+            projections = [(field, index) for fields in projected_fields.values() for field, index, _ in fields]
+
+            if len(projections) != 1 or projections[0][0] != 'id':
+                raise ValueError('the query should project only the `id` of a node')
+
+            column = query.column_descriptions[projections[0][1]]['expr']
+            return query.add_columns(column.label('pk')).subquery().c.pk
+
 
 class SqlaGroupCollection(BackendGroupCollection):
     """The SLQA collection of groups"""
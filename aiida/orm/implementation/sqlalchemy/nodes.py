@@ -9,8 +9,9 @@
 ###########################################################################
 """SqlAlchemy implementation of the `BackendNode` and `BackendNodeCollection` classes."""
 # pylint: disable=no-name-in-module,import-error
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, Dict, Iterable, Tuple
+from typing import Any, Dict, Iterable, Iterator, Sequence, Tuple
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
@@ -18,6 +19,7 @@ from sqlalchemy.orm.exc import NoResultFound
 from aiida.backends.sqlalchemy.models import node as models
 from aiida.common import exceptions
 from aiida.common.lang import type_check
+from aiida.orm.entities import EntityTypes
 from aiida.orm.implementation.utils import clean_value, validate_attribute_extra_key
 
 from . import entities
@@ -327,3 +329,38 @@ class SqlaNodeCollection(BackendNodeCollection):
             session.commit()
         except NoResultFound:
             raise exceptions.NotExistent(f"Node with pk '{pk}' not found") from NoResultFound
+
+    def store_many(self, entries: Sequence[Tuple[SqlaNode, Sequence[Any]]], clean: bool = True) -> None:
+        session = self.backend.get_session()
+
+        with (nullcontext() if self.backend.in_transaction else self.backend.transaction()):
+            for node, _ in entries:
+                if clean:
+                    node.clean_values()
+                session.add(node.dbmodel)
+
+            # A single flush assigns the primary keys of all nodes, which are needed for the link rows. For
+            # postgresql+psycopg2 the inserts are batched, including the ``RETURNING`` of the primary keys.
+            session.flush()
+
+            rows = [{
+                'input_id': source.id,
+                'output_id': node.id,
+                'label': link_label,
+                'type': link_type.value
+            } for node, links in entries for source, link_type, link_label in links]
+            self.backend.bulk_insert(EntityTypes.LINK, rows)
+
+    def iter_hash_matches(self, node_type: str, node_hash: str) -> Iterator[SqlaNode]:
+        session = self.backend.get_session()
+        model = self.ENTITY_CLASS.MODEL_CLASS
+
+        # The `as_string` comparison compiles to `extras ->> '_aiida_hash'`, which uses the expression index on the hash
+        query = session.query(model).filter(
+            model.node_type == node_type,
+            model.extras[models.HASH_EXTRA_KEY].as_string() == node_hash,
+            model.extras[models.VALID_CACHE_EXTRA_KEY].as_boolean().isnot(False),
+        ).order_by(model.id)
+
+        for dbmodel in query.all():
+            yield self.ENTITY_CLASS.from_dbmodel(dbmodel, self.backend)
@@ -11,14 +11,15 @@
 """Sqla query builder implementation"""
 from contextlib import contextmanager
 from functools import partial
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 import uuid
 import warnings
 
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam
 from sqlalchemy import func as sa_func
-from sqlalchemy import not_, or_
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import not_, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.engine import Result
 from sqlalchemy.exc import SAWarning
 from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import aliased
@@ -28,15 +29,22 @@ from sqlalchemy.orm.session import Session
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql.compiler import SQLCompiler, TypeCompiler
 from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList, Cast, ColumnClause, ColumnElement, Label
-from sqlalchemy.sql.expression import case, text
+from sqlalchemy.sql.expression import Select, case, text
 from sqlalchemy.sql.functions import FunctionElement
-from sqlalchemy.types import Boolean, DateTime, Float, Integer, String
+from sqlalchemy.types import Boolean, DateTime, Float, Integer, NullType, String
 
 from aiida.common.exceptions import NotExistent
 from aiida.orm.entities import EntityTypes
 from aiida.orm.implementation.querybuilder import QUERYBUILD_LOGGER, BackendQueryBuilder, QueryDictType
 
 from .joiner import SqlaJoiner
+from .plan_cache import PlanCacheInfo, QueryParameter, QueryPlan, QueryPlanCache, freeze, parametrize
+
+# The maximum number of values of an `in` filter that are passed as separate bind parameters to PostgreSQL
+IN_FILTER_MAX_PARAMETERS = 1000
+
+# The process-wide cache of the built queries, keyed on the shape of the query specification
+PLAN_CACHE = QueryPlanCache()
 
 
 class jsonb_array_length(FunctionElement):  # pylint: disable=abstract-method,invalid-name
@@ -96,6 +104,8 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         # populated on query build and used by "return" methods (`one`, `iterall`, `iterdict`)
         self._requested_projections: int = 0
         self._tag_to_projected_fields: Dict[str, Dict[str, int]] = {}
+        # indices of the projections whose values have to be converted with `to_backend`, i.e. entities and UUIDs
+        self._projections_to_convert: Set[int] = set()
 
         # table -> field -> field
         self.inner_to_outer_schema: Dict[str, Dict[str, str]] = {}
@@ -113,8 +123,10 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             'distinct': False
         }
         self._query: 'Query' = Query([])
-        # Hashing the internal query representation avoids rebuilding a query
-        self._hash: Optional[str] = None
+        # the key in the plan cache, the statement and the values of the parameters of the query, see `_update_query`
+        self._key: Optional[Hashable] = None
+        self._statement: Optional[Select] = None
+        self._parameters: Dict[str, Any] = {}
 
     def set_field_mappings(self):
         """Set conversions between the field names in the database and used by the `QueryBuilder`"""
@@ -191,46 +203,109 @@ class SqlaQueryBuilder(BackendQueryBuilder):
 
         # we discard the first item of the result row,
         # which was what the query was initialised with and not one of the requested projection (see self._build)
-        result = result[1:]
-
-        if len(result) != self._requested_projections:
+        if len(result) - 1 != self._requested_projections:
             raise AssertionError(
-                f'length of query result ({len(result)}) does not match '
+                f'length of query result ({len(result) - 1}) does not match '
                 f'the number of specified projections ({self._requested_projections})'
             )
 
-        return [self.to_backend(r) for r in result]
+        return self._get_row_converter()(result)
 
     def iterall(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[List[Any]]:
         """Return an iterator over all the results of a list of lists."""
-        with self.use_query(data) as query:
+        with self.use_query(data):
 
-            stmt = query.statement.execution_options(yield_per=batch_size)
+            convert_row = self._get_row_converter()
 
-            for resultrow in self.get_session().execute(stmt):
-                # we discard the first item of the result row,
-                # which is what the query was initialised with
-                # and not one of the requested projection (see self._build)
-                resultrow = resultrow[1:]
-                yield [self.to_backend(rowitem) for rowitem in resultrow]
+            for resultrow in self._execute(batch_size):
+                yield convert_row(resultrow)
 
     def iterdict(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, Dict[str, Any]]]:
         """Return an iterator over all the results of a list of dictionaries."""
-        with self.use_query(data) as query:
+        with self.use_query(data):
 
-            stmt = query.statement.execution_options(yield_per=batch_size)
+            projected_fields = self._get_projected_fields().items()
 
-            for row in self.get_session().execute(stmt):
-                # build the yield result
-                yield_result: Dict[str, Dict[str, Any]] = {}
-                for tag, projected_entities_dict in self._tag_to_projected_fields.items():
-                    yield_result[tag] = {}
-                    for attrkey, project_index in projected_entities_dict.items():
-                        field_name = self.get_corresponding_property(
-                            self.get_table_name(self._get_tag_alias(tag)), attrkey, self.inner_to_outer_schema
-                        )
-                        yield_result[tag][field_name] = self.to_backend(row[project_index])
-                yield yield_result
+            for row in self._execute(batch_size):
+                yield {
+                    tag: {
+                        field_name: row[index] if convert is None else convert(row[index])
+                        for field_name, index, convert in fields
+                    } for tag, fields in projected_fields
+                }
+
+    def iter_columns(self, data: QueryDictType, batch_size: Optional[int]) -> Iterable[Dict[str, List[Any]]]:
+        """Return an iterator over batches of the results, where each batch is a dictionary of columns.
+
+        The columns are keyed by ``<tag>.<field>`` and are in the same order as the values in the rows of ``iterall``.
+        """
+        with self.use_query(data):
+
+            projected_fields = [(f'{tag}.{field_name}', index, convert)
+                                for tag, fields in self._get_projected_fields().items()
+                                for field_name, index, convert in fields]
+            projected_fields.sort(key=lambda field: field[1])
+
+            result = self._execute(batch_size)
+            # ``Result.partitions`` falls back to the default size of ``fetchmany`` if ``batch_size`` is ``None``
+            partitions = result.partitions(batch_size) if batch_size is not None else [result.all()]
+
+            for rows in partitions:
+                if not rows:
+                    continue
+                columns = list(zip(*rows))
+                yield {name: self._convert_column(columns[index], convert) for name, index, convert in projected_fields}
+
+    @staticmethod
+    def _convert_column(values: Sequence[Any], convert: Optional[Callable[[Any], Any]]) -> List[Any]:
+        """Return the values of a column as a list, converted with ``convert`` if it is defined."""
+        if convert is None:
+            return list(values)
+        return [convert(value) for value in values]
+
+    def _execute(self, batch_size: Optional[int]) -> Result:
+        """Execute the statement of the last built query, with the values of its parameters, and return the result.
+
+        The values of the parameters are passed when executing the statement, instead of through ``Query.params``,
+        which would require to copy the statement and to regenerate its cache key for the compiled cache.
+
+        :param batch_size: if defined, the number of rows that are fetched at once with a server-side cursor.
+        """
+        statement = self._statement.execution_options(yield_per=batch_size)
+        return self.get_session().execute(statement, self._parameters)
+
+    def _get_row_converter(self) -> Callable[[Sequence[Any]], List[Any]]:
+        """Return a function that converts a result row of the query to the list of the requested projections.
+
+        The function discards the first item of the result row, which is what the query was initialised with and not
+        one of the requested projections (see ``_build``), and only calls ``to_backend`` on the projections of entities
+        and UUIDs, such that the values of all other projections are returned as they are.
+        """
+        if not self._projections_to_convert:
+            return lambda row: list(row[1:])
+
+        converters = [(index, self.to_backend if index in self._projections_to_convert else None)
+                      for index in range(1, self._requested_projections + 1)]
+
+        return lambda row: [row[index] if convert is None else convert(row[index]) for index, convert in converters]
+
+    def _get_projected_fields(self) -> Dict[str, List[Tuple[str, int, Optional[Callable[[Any], Any]]]]]:
+        """Return, for each tag, the list of the field name, index in the result row and converter of its projections.
+
+        The field names are the names used by the `QueryBuilder` and the converter is None if the values of the
+        projection do not have to be converted with ``to_backend``.
+        """
+        projected_fields = {}
+
+        for tag, projected_entities_dict in self._tag_to_projected_fields.items():
+            table_name = self.get_table_name(self._get_tag_alias(tag))
+            projected_fields[tag] = [(
+                self.get_corresponding_property(table_name, attrkey, self.inner_to_outer_schema),
+                index,
+                self.to_backend if index in self._projections_to_convert else None,
+            ) for attrkey, index in projected_entities_dict.items()]
+
+        return projected_fields
 
     @contextmanager
     def use_query(self, data: QueryDictType) -> Iterator[Query]:
@@ -245,23 +320,64 @@ class SqlaQueryBuilder(BackendQueryBuilder):
     def _update_query(self, data: QueryDictType) -> Query:
         """Return the sqlalchemy.orm.Query instance for the current query specification.
 
-        To avoid unnecessary re-builds of the query, the hashed dictionary representation of this instance
-        is compared to the last query returned, which is cached by its hash.
+        To avoid unnecessary re-builds of the query, the values of the filters, the limit and the offset are replaced by
+        bind parameters and the built query is stored in a process-wide cache, keyed on the resulting shape of the
+        query specification. The query of a specification with the same shape is then reused, by only setting the
+        values of its parameters. The bind parameters of the cached query do not have a value, such that the cache
+        does not keep the values of the specification alive, which can be long lists of an ``in`` filter.
         """
-        from aiida.common.hashing import make_hash
+        session = self.get_session()
+        data_parametrized, parameters = parametrize(data, IN_FILTER_MAX_PARAMETERS)
 
-        query_hash = make_hash(data)
+        dialect = session.bind.dialect  # type: ignore[union-attr]
 
-        if self._query and self._hash and self._hash == query_hash:
+        try:
+            key: Optional[Hashable] = (type(self), dialect.name, freeze(data_parametrized))
+        except TypeError:
+            key = None
+
+        if key is not None and key == self._key and parameters == self._parameters:
             # query is up-to-date
             return self._query
 
+        plan = PLAN_CACHE.get(key) if key is not None else None
+
+        if plan is None:
+            self._data = data_parametrized
+            self._build()
+            plan = QueryPlan(
+                self._query.with_session(None),
+                self._query.statement,
+                self._tag_to_alias,
+                self._tag_to_projected_fields,
+                self._projections_to_convert,
+                self._requested_projections,
+            )
+            if key is not None:
+                PLAN_CACHE.set(key, plan)
+
         self._data = data
-        self._build()
-        self._hash = query_hash
+        self._tag_to_alias = plan.tag_to_alias
+        self._tag_to_projected_fields = plan.tag_to_projected_fields
+        self._projections_to_convert = plan.projections_to_convert
+        self._requested_projections = plan.requested_projections
+        self._query = plan.query.with_session(session).params(parameters)
+        self._key = key
+        self._statement = plan.statement
+        self._parameters = parameters
 
         return self._query
 
+    @staticmethod
+    def get_plan_cache_info() -> PlanCacheInfo:
+        """Return the number of hits and misses, and the current and maximum size of the process-wide plan cache."""
+        return PLAN_CACHE.info()
+
+    @staticmethod
+    def clear_plan_cache() -> None:
+        """Remove all the queries from the process-wide plan cache and reset its statistics."""
+        PLAN_CACHE.clear()
+
     def rebuild_aliases(self) -> None:
         """Rebuild the mapping of `tag` -> `alias`"""
         cls_map = {
@@ -347,6 +463,7 @@ class SqlaQueryBuilder(BackendQueryBuilder):
 
         # Reset mapping of tag -> field -> projection_index
         self._tag_to_projected_fields = {}
+        self._projections_to_convert = set()
 
         projection_count = 1
         QUERYBUILD_LOGGER.debug('projections data: %s', self._data['project'])
@@ -397,11 +514,11 @@ class SqlaQueryBuilder(BackendQueryBuilder):
 
         # LIMIT ################################
         if self._data['limit'] is not None:
-            self._query = self._query.limit(self._data['limit'])
+            self._query = self._query.limit(self._get_integer_operand(self._data['limit']))
 
         # OFFSET ################################
         if self._data['offset'] is not None:
-            self._query = self._query.offset(self._data['offset'])
+            self._query = self._query.offset(self._get_integer_operand(self._data['offset']))
 
         # DISTINCT #################################
         if self._data['distinct']:
@@ -476,7 +593,8 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                     property_names.extend(self.modify_expansions(alias, [projectable_entity_name]))
 
                 for property_name in property_names:
-                    self._add_to_projections(alias, property_name, **extraspec)
+                    if self._add_to_projections(alias, property_name, **extraspec):
+                        self._projections_to_convert.add(projection_count)
                     self._tag_to_projected_fields[tag][property_name] = projection_count
                     projection_count += 1
 
@@ -489,14 +607,14 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         cast: Optional[str] = None,
         func: Optional[str] = None,
         **_kw: Any
-    ) -> None:
+    ) -> bool:
         """
         :param alias: An alias for an ormclass
         :param projectable_entity_name:
             User specification of what to project.
             Appends to query's entities what the user wants to project
             (have returned by the query)
-
+        :return: whether the projected values have to be converted with ``to_backend``, i.e. are entities or UUIDs.
         """
         column_name = projectable_entity_name.split('.')[0]
         attr_key = projectable_entity_name.split('.')[1:]
@@ -510,6 +628,7 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                     "I suggest you apply functions on a column, e.g. ('id')\n"
                 )
             self._query = self._query.add_entity(alias)
+            to_convert = True
         else:
             entity_to_project = self._get_projectable_entity(alias, column_name, attr_key, cast=cast)
             if func is None:
@@ -523,6 +642,9 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             else:
                 raise ValueError(f'\nInvalid function specification {func}')
             self._query = self._query.add_columns(entity_to_project)
+            to_convert = isinstance(entity_to_project.type, UUID)
+
+        return to_convert
 
     def _get_projectable_entity(
         self,
@@ -769,6 +891,9 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         """
         # pylint: disable=too-many-arguments, too-many-branches
         expr: Any = None
+        parameter = None
+        if isinstance(value, QueryParameter):
+            parameter, value = value.key, value.value
         if operator.startswith('~'):
             negation = True
             operator = operator.lstrip('~')
@@ -816,23 +941,33 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         if expr is None:
             if is_jsonb:
                 expr = self.get_filter_expr_from_jsonb(
-                    operator, value, attr_key, column=column, column_name=column_name, alias=alias
+                    operator, value, attr_key, column=column, column_name=column_name, alias=alias, parameter=parameter
                 )
             else:
                 if column is None:
                     if (alias is None) and (column_name is None):
                         raise RuntimeError('I need to get the column but do not know the alias and the column name')
                     column = self.get_column(column_name, alias)
-                expr = self.get_filter_expr_from_column(operator, value, column)
+                expr = self.get_filter_expr_from_column(operator, value, column, parameter=parameter)
 
         if negation:
             return not_(expr)
         return expr
 
     def get_filter_expr_from_jsonb(
-        self, operator: str, value, attr_key: List[str], column=None, column_name=None, alias=None
+        self,
+        operator: str,
+        value,
+        attr_key: List[str],
+        column=None,
+        column_name=None,
+        alias=None,
+        parameter: Optional[str] = None
     ):
-        """Return a filter expression"""
+        """Return a filter expression
+
+        :param parameter: if defined, the name of the bind parameter that the value is passed as.
+        """
 
         # pylint: disable=too-many-branches, too-many-arguments, too-many-statements
 
@@ -864,22 +999,23 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             column = self.get_column(column_name, alias)
 
         database_entity = column[tuple(attr_key)]
+        operand = value if parameter is None else bindparam(parameter, type_=NullType())
         expr: Any
         if operator == '==':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity == value), else_=False)
+            expr = case((type_filter, casted_entity == operand), else_=False)
         elif operator == '>':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity > value), else_=False)
+            expr = case((type_filter, casted_entity > operand), else_=False)
         elif operator == '<':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity < value), else_=False)
+            expr = case((type_filter, casted_entity < operand), else_=False)
         elif operator in ('>=', '=>'):
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity >= value), else_=False)
+            expr = case((type_filter, casted_entity >= operand), else_=False)
         elif operator in ('<=', '=<'):
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity <= value), else_=False)
+            expr = case((type_filter, casted_entity <= operand), else_=False)
         elif operator == 'of_type':
             # http://www.postgresql.org/docs/9.5/static/functions-json.html
             #  Possible types are object, array, string, number, boolean, and null.
@@ -889,13 +1025,13 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             expr = jsonb_typeof(database_entity) == value
         elif operator == 'like':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity.like(value)), else_=False)
+            expr = case((type_filter, casted_entity.like(operand)), else_=False)
         elif operator == 'ilike':
             type_filter, casted_entity = cast_according_to_type(database_entity, value)
-            expr = case((type_filter, casted_entity.ilike(value)), else_=False)
+            expr = case((type_filter, casted_entity.ilike(operand)), else_=False)
         elif operator == 'in':
             type_filter, casted_entity = cast_according_to_type(database_entity, value[0])
-            expr = case((type_filter, casted_entity.in_(value)), else_=False)
+            expr = case((type_filter, self.get_filter_expr_in(casted_entity, value, parameter)), else_=False)
         elif operator == 'contains':
             expr = database_entity.cast(JSONB).contains(value)
         elif operator == 'has_key':
@@ -920,13 +1056,15 @@ class SqlaQueryBuilder(BackendQueryBuilder):
             raise ValueError(f'Unknown operator {operator} for filters in JSON field')
         return expr
 
-    @staticmethod
-    def get_filter_expr_from_column(operator: str, value: Any, column) -> BinaryExpression:
+    def get_filter_expr_from_column(
+        self, operator: str, value: Any, column, parameter: Optional[str] = None
+    ) -> BinaryExpression:
         """A method that returns an valid SQLAlchemy expression.
 
         :param operator: The operator provided by the user ('==',  '>', ...)
         :param value: The value to compare with, e.g. (5.0, 'foo', ['a','b'])
         :param column: an instance of sqlalchemy.orm.attributes.InstrumentedAttribute or
+        :param parameter: if defined, the name of the bind parameter that the value is passed as.
 
         """
         # Label is used because it is what is returned for the
@@ -934,28 +1072,65 @@ class SqlaQueryBuilder(BackendQueryBuilder):
         if not isinstance(column, (Cast, InstrumentedAttribute, QueryableAttribute, Label, ColumnClause)):
             raise TypeError(f'column ({type(column)}) {column} is not a valid column')
         database_entity = column
+        operand = value if parameter is None else bindparam(parameter, type_=NullType())
         if operator == '==':
-            expr = database_entity == value
+            expr = database_entity == operand
         elif operator == '>':
-            expr = database_entity > value
+            expr = database_entity > operand
         elif operator == '<':
-            expr = database_entity < value
+            expr = database_entity < operand
         elif operator == '>=':
-            expr = database_entity >= value
+            expr = database_entity >= operand
         elif operator == '<=':
-            expr = database_entity <= value
+            expr = database_entity <= operand
         elif operator == 'like':
             # the like operator expects a string, so we cast to avoid problems
             # with fields like UUID, which don't support the like operator
-            expr = database_entity.cast(String).like(value)
+            expr = database_entity.cast(String).like(operand)
         elif operator == 'ilike':
-            expr = database_entity.ilike(value)
+            expr = database_entity.ilike(operand)
         elif operator == 'in':
-            expr = database_entity.in_(value)
+            expr = self.get_filter_expr_in(database_entity, value, parameter)
         else:
             raise ValueError(f'Unknown operator {operator} for filters on columns')
         return expr
 
+    def get_filter_expr_in(
+        self, database_entity, value: Iterable[Any], parameter: Optional[str] = None
+    ) -> BinaryExpression:
+        """Return the expression of the ``in`` operator, which checks whether the entity is in the given values.
+
+        For PostgreSQL, if there are more than ``IN_FILTER_MAX_PARAMETERS`` values, they are passed as a single array
+        parameter that is unnested in a subquery, instead of as a separate bind parameter for each value. This keeps
+        the size of the SQL statement constant and avoids the cost of planning a query with a very long list of values.
+
+        :param database_entity: the column or expression that should be in the values.
+        :param value: the values to compare with.
+        :param parameter: if defined, the name of the bind parameter that the values are passed as.
+        """
+        values = list(value)
+
+        dialect = self.get_session().bind.dialect  # type: ignore[union-attr]
+
+        if len(values) <= IN_FILTER_MAX_PARAMETERS or dialect.name != 'postgresql':
+            if parameter is None:
+                return database_entity.in_(values)
+            return database_entity.in_(bindparam(parameter, type_=NullType(), expanding=True))
+
+        if parameter is None:
+            array = bindparam(None, values, type_=ARRAY(database_entity.type))
+        else:
+            array = bindparam(parameter, type_=ARRAY(database_entity.type))
+
+        return database_entity.in_(select(sa_func.unnest(array)))
+
+    @staticmethod
+    def _get_integer_operand(value: Any) -> Any:
+        """Return the operand of the limit or offset of the query, which is a bind parameter if it is parametrized."""
+        if isinstance(value, QueryParameter):
+            return bindparam(value.key, type_=Integer)
+        return value
+
     @staticmethod
     def get_table_name(aliased_class: AliasedClass) -> str:
         """ Returns the table name given an Aliased class"""
@@ -1003,6 +1178,9 @@ class SqlaQueryBuilder(BackendQueryBuilder):
                 See https://www.postgresql.org/docs/current/functions-json.html for serialisation specs
                 """
                 from datetime import date, datetime, timedelta
+                if isinstance(type_, ARRAY) and isinstance(value, list):
+                    items = ', '.join(self.render_literal_value(item, type_.item_type) for item in value)
+                    return f'ARRAY[{items}]'
                 try:
                     return super().render_literal_value(value, type_)
                 except NotImplementedError:
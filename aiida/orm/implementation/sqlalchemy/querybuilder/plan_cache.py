@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Process-wide cache of the queries built by the `SqlaQueryBuilder`, keyed on the shape of the query.
+
+Two query specifications have the same shape if they only differ in the values of their filters, limit and offset.
+These values, for the filters with the operators in ``PARAMETRIZED_OPERATORS``, are replaced by instances of
+``QueryParameter`` before the query is built, which are compiled to named bind parameters without a value. A query
+built for one specification can then be reused for any other specification of the same shape, by only passing the
+values of its bind parameters, and the cache does not keep the values of any specification alive.
+"""
+from collections import OrderedDict
+from datetime import date, datetime
+import threading
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm.query import Query
+from sqlalchemy.orm.util import AliasedClass
+from sqlalchemy.sql.expression import Select
+
+# operators whose values are replaced by bind parameters, the negated operators with a `~` or `!` prefix included
+PARAMETRIZED_OPERATORS = ('==', '>', '<', '>=', '<=', '=>', '=<', 'like', 'ilike', 'in')
+
+# types of the values that are replaced by bind parameters, other values are part of the shape of the query
+PARAMETRIZED_TYPES = (bool, int, float, str, datetime, date, UUID)
+
+# logical operators of the filter specification, whose values are lists of filter specifications
+LOGICAL_OPERATORS = ('and', 'or', '~and', '~or', '!and', '!or')
+
+# maximum number of queries that are kept in the cache
+PLAN_CACHE_SIZE = 256
+
+
+class QueryParameter(NamedTuple):
+    """The value of a filter that is replaced by a named bind parameter in the built query.
+
+    The signature is the part of the value that determines how the query is built, i.e. its type, or for the ``in``
+    operator the type of its items and whether the number of items exceeds the threshold to pass them as an array.
+    """
+    key: str
+    value: Any
+    signature: Hashable
+
+
+class QueryPlan(NamedTuple):
+    """A query built by the `SqlaQueryBuilder`, together with the mappings of its projections.
+
+    The query is not bound to a session and the bind parameters of the query and its statement do not have a value,
+    such that the values have to be set with ``Query.params`` or passed when the statement is executed.
+    """
+    query: Query
+    statement: Select
+    tag_to_alias: Dict[str, Optional[AliasedClass]]
+    tag_to_projected_fields: Dict[str, Dict[str, int]]
+    projections_to_convert: Set[int]
+    requested_projections: int
+
+
+class PlanCacheInfo(NamedTuple):
+    """Statistics of the query plan cache, with the same fields as those returned by ``functools.lru_cache``."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class QueryPlanCache:
+    """Least recently used cache of ``QueryPlan`` instances, which keeps track of the number of hits and misses."""
+
+    def __init__(self, maxsize: int = PLAN_CACHE_SIZE):
+        """Construct a new instance.
+
+        :param maxsize: the maximum number of plans that are kept in the cache.
+        """
+        self._maxsize = maxsize
+        self._plans: 'OrderedDict[Hashable, QueryPlan]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[QueryPlan]:
+        """Return the plan for the given key, or None if it is not in the cache, which counts as a miss.
+
+        :param key: the key of the plan, which contains the shape of the query.
+        """
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._plans.move_to_end(key)
+            return plan
+
+    def set(self, key: Hashable, plan: QueryPlan) -> None:
+        """Add the plan for the given key to the cache, evicting the least recently used plan if the cache is full.
+
+        :param key: the key of the plan, which contains the shape of the query.
+        :param plan: the plan to add.
+        """
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            if len(self._plans) > self._maxsize:
+                self._plans.popitem(last=False)
+
+    def info(self) -> PlanCacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return PlanCacheInfo(self._hits, self._misses, self._maxsize, len(self._plans))
+
+    def clear(self) -> None:
+        """Remove all plans from the cache and reset its statistics."""
+        with self._lock:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def parametrize(data: Dict[str, Any], in_threshold: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return a copy of the query specification whose filter values, limit and offset are replaced by parameters.
+
+    :param data: the query specification, as returned by ``QueryBuilder.as_dict``.
+    :param in_threshold: the number of values of an ``in`` filter above which they are passed as an array.
+    :return: tuple of the parametrized query specification and the values of the parameters keyed by their name.
+    """
+    parameters: Dict[str, Any] = {}
+    filters = {tag: _parametrize_filters(spec, parameters, in_threshold) for tag, spec in data['filters'].items()}
+    result = {**data, 'filters': filters}
+
+    for name in ('limit', 'offset'):
+        value = data.get(name)
+        if isinstance(value, int) and not isinstance(value, bool):
+            key = f'qb_{len(parameters)}'
+            parameters[key] = value
+            result[name] = QueryParameter(key, value, int)
+
+    return result, parameters
+
+
+def _parametrize_filters(filter_spec: Any, parameters: Dict[str, Any], in_threshold: int) -> Any:
+    """Return a copy of the filter specification of a vertex whose values are replaced by parameters."""
+    if not isinstance(filter_spec, dict):
+        return filter_spec
+
+    result = {}
+
+    for path_spec, operations in filter_spec.items():
+        if path_spec in LOGICAL_OPERATORS and isinstance(operations, list):
+            result[path_spec] = [_parametrize_filters(spec, parameters, in_threshold) for spec in operations]
+        elif isinstance(operations, dict):
+            result[path_spec] = _parametrize_operations(operations, parameters, in_threshold)
+        else:
+            result[path_spec] = _parametrize_operations({'==': operations}, parameters, in_threshold)
+
+    return result
+
+
+def _parametrize_operations(operations: Dict[str, Any], parameters: Dict[str, Any], in_threshold: int) -> Any:
+    """Return a copy of the operations of a filter whose values are replaced by parameters."""
+    result = {}
+
+    for operator, value in operations.items():
+        name = operator.lstrip('~!')
+        signature = _get_signature(name, value, in_threshold)
+
+        if name in ('and', 'or') and isinstance(value, list):
+            result[operator] = [
+                _parametrize_operations(item, parameters, in_threshold) if isinstance(item, dict) else item
+                for item in value
+            ]
+        elif signature is not None:
+            key = f'qb_{len(parameters)}'
+            parameters[key] = list(value) if name == 'in' else value
+            result[operator] = QueryParameter(key, parameters[key], signature)
+        else:
+            result[operator] = value
+
+    return result
+
+
+def _get_signature(operator: str, value: Any, in_threshold: int) -> Optional[Hashable]:
+    """Return the signature of the value of a filter, or None if it cannot be replaced by a parameter."""
+    if operator not in PARAMETRIZED_OPERATORS:
+        return None
+
+    if operator != 'in':
+        return type(value) if isinstance(value, PARAMETRIZED_TYPES) else None
+
+    if not isinstance(value, (list, tuple, set, frozenset)) or not value:
+        return None
+
+    value_types = {type(item) for item in value}
+    value_type = value_types.pop()
+
+    if value_types or not issubclass(value_type, PARAMETRIZED_TYPES):
+        return None
+
+    return value_type, len(value) > in_threshold
+
+
+def freeze(value: Any) -> Hashable:
+    """Return a hashable representation of the parametrized query specification, which is the shape of the query.
+
+    :param value: the parametrized query specification or part of it.
+    :raises TypeError: if the specification contains a value that is not hashable.
+    """
+    if isinstance(value, QueryParameter):
+        return QueryParameter, value.key, value.signature
+    if isinstance(value, dict):
+        return dict, tuple((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset, frozenset(freeze(item) for item in value)
+    hash(value)
+    return type(value), value
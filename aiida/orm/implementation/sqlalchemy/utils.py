@@ -24,6 +24,9 @@ if TYPE_CHECKING:
 
 IMMUTABLE_MODEL_FIELDS = {'id', 'pk', 'uuid', 'node_type'}
 
+# Key in the ``info`` dictionary of a session that marks it to be in snapshot mode
+SNAPSHOT_SESSION_KEY = 'aiida_snapshot'
+
 
 class ModelWrapper:
     """Wrap an SQLA ORM model and AiiDA storage backend instance together,
@@ -46,6 +49,9 @@ class ModelWrapper:
     - Whenever we set a field of the model instance, unless we know it to be immutable,
       we flush the change to the database.
 
+    If the session is in snapshot mode (see :func:`snapshot`), the fields of saved nodes that are sealed, or that are
+    data nodes and so immutable once stored, are instead served from the loaded row. Use :meth:`refresh` to fetch the
+    latest values of such a model from the database.
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -60,6 +66,7 @@ class ModelWrapper:
         # Have to do it this way because we overwrite __setattr__
         object.__setattr__(self, '_model', model)
         object.__setattr__(self, '_backend', backend)
+        object.__setattr__(self, '_frozen', False)
 
     @property
     def session(self) -> Session:
@@ -78,10 +85,13 @@ class ModelWrapper:
         # Python 3's implementation of copy.copy does not call __init__ on the new object
         # but manually restores attributes instead. Make sure we never get into a recursive
         # loop by protecting the special variables here
-        if item in ('_model', '_backend'):
+        if item in ('_model', '_backend', '_frozen'):
             raise AttributeError()
 
-        if self.is_saved() and self._is_mutable_model_field(item) and not self._in_transaction():
+        if (
+            self.is_saved() and self._is_mutable_model_field(item) and not self._in_transaction() and
+            not self._in_snapshot()
+        ):
             self._ensure_model_uptodate(fields=(item,))
 
         return getattr(self._model, item)
@@ -124,6 +134,41 @@ class ModelWrapper:
             self.session.rollback()
             raise exceptions.IntegrityError(str(exception))
 
+    def refresh(self):
+        """Refresh all fields of the wrapped model instance with the current state of the database.
+
+        This is only needed in snapshot mode, since otherwise mutable fields are refreshed whenever they are retrieved.
+
+        .. note:: If the wrapped model is not actually saved in the database yet, this method is a no-op.
+        """
+        if self.is_saved():
+            self._ensure_model_uptodate()
+
+    def _in_snapshot(self):
+        """Return whether the fields of the model are served from the loaded row because of the snapshot mode.
+
+        This is the case if the session is in snapshot mode and the model is a node that can no longer change, i.e. it
+        is a data node or a sealed process node. The loaded attributes are used to determine whether a node is sealed,
+        which is safe since a node cannot be unsealed, and the result is then stored such that it is not checked again.
+
+        :return: boolean, True if the fields should not be refreshed from the database, False otherwise.
+        """
+        if not self.session.info.get(SNAPSHOT_SESSION_KEY, False):
+            return False
+
+        if not self.__dict__.get('_frozen', False):
+            node_type = getattr(self._model, 'node_type', None)
+
+            if node_type is None:
+                return False
+
+            if not node_type.startswith('data.') and not self._model.attributes.get('sealed', False):
+                return False
+
+            object.__setattr__(self, '_frozen', True)
+
+        return True
+
     def _is_mutable_model_field(self, field):
         """Return whether the field is a mutable field of the model.
 
@@ -169,6 +214,27 @@ class ModelWrapper:
         return self.session.in_nested_transaction()
 
 
+@contextlib.contextmanager
+def snapshot(session):
+    """Context manager that puts the session in snapshot mode and restores the original mode on exit.
+
+    In snapshot mode, retrieving a field of a stored node that can no longer change, i.e. a data node or a sealed
+    process node, does not first refresh it from the database, but returns the value of the row that was loaded. This
+    saves a query for each retrieved field, but means that changes to mutable fields, such as the extras, made through
+    another session, are only seen after calling ``refresh`` on the model or when the session expires its models, e.g.
+    upon a commit.
+
+    :param session: The SQLA session
+    :type session: :class:`sqlalchemy.orm.session.Session`
+    """
+    current_value = session.info.get(SNAPSHOT_SESSION_KEY, False)
+    session.info[SNAPSHOT_SESSION_KEY] = True
+    try:
+        yield session
+    finally:
+        session.info[SNAPSHOT_SESSION_KEY] = current_value
+
+
 @contextlib.contextmanager
 def disable_expire_on_commit(session):
     """Context manager that disables expire_on_commit and restores the original value on exit
@@ -49,9 +49,24 @@ class LogCollection(entities.Collection['Log']):
         :param record: The record created by the logging module
         :return: A stored log instance
         """
-        dbnode_id = record.__dict__.get('dbnode_id', None)
+        fields = self.get_fields_from_record(record)
 
         # Do not store if dbnode_id is not set
+        if fields is None:
+            return None
+
+        return Log(backend=self.backend, **fields)
+
+    @staticmethod
+    def get_fields_from_record(record: logging.LogRecord) -> Optional[Dict[str, Any]]:
+        """Return the fields of the log entry for a record created as by the python logging library
+
+        :param record: The record created by the logging module
+        :return: A dictionary with the fields ``time``, ``loggername``, ``levelname``, ``dbnode_id``, ``message`` and
+            ``metadata`` of the log entry, or ``None`` if the record does not define the ``dbnode_id``.
+        """
+        dbnode_id = record.__dict__.get('dbnode_id', None)
+
         if dbnode_id is None:
             return None
 
@@ -70,15 +85,14 @@ class LogCollection(entities.Collection['Log']):
             if key in metadata:
                 metadata[key] = str(metadata[key])
 
-        return Log(
-            time=timezone.make_aware(datetime.fromtimestamp(record.created)),
-            loggername=record.name,
-            levelname=record.levelname,
-            dbnode_id=dbnode_id,
-            message=message,
-            metadata=metadata,
-            backend=self.backend
-        )
+        return {
+            'time': timezone.make_aware(datetime.fromtimestamp(record.created)),
+            'loggername': record.name,
+            'levelname': record.levelname,
+            'dbnode_id': dbnode_id,
+            'message': message,
+            'metadata': metadata,
+        }
 
     def get_logs_for(self, entity: 'Node', order_by: Optional['OrderByType'] = None) -> List['Log']:
         """Get all the log messages for a given node and optionally sort
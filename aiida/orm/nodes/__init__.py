@@ -18,6 +18,7 @@ from .data import *
 from .node import *
 from .process import *
 from .repository import *
+from .store import *
 
 __all__ = (
     'ArrayData',
@@ -61,6 +62,7 @@ __all__ = (
     'find_bandgap',
     'has_pycifrw',
     'pycifrw_from_cif',
+    'store_many',
     'to_aiida_type',
 )
 
@@ -10,6 +10,8 @@
 """
 AiiDA ORM data class storing (numpy) arrays
 """
+import io
+
 from ..data import Data
 
 __all__ = ('ArrayData',)
@@ -99,25 +101,34 @@ class ArrayData(Data):
         for name in self.get_arraynames():
             yield (name, self.get_array(name))
 
-    def get_array(self, name):
+    def get_array(self, name, mmap_mode=None):
         """
         Return an array stored in the node
 
         :param name: The name of the array to return.
+        :param mmap_mode: If not ``None``, the array is memory-mapped with the given mode, which can be ``'r'``
+            (read-only) or ``'c'`` (copy-on-write), instead of being read into memory. If the repository does not
+            store the array as a separate file, for example when it has been packed, the array is streamed into memory
+            instead. Memory-mapped arrays are not cached.
         """
         import numpy
 
+        if mmap_mode not in (None, 'r', 'c'):
+            raise ValueError(f'invalid mmap_mode `{mmap_mode}`: the array can only be mapped with mode `r` or `c`')
+
         def get_array_from_file(self, name):
             """Return the array stored in a .npy file"""
-            filename = f'{name}.npy'
-
-            if filename not in self.list_object_names():
-                raise KeyError(f'Array with name `{name}` not found in ArrayData<{self.pk}>')
+            filename = self._get_array_filename(name)
 
             # Open a handle in binary read mode as the arrays are written as binary files as well
             with self.open(filename, mode='rb') as handle:
                 return numpy.load(handle, allow_pickle=False)  # pylint: disable=unexpected-keyword-arg
 
+        if mmap_mode is not None and name not in self._cached_arrays:
+            filepath = self._get_array_filepath(name)
+            if filepath is not None:
+                return numpy.load(filepath, mmap_mode=mmap_mode, allow_pickle=False)
+
         # Return with proper caching if the node is stored, otherwise always re-read from disk
         if not self.is_stored:
             return get_array_from_file(self, name)
@@ -127,6 +138,54 @@ class ArrayData(Data):
 
         return self._cached_arrays[name]
 
+    def get_array_slice(self, name, index):
+        """
+        Return a slice of an array stored in the node, without reading the whole array into memory.
+
+        Only the requested part of the array is read, if the array is memory-mapped or if the first element of the
+        index is an integer or slice, that selects along the first axis of an array stored in C order. Otherwise, the
+        whole array is read and then indexed.
+
+        :param name: The name of the array.
+        :param index: Any index supported by numpy arrays, e.g. ``5``, ``slice(10, 20)`` or ``(slice(0, 10), 2)``.
+        :return: A new array with the selected elements, which does not reference the array stored in the node.
+        """
+        import numpy
+
+        if name in self._cached_arrays:
+            return numpy.array(self._cached_arrays[name][index])
+
+        filepath = self._get_array_filepath(name)
+
+        if filepath is not None:
+            return numpy.array(numpy.load(filepath, mmap_mode='r', allow_pickle=False)[index])
+
+        with self.open(self._get_array_filename(name), mode='rb') as handle:
+            return _read_array_slice(handle, index)
+
+    def _get_array_filename(self, name):
+        """Return the filename of an array in the repository of the node.
+
+        :param name: The name of the array.
+        :raises KeyError: if the node does not contain an array with the given name.
+        """
+        filename = f'{name}.npy'
+
+        if filename not in self.list_object_names():
+            raise KeyError(f'Array with name `{name}` not found in ArrayData<{self.pk}>')
+
+        return filename
+
+    def _get_array_filepath(self, name):
+        """Return the path of the file on the local file system that contains the array, if it can be memory-mapped.
+
+        :param name: The name of the array.
+        :return: the absolute filepath or ``None`` if the repository does not store the array as a separate file.
+        :raises KeyError: if the node does not contain an array with the given name.
+        """
+        key = self._repository.get_file(self._get_array_filename(name)).key
+        return self._repository.backend.get_object_filepath(key)
+
     def clear_internal_cache(self):
         """
         Clear the internal memory cache where the arrays are stored after being
@@ -148,7 +207,6 @@ class ArrayData(Data):
         :param array: The numpy array to store.
         """
         import re
-        import tempfile
 
         import numpy
 
@@ -162,16 +220,8 @@ class ArrayData(Data):
                 'it can only contain digits, letters and underscores'
             )
 
-        # Write the array to a temporary file, and then add it to the repository of the node
-        with tempfile.NamedTemporaryFile() as handle:
-            numpy.save(handle, array, allow_pickle=False)
-
-            # Flush and rewind the handle, otherwise the command to store it in the repo will write an empty file
-            handle.flush()
-            handle.seek(0)
-
-            # Write the numpy array to the repository, keeping the byte representation
-            self.put_object_from_filelike(handle, f'{name}.npy')
+        # Stream the array in the ``.npy`` format directly into the repository, without writing it to a temporary file
+        self.put_object_from_filelike(_get_array_stream(array), f'{name}.npy')
 
         # Store the array name and shape for querying purposes
         self.set_attribute(f'{self.array_prefix}{name}', list(array.shape))
@@ -193,3 +243,109 @@ class ArrayData(Data):
                 f'Mismatch of files and properties for ArrayData node (pk= {self.pk}): {files} vs. {properties}'
             )
         super()._validate()
+
+
+class _ArrayStream(io.RawIOBase):
+    """Read-only byte stream over a sequence of buffers, which are not copied."""
+
+    def __init__(self, buffers):
+        super().__init__()
+        self._buffers = [memoryview(buffer).cast('B') for buffer in buffers]
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        target = memoryview(buffer).cast('B')
+
+        while self._buffers and not self._buffers[0]:
+            self._buffers.pop(0)
+
+        if not self._buffers:
+            return 0
+
+        size = min(len(target), len(self._buffers[0]))
+        target[:size] = self._buffers[0][:size]
+        self._buffers[0] = self._buffers[0][size:]
+
+        return size
+
+
+def _get_array_stream(array):
+    """Return a byte stream of an array in the ``.npy`` format, as written by ``numpy.save``.
+
+    The stream reads directly from the memory of the array, unless the array is not contiguous, in which case a
+    contiguous copy is made first.
+
+    :param array: The numpy array.
+    :raises ValueError: if the array contains Python objects, which cannot be saved without pickling.
+    """
+    import numpy
+    from numpy.lib import format as npy_format
+
+    if array.dtype.hasobject:
+        raise ValueError('Object arrays cannot be saved when allow_pickle=False')
+
+    header = io.BytesIO()
+    header_data = npy_format.header_data_from_array_1_0(array)
+
+    try:
+        npy_format.write_array_header_1_0(header, header_data)
+    except ValueError:
+        header = io.BytesIO()
+        npy_format.write_array_header_2_0(header, header_data)
+
+    # Arrays that are only contiguous in Fortran order are written in that order, all other arrays in C order
+    data = array.T if header_data['fortran_order'] else numpy.ascontiguousarray(array)
+
+    return io.BufferedReader(_ArrayStream([header.getvalue(), data.reshape(-1).view(numpy.uint8)]))
+
+
+def _read_array_slice(handle, index):
+    """Read a slice of an array from a byte stream in the ``.npy`` format, reading only the selected rows if possible.
+
+    :param handle: A seekable byte stream positioned at the start of the ``.npy`` content.
+    :param index: Any index supported by numpy arrays.
+    :return: A new array with the selected elements.
+    """
+    import numpy
+    from numpy.lib import format as npy_format
+
+    rows_index, rest = (index[0], index[1:]) if isinstance(index, tuple) and index else (index, ())
+    version = npy_format.read_magic(handle)
+
+    readers = {(1, 0): npy_format.read_array_header_1_0, (2, 0): npy_format.read_array_header_2_0}
+    shape, fortran_order, dtype = readers[version](handle) if version in readers else (None, None, None)
+
+    if (
+        not shape or fortran_order or dtype.hasobject or isinstance(rows_index, (bool, numpy.bool_)) or
+        not isinstance(rows_index, (int, numpy.integer, slice))
+    ):
+        handle.seek(0)
+        return numpy.array(numpy.load(handle, allow_pickle=False)[index])
+
+    offset = handle.tell()
+    row_shape = shape[1:]
+    row_size = int(numpy.prod(row_shape, dtype=numpy.int64)) * dtype.itemsize
+
+    def read_rows(start, stop):
+        handle.seek(offset + start * row_size)
+        content = handle.read((stop - start) * row_size)
+        return numpy.frombuffer(content, dtype=dtype).reshape((stop - start,) + row_shape)
+
+    if isinstance(rows_index, slice):
+        selected = range(*rows_index.indices(shape[0]))
+        if not selected:
+            result = numpy.empty((0,) + row_shape, dtype=dtype)
+        else:
+            start = min(selected[0], selected[-1])
+            rows = read_rows(start, max(selected[0], selected[-1]) + 1)
+            result = rows[selected[0] - start::selected.step]
+        return numpy.array(result[(slice(None),) + rest])
+
+    row = int(rows_index)
+    if not -shape[0] <= row < shape[0]:
+        raise IndexError(f'index {row} is out of bounds for axis 0 with size {shape[0]}')
+    row %= shape[0]
+
+    return numpy.array(read_rows(row, row + 1)[(0,) + rest])
@@ -700,6 +700,57 @@ def atom_kinds_to_html(atom_kind):
     return html_formula
 
 
+def _get_kind_ase_tags(kinds):
+    """
+    Return the ASE tag of each kind, which distinguishes kinds of the same element, or None if no tag should be set.
+
+    :param kinds: the list of kinds from the StructureData object.
+    :return: a list with the tag of each kind.
+    """
+    from collections import defaultdict
+
+    # I create the list of tags
+    tag_list = []
+    used_tags = defaultdict(list)
+    for k in kinds:
+        # Skip alloys and vacancies
+        if k.is_alloy or k.has_vacancies:
+            tag_list.append(None)
+        # If the kind name is equal to the specie name,
+        # then no tag should be set
+        elif str(k.name) == str(k.symbols[0]):
+            tag_list.append(None)
+        else:
+            # Name is not the specie name
+            if k.name.startswith(k.symbols[0]):
+                try:
+                    new_tag = int(k.name[len(k.symbols[0])])
+                    tag_list.append(new_tag)
+                    used_tags[k.symbols[0]].append(new_tag)
+                    continue
+                except ValueError:
+                    pass
+            tag_list.append(k.symbols[0])  # I use a string as a placeholder
+
+    for i, _ in enumerate(tag_list):
+        # If it is a string, it is the name of the element,
+        # and I have to generate a new integer for this element
+        # and replace tag_list[i] with this new integer
+        if isinstance(tag_list[i], str):
+            # I get a list of used tags for this element
+            existing_tags = used_tags[tag_list[i]]
+            if existing_tags:
+                new_tag = max(existing_tags) + 1
+            else:  # empty list
+                new_tag = 1
+            # I store it also as a used tag!
+            used_tags[tag_list[i]].append(new_tag)
+            # I update the tag
+            tag_list[i] = new_tag
+
+    return tag_list
+
+
 class StructureData(Data):
     """
     This class contains the information about a given structure, i.e. a
@@ -961,16 +1012,18 @@ class StructureData(Data):
                 raise ValidationError(f"Kind with name '{count}' appears {counts[count]} times instead of only one")
 
         try:
-            # This will try to create the sites objects
-            sites = self.sites
+            # This validates the sites all at once, without creating the sites objects
+            site_kind_names = set(self._get_site_arrays()[2])
         except ValueError as exc:
             raise ValidationError(f'Unable to validate the sites: {exc}')
 
-        for site in sites:
-            if site.kind_name not in [k.name for k in kinds]:
-                raise ValidationError(f'A site has kind {site.kind_name}, but no specie with that name exists')
+        kind_names = set(k.name for k in kinds)
+
+        unknown_kind_names = site_kind_names - kind_names
+        if unknown_kind_names:
+            raise ValidationError(f'A site has kind {unknown_kind_names.pop()}, but no specie with that name exists')
 
-        kinds_without_sites = (set(k.name for k in kinds) - set(s.kind_name for s in sites))
+        kinds_without_sites = kind_names - site_kind_names
         if kinds_without_sites:
             raise ValidationError(
                 f'The following kinds are defined, but there are no sites with that kind: {list(kinds_without_sites)}'
@@ -1246,7 +1299,7 @@ class StructureData(Data):
 
         :return: a list of strings
         """
-        return [this_site.kind_name for this_site in self.sites]
+        return list(self._get_site_arrays()[2])
 
     def get_composition(self):
         """
@@ -1258,9 +1311,14 @@ class StructureData(Data):
 
         :returns: a dictionary with the composition
         """
-        symbols_list = [self.get_kind(s.kind_name).get_symbols_string() for s in self.sites]
-        composition = {symbol: symbols_list.count(symbol) for symbol in set(symbols_list)}
-        return composition
+        from collections import Counter
+
+        composition = Counter()
+
+        for kind_name, count in Counter(self.get_site_kindnames()).items():
+            composition[self.get_kind(kind_name).get_symbols_string()] += count
+
+        return dict(composition)
 
     def get_ase(self):
         """
@@ -1346,7 +1404,7 @@ class StructureData(Data):
 
         new_kind = Kind(kind=kind)  # So we make a copy
 
-        if kind.name in [k.name for k in self.kinds]:
+        if kind.name in self._get_kind_indices():
             raise ValueError(f'A kind with the same name ({kind.name}) already exists.')
 
         # If here, no exceptions have been raised, so I add the site.
@@ -1372,10 +1430,8 @@ class StructureData(Data):
 
         new_site = Site(site=site)  # So we make a copy
 
-        if site.kind_name not in [kind.name for kind in self.kinds]:
-            raise ValueError(
-                f"No kind with name '{site.kind_name}', available kinds are: {[kind.name for kind in self.kinds]}"
-            )
+        if site.kind_name not in self._get_kind_indices():
+            raise ValueError(f"No kind with name '{site.kind_name}', available kinds are: {self.get_kind_names()}")
 
         # If here, no exceptions have been raised, so I add the site.
         self.attributes.setdefault('sites', []).append(new_site.get_raw())
@@ -1431,7 +1487,7 @@ class StructureData(Data):
             kind = Kind(**kwargs)
 
         # I look for identical species only if the name is not specified
-        _kinds = self.kinds
+        _kinds = self._get_kinds()
 
         if 'name' not in kwargs:
             # If the kind is identical to an existing one, I use the existing
@@ -1463,11 +1519,10 @@ class StructureData(Data):
                     counter += 1
                 self.append_kind(kind)
         else:  # 'name' was specified
-            old_kind = None
-            for existing_kind in _kinds:
-                if existing_kind.name == kwargs['name']:
-                    old_kind = existing_kind
-                    break
+            try:
+                old_kind = _kinds[self._get_kind_indices()[kwargs['name']]]
+            except KeyError:
+                old_kind = None
             if old_kind is None:
                 self.append_kind(kind)
             else:
@@ -1516,22 +1571,14 @@ class StructureData(Data):
         """
         Returns a list of sites.
         """
-        try:
-            raw_sites = self.get_attribute('sites')
-        except AttributeError:
-            raw_sites = []
-        return [Site(raw=i) for i in raw_sites]
+        return [Site(raw=i) for i in self._get_raw_attribute('sites')]
 
     @property
     def kinds(self):
         """
         Returns a list of kinds.
         """
-        try:
-            raw_kinds = self.get_attribute('kinds')
-        except AttributeError:
-            raw_kinds = []
-        return [Kind(raw=i) for i in raw_kinds]
+        return [Kind(raw=i) for i in self._get_raw_attribute('kinds')]
 
     def get_kind(self, kind_name):
         """
@@ -1570,7 +1617,151 @@ class StructureData(Data):
 
         :return: a list of strings.
         """
-        return [k.name for k in self.kinds]
+        return [raw_kind['name'] for raw_kind in self._get_raw_attribute('kinds')]
+
+    def get_site_arrays(self):
+        """
+        Return the sites of the structure in a columnar representation, which is much faster than the ``sites``
+        property for structures with many sites.
+
+        :return: a tuple of a float array with shape (number of sites, 3) with the positions of the sites, and an
+            integer array with the index of the kind of each site in the list of ``get_kind_names``. The arrays are
+            read-only.
+        :raise ValueError: if the sites are invalid, or if a site has a kind that does not exist.
+        """
+        import numpy
+
+        positions, kind_indices, kind_names = self._get_site_arrays()
+
+        if kind_indices is None:
+            kind_index = self._get_kind_indices()
+            try:
+                kind_indices = numpy.array([kind_index[name] for name in kind_names], dtype=int)
+            except KeyError as exc:
+                raise ValueError(f'A site has kind {exc.args[0]}, but no specie with that name exists')
+            kind_indices.setflags(write=False)
+            if self.is_stored:
+                self._site_arrays_cache = (positions, kind_indices, kind_names)  # pylint: disable=attribute-defined-outside-init
+
+        return positions, kind_indices
+
+    def set_site_arrays(self, positions, kind_indices):
+        """
+        Replace all the sites of the structure with sites in a columnar representation.
+
+        This is equivalent to, but much faster than, calling ``clear_sites`` and appending a ``Site`` for each row,
+        and results in the exact same attributes.
+
+        :param positions: array-like of shape (number of sites, 3) with the positions of the sites in angstrom.
+        :param kind_indices: array-like with the index of the kind of each site in the list of ``get_kind_names``.
+        :raises aiida.common.ModificationNotAllowed: if object is stored already
+        :raise ValueError: if the positions or kind indices are invalid.
+        """
+        import numpy
+
+        from aiida.common.exceptions import ModificationNotAllowed
+
+        if self.is_stored:
+            raise ModificationNotAllowed('The StructureData object cannot be modified, it has already been stored')
+
+        try:
+            positions = numpy.array(positions, dtype=float).reshape(-1, 3)
+        except (ValueError, TypeError):
+            raise ValueError('Wrong format for positions, must be an array of shape (number of sites, 3).')
+
+        kind_indices = numpy.asarray(kind_indices)
+        kind_names = self.get_kind_names()
+
+        if kind_indices.shape != (len(positions),) or (len(kind_indices) and kind_indices.dtype.kind not in 'iu'):
+            raise ValueError('The kind indices must be an array of integers, one for each position.')
+
+        if len(kind_indices) and (kind_indices.min() < 0 or kind_indices.max() >= len(kind_names)):
+            raise ValueError(f'The kind indices must refer to the available kinds: {kind_names}')
+
+        self.set_attribute(
+            'sites', [{
+                'position': tuple(position),
+                'kind_name': kind_names[index]
+            } for position, index in zip(positions.tolist(), kind_indices.tolist())]
+        )
+
+    def _get_raw_attribute(self, key):
+        """
+        Return the value of a list attribute, without the deep copy that ``get_attribute`` makes for stored nodes.
+
+        The returned value should therefore never be modified.
+
+        :param key: name of the attribute
+        :return: the value of the attribute, or an empty list if the attribute does not exist
+        """
+        try:
+            return self.backend_entity.get_attribute(key)
+        except AttributeError:
+            return []
+
+    def _get_kinds(self):
+        """
+        Return the list of kinds, which is cached as long as the kinds are not changed.
+
+        The cache is keyed on a copy of the raw kinds, such that any change to the kinds is noticed, also when they are
+        modified in place. Comparing the raw kinds is much cheaper than building the ``Kind`` objects.
+
+        .. note:: The returned kinds are shared and should therefore not be modified.
+        """
+        raw_kinds = self._get_raw_attribute('kinds')
+        cache = getattr(self, '_kinds_list_cache', None)
+
+        if cache is None or cache[0] != raw_kinds:
+            cache = (copy.deepcopy(raw_kinds), [Kind(raw=i) for i in raw_kinds])
+            self._kinds_list_cache = cache  # pylint: disable=attribute-defined-outside-init
+
+        return cache[1]
+
+    def _get_kind_indices(self):
+        """
+        Return a mapping of the kind names onto their index in the list of kinds.
+
+        The mapping is built from the raw kinds on every call, which takes linear time in the number of kinds, but
+        avoids a mapping that is out of date when the kinds are changed through the attributes. The lookups in the
+        returned mapping take constant time, so it should be reused when looking up many sites at once.
+        """
+        return {raw_kind['name']: index for index, raw_kind in enumerate(self._get_raw_attribute('kinds'))}
+
+    def _get_site_arrays(self):
+        """
+        Return the positions and the kind names of the sites, validating them all at once.
+
+        For stored nodes, the result is cached, including the kind indices once computed by ``get_site_arrays``.
+
+        :return: a tuple of the read-only positions array, the kind indices array or ``None`` if not yet computed, and
+            the list of kind names of the sites.
+        :raise ValueError: if the sites are invalid.
+        """
+        import numpy
+
+        if self.is_stored and getattr(self, '_site_arrays_cache', None) is not None:
+            return self._site_arrays_cache
+
+        raw_sites = self._get_raw_attribute('sites')
+
+        try:
+            kind_names = [str(raw_site['kind_name']) for raw_site in raw_sites]
+            positions = numpy.array([raw_site['position'] for raw_site in raw_sites], dtype=float).reshape(-1, 3)
+        except KeyError as exc:
+            raise ValueError(f'Invalid raw object, it does not contain any key {exc.args[0]}')
+        except (TypeError, ValueError):
+            raise ValueError('Invalid raw object, it is not a dictionary with a position of three float numbers')
+
+        if len(positions) != len(kind_names):
+            raise ValueError('Wrong format for position, must be a list of three float numbers.')
+
+        positions.setflags(write=False)
+        result = (positions, None, kind_names)
+
+        if self.is_stored:
+            self._site_arrays_cache = result  # pylint: disable=attribute-defined-outside-init
+
+        return result
 
     @property
     def cell(self):
@@ -1638,7 +1829,8 @@ class StructureData(Data):
         else:
 
             # test consistency of th enew input
-            n_sites = len(self.sites)
+            sites = self.sites
+            n_sites = len(sites)
             if n_sites != len(new_positions) and conserve_particle:
                 raise ValueError('the new positions should be as many as the previous structure.')
 
@@ -1653,7 +1845,7 @@ class StructureData(Data):
                     raise ValueError(f'Expecting a list of lists of length 3. found instead {len(this_pos)}')
 
                 # now append this Site to the new_site list.
-                new_site = Site(site=self.sites[i])  # So we make a copy
+                new_site = Site(site=sites[i])  # So we make a copy
                 new_site.position = copy.deepcopy(this_pos)
                 new_sites.append(new_site)
 
@@ -1808,12 +2000,31 @@ class StructureData(Data):
         :return: an ase.Atoms object
         """
         import ase
+        import numpy
+
+        positions, kind_indices = self.get_site_arrays()
+        kinds = self._get_kinds()
+        tags = _get_kind_ase_tags(kinds)
 
-        asecell = ase.Atoms(cell=self.cell, pbc=self.pbc)
-        _kinds = self.kinds
+        for index in set(kind_indices.tolist()):
+            if kinds[index].is_alloy or kinds[index].has_vacancies:
+                raise ValueError('Cannot convert to ASE if the kind represents an alloy or it has vacancies.')
+
+        symbols = [kind.symbols[0] for kind in kinds]
+        masses = numpy.array([kind.mass or 0. for kind in kinds])
+        tags = numpy.array([tag or 0 for tag in tags], dtype=int)
+
+        asecell = ase.Atoms(
+            symbols=[symbols[index] for index in kind_indices.tolist()],
+            positions=positions,
+            masses=masses[kind_indices],
+            cell=self.cell,
+            pbc=self.pbc,
+        )
+
+        if tags[kind_indices].any():
+            asecell.set_tags(tags[kind_indices])
 
-        for site in self.sites:
-            asecell.append(site.get_ase(kinds=_kinds))
         return asecell
 
     def _get_object_pymatgen(self, **kwargs):
@@ -1865,30 +2076,30 @@ class StructureData(Data):
         species = []
         additional_kwargs = {}
 
+        positions, kind_indices = self.get_site_arrays()
+        kinds = self._get_kinds()
+        used_kinds = [kinds[index] for index in sorted(set(kind_indices.tolist()))]
+
         if (kwargs.pop('add_spin', False) and any(n.endswith('1') or n.endswith('2') for n in self.get_kind_names())):
             # case when spins are defined -> no partial occupancy allowed
             from pymatgen.core.periodic_table import Specie
             oxidation_state = 0  # now I always set the oxidation_state to zero
-            for site in self.sites:
-                kind = self.get_kind(site.kind_name)
+            for kind in used_kinds:
                 if len(kind.symbols) != 1 or (len(kind.weights) != 1 or sum(kind.weights) < 1.):
                     raise ValueError('Cannot set partial occupancies and spins at the same time')
-                species.append(
-                    Specie(
-                        kind.symbols[0],
-                        oxidation_state,
-                        properties={'spin': -1 if kind.name.endswith('1') else 1 if kind.name.endswith('2') else 0}
-                    )
-                )
+            kind_species = [
+                Specie(
+                    kind.symbols[0],
+                    oxidation_state,
+                    properties={'spin': -1 if kind.name.endswith('1') else 1 if kind.name.endswith('2') else 0}
+                ) for kind in kinds
+            ]
+            species = [kind_species[index] for index in kind_indices.tolist()]
         else:
             # case when no spin are defined
-            for site in self.sites:
-                kind = self.get_kind(site.kind_name)
-                species.append(dict(zip(kind.symbols, kind.weights)))
-            if any(
-                create_automatic_kind_name(self.get_kind(name).symbols,
-                                           self.get_kind(name).weights) != name for name in self.get_site_kindnames()
-            ):
+            kind_species = [dict(zip(kind.symbols, kind.weights)) for kind in kinds]
+            species = [kind_species[index] for index in kind_indices.tolist()]
+            if any(create_automatic_kind_name(kind.symbols, kind.weights) != kind.name for kind in used_kinds):
                 # add "kind_name" as a properties to each site, whenever
                 # the kind_name cannot be automatically obtained from the symbols
                 additional_kwargs['site_properties'] = {'kind_name': self.get_site_kindnames()}
@@ -1896,7 +2107,6 @@ class StructureData(Data):
         if kwargs:
             raise ValueError(f'Unrecognized parameters passed to pymatgen converter: {kwargs.keys()}')
 
-        positions = [list(x.position) for x in self.sites]
         return Structure(self.cell, species, positions, coords_are_cartesian=True, **additional_kwargs)
 
     def _get_object_pymatgen_molecule(self, **kwargs):
@@ -1917,12 +2127,10 @@ class StructureData(Data):
         if kwargs:
             raise ValueError(f'Unrecognized parameters passed to pymatgen converter: {kwargs.keys()}')
 
-        species = []
-        for site in self.sites:
-            kind = self.get_kind(site.kind_name)
-            species.append(dict(zip(kind.symbols, kind.weights)))
+        positions, kind_indices = self.get_site_arrays()
+        kind_species = [dict(zip(kind.symbols, kind.weights)) for kind in self._get_kinds()]
+        species = [kind_species[index] for index in kind_indices.tolist()]
 
-        positions = [list(site.position) for site in self.sites]
         return Molecule(species, positions)
 
 
@@ -2383,49 +2591,9 @@ class Site:
         .. note:: If any site is an alloy or has vacancies, a ValueError
             is raised (from the site.get_ase() routine).
         """
-        # pylint: disable=too-many-branches
-        from collections import defaultdict
-
         import ase
 
-        # I create the list of tags
-        tag_list = []
-        used_tags = defaultdict(list)
-        for k in kinds:
-            # Skip alloys and vacancies
-            if k.is_alloy or k.has_vacancies:
-                tag_list.append(None)
-            # If the kind name is equal to the specie name,
-            # then no tag should be set
-            elif str(k.name) == str(k.symbols[0]):
-                tag_list.append(None)
-            else:
-                # Name is not the specie name
-                if k.name.startswith(k.symbols[0]):
-                    try:
-                        new_tag = int(k.name[len(k.symbols[0])])
-                        tag_list.append(new_tag)
-                        used_tags[k.symbols[0]].append(new_tag)
-                        continue
-                    except ValueError:
-                        pass
-                tag_list.append(k.symbols[0])  # I use a string as a placeholder
-
-        for i, _ in enumerate(tag_list):
-            # If it is a string, it is the name of the element,
-            # and I have to generate a new integer for this element
-            # and replace tag_list[i] with this new integer
-            if isinstance(tag_list[i], str):
-                # I get a list of used tags for this element
-                existing_tags = used_tags[tag_list[i]]
-                if existing_tags:
-                    new_tag = max(existing_tags) + 1
-                else:  # empty list
-                    new_tag = 1
-                # I store it also as a used tag!
-                used_tags[tag_list[i]].append(new_tag)
-                # I update the tag
-                tag_list[i] = new_tag
+        tag_list = _get_kind_ase_tags(kinds)
 
         found = False
         for kind_candidate, tag_candidate in zip(kinds, tag_list):
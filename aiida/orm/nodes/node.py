@@ -148,6 +148,7 @@ class Node(
 
     # These are to be initialized in the `initialization` method
     _incoming_cache: Optional[List[LinkTriple]] = None
+    _links_snapshots: Optional[Dict[Tuple[LinkType, bool], Any]] = None
 
     Collection = NodeCollection
 
@@ -216,6 +217,9 @@ class Node(
         # A cache of incoming links represented as a list of LinkTriples instances
         self._incoming_cache = []
 
+        # Snapshots of the stored links used by the `NodeLinksManager`, see `aiida.orm.utils.managers`
+        self._links_snapshots = {}
+
     def _validate(self) -> bool:
         """Validate information stored in Node object.
 
@@ -689,26 +693,10 @@ class Node(
 
         :parameter with_transaction: if False, do not use a transaction because the caller will already have opened one.
         """
-        from aiida.manage.caching import get_use_cache
-
         if not self.is_stored:
 
-            # Call `validate_storability` directly and not in `_validate` in case sub class forgets to call the super.
-            self.validate_storability()
-            self._validate()
-
-            # Verify that parents are already stored. Raises if this is not the case.
-            self.verify_are_parents_stored()
-
-            # Determine whether the cache should be used for the process type of this node.
-            use_cache = get_use_cache(identifier=self.process_type)
-
-            # Clean the values on the backend node *before* computing the hash in `_get_same_node`. This will allow
-            # us to set `clean=False` if we are storing normally, since the values will already have been cleaned
-            self._backend_entity.clean_values()
-
             # Retrieve the cached node.
-            same_node = self._get_same_node() if use_cache else None
+            same_node = self._prepare_store()
 
             if same_node is not None:
                 self._store_from_cache(same_node, with_transaction=with_transaction)
@@ -721,12 +709,31 @@ class Node(
 
         return self
 
-    def _store(self, with_transaction: bool = True, clean: bool = True) -> 'Node':
-        """Store the node in the database while saving its attributes and repository directory.
+    def _prepare_store(self) -> Optional['Node']:
+        """Validate and clean the node before storing it and return the node to cache from, if any.
 
-        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
-        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        :return: a stored node from which this node can be cached, or ``None`` if caching is disabled or none exists.
         """
+        from aiida.manage.caching import get_use_cache
+
+        # Call `validate_storability` directly and not in `_validate` in case sub class forgets to call the super.
+        self.validate_storability()
+        self._validate()
+
+        # Verify that parents are already stored. Raises if this is not the case.
+        self.verify_are_parents_stored()
+
+        # Determine whether the cache should be used for the process type of this node.
+        use_cache = get_use_cache(identifier=self.process_type)
+
+        # Clean the values on the backend node *before* computing the hash in `_get_same_node`. This will allow
+        # us to set `clean=False` if we are storing normally, since the values will already have been cleaned
+        self._backend_entity.clean_values()
+
+        return self._get_same_node() if use_cache else None
+
+    def _store_repository(self) -> None:
+        """Move the contents of the repository to the permanent repository and update the repository metadata."""
         from aiida.repository import Repository
         from aiida.repository.backend import SandboxRepositoryBackend
 
@@ -740,6 +747,14 @@ class Node(
 
         self.repository_metadata = self._repository.serialize()
 
+    def _store(self, with_transaction: bool = True, clean: bool = True) -> 'Node':
+        """Store the node in the database while saving its attributes and repository directory.
+
+        :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+        :param clean: boolean, if True, will clean the attributes and extras before attempting to store
+        """
+        self._store_repository()
+
         links = self._incoming_cache
         self._backend_entity.store(links, with_transaction=with_transaction, clean=clean)
 
@@ -913,10 +928,12 @@ class Node(
         if not node_hash or not self._cachable:
             return iter(())
 
-        builder = QueryBuilder(backend=self.backend)
-        builder.append(self.__class__, filters={f'extras.{self._HASH_EXTRA_KEY}': node_hash}, subclassing=False)
+        # The backend already excludes nodes that are explicitly marked as invalid caches, but the ``is_valid_cache``
+        # hook can be overridden by subclasses with additional logic, so it is still checked for each candidate.
+        matches = self.backend.nodes.iter_hash_matches(self.node_type, node_hash)
+        nodes = (self.__class__.from_backend_entity(match) for match in matches)
 
-        return (node for node in builder.all(flat=True) if node.is_valid_cache)  # type: ignore[misc,union-attr]
+        return (node for node in nodes if node.is_valid_cache)
 
     @property
     def is_valid_cache(self) -> bool:
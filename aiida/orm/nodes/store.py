@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Utilities to store multiple nodes at once."""
+# pylint: disable=protected-access
+from contextlib import nullcontext
+from typing import Dict, Iterable, List, Set
+
+from .node import Node
+
+__all__ = ('store_many',)
+
+
+def store_many(nodes: Iterable[Node], with_transaction: bool = True) -> List[Node]:
+    """Store the given nodes, together with all unstored nodes of their cached incoming links.
+
+    The result is identical to calling :meth:`~aiida.orm.Node.store` on each node, with the parents stored before their
+    children, but the database rows of the nodes and links are inserted in bulk. Nodes are stored in batches, where a
+    new batch is started whenever a node has an incoming link from a node in the current batch, since the hash of a node
+    and the validation of its links may require its parents to already be stored.
+
+    Nodes whose class overrides the ``store`` method and nodes that are stored from the cache are stored individually.
+
+    :param nodes: the nodes to store, nodes that are already stored are ignored.
+    :param with_transaction: if False, do not use a transaction because the caller will already have opened one.
+    :return: the list of nodes that were stored, sorted such that parents come before their children.
+    """
+    ordered = _sort_unstored_nodes(nodes)
+
+    if not ordered:
+        return []
+
+    backend = ordered[0].backend
+    batch: List[Node] = []
+    batch_uuids: Set[str] = set()
+    grouped: List[Node] = []
+
+    with (backend.transaction() if with_transaction else nullcontext()):
+        for node in ordered:
+
+            if any(link_triple.node.uuid in batch_uuids for link_triple in node._incoming_cache):
+                _store_batch(batch)
+                grouped.extend(batch)
+                batch = []
+                batch_uuids = set()
+
+            if type(node).store is not Node.store:
+                node.store(with_transaction=False)
+                continue
+
+            same_node = node._prepare_store()
+
+            if same_node is not None:
+                node._store_from_cache(same_node, with_transaction=False)
+                grouped.append(node)
+            else:
+                batch.append(node)
+                batch_uuids.add(node.uuid)
+
+        _store_batch(batch)
+        grouped.extend(batch)
+
+        autogroup = backend.autogroup
+        grouped = [node for node in grouped if autogroup.is_to_be_grouped(node)]
+        if grouped:
+            autogroup.get_or_create_group().add_nodes(grouped)
+
+    return ordered
+
+
+def _store_batch(batch: List[Node]) -> None:
+    """Store a batch of validated and cleaned nodes whose parents are all stored.
+
+    :param batch: the nodes to store.
+    """
+    if not batch:
+        return
+
+    for node in batch:
+        node._store_repository()
+        # The hash can be computed before the node is stored, since all its parents are already stored, which saves a
+        # separate update of the extras for each node after it has been stored.
+        node.backend_entity.set_extra(node._HASH_EXTRA_KEY, node._get_hash())
+
+    batch[0].backend.nodes.store_many([(node.backend_entity, node._incoming_cache) for node in batch], clean=False)
+
+    for node in batch:
+        node._incoming_cache = []
+
+
+def _sort_unstored_nodes(nodes: Iterable[Node]) -> List[Node]:
+    """Return the unstored nodes and the unstored sources of their cached incoming links, with parents before children.
+
+    :param nodes: the nodes to sort.
+    :return: the sorted list of unstored nodes, without duplicates.
+    :raises ValueError: if the cached incoming links of the nodes contain a cycle.
+    """
+    ordered: Dict[str, Node] = {}
+    visiting: Set[str] = set()
+
+    def visit(node: Node) -> None:
+        if node.is_stored or node.uuid in ordered:
+            return
+        if node.uuid in visiting:
+            raise ValueError(f'the cached incoming links of {node} contain a cycle')
+        visiting.add(node.uuid)
+        for link_triple in node._incoming_cache:
+            visit(link_triple.node)
+        visiting.remove(node.uuid)
+        ordered[node.uuid] = node
+
+    for node in nodes:
+        visit(node)
+
+    return list(ordered.values())
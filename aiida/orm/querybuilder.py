@@ -40,6 +40,7 @@ import warnings
 
 from aiida.manage import get_manager
 from aiida.orm.entities import EntityTypes
+from aiida.orm.implementation.entities import BackendEntity
 from aiida.orm.implementation.querybuilder import (
     GROUP_ENTITY_TYPE_PREFIX,
     BackendQueryBuilder,
@@ -52,6 +53,9 @@ from . import authinfos, comments, computers, convert, entities, groups, logs, n
 
 if TYPE_CHECKING:
     # pylint: disable=ungrouped-imports
+    import numpy
+    import pyarrow
+
     from aiida.engine import Process
     from aiida.orm.implementation import Backend
 
@@ -1028,7 +1032,8 @@ class QueryBuilder:
         for item in self._impl.iterall(self.as_dict(), batch_size):
             # Convert to AiiDA frontend entities (if they are such)
             for i, item_entry in enumerate(item):
-                item[i] = self._get_aiida_entity_res(item_entry)
+                if isinstance(item_entry, BackendEntity):
+                    item[i] = convert.get_orm_entity(item_entry)
 
             yield item
 
@@ -1046,11 +1051,88 @@ class QueryBuilder:
         :returns: a generator of dictionaries
         """
         for item in self._impl.iterdict(self.as_dict(), batch_size):
-            for key, value in item.items():
-                item[key] = self._get_aiida_entity_res(value)
+            # Convert to AiiDA frontend entities (if they are such)
+            for projections in item.values():
+                for key, value in projections.items():
+                    if isinstance(value, BackendEntity):
+                        projections[key] = convert.get_orm_entity(value)
 
             yield item
 
+    def iter_columns(self, batch_size: Optional[int] = 100) -> Iterable[Dict[str, List[Any]]]:
+        """Return a generator over the results in batches of columns, instead of rows.
+
+        Each batch is a dictionary with a list of values for each projection, keyed by ``<tag>.<field>``, in the same
+        order as the values in the rows returned by :meth:`.iterall`. The same caveats as for :meth:`.iterall` apply.
+
+        :param batch_size: the number of rows in each batch, except for the last one which can be smaller. If ``None``,
+            all the rows are returned in a single batch.
+        :returns: a generator of dictionaries of columns.
+        """
+        for columns in self._impl.iter_columns(self.as_dict(), batch_size):
+            for name, column in columns.items():
+                # Convert to AiiDA frontend entities (if they are such)
+                if any(isinstance(value, BackendEntity) for value in column):
+                    columns[name] = [
+                        convert.get_orm_entity(value) if isinstance(value, BackendEntity) else value for value in column
+                    ]
+
+            yield columns
+
+    def _get_columns(self, batch_size: Optional[int]) -> Dict[str, List[Any]]:
+        """Return the complete columns of the results, keyed by ``<tag>.<field>``, as returned by :meth:`.iter_columns`.
+
+        :param batch_size: the number of rows to fetch from the backend at once.
+        """
+        result: Dict[str, List[Any]] = {}
+
+        for columns in self.iter_columns(batch_size=batch_size):
+            for name, column in columns.items():
+                result.setdefault(name, []).extend(column)
+
+        return result
+
+    def to_numpy(self, batch_size: Optional[int] = 1000) -> Dict[str, 'numpy.ndarray']:
+        """Executes the full query and return the results as a numpy array for each projection.
+
+        The projections are keyed by ``<tag>.<field>``. This is intended for projections of fields, whose values are
+        converted with ``numpy.array``, unless that fails, e.g. for lists of different lengths, in which case an
+        array of objects is returned.
+
+        :param batch_size: the number of rows to fetch from the backend at once.
+        :returns: dictionary with a numpy array for each projection.
+        """
+        import numpy
+
+        arrays = {}
+
+        for name, column in self._get_columns(batch_size).items():
+            try:
+                arrays[name] = numpy.array(column)
+            except ValueError:
+                arrays[name] = numpy.empty(len(column), dtype=object)
+                for index, value in enumerate(column):
+                    arrays[name][index] = value
+
+        return arrays
+
+    def to_arrow(self, batch_size: Optional[int] = 1000) -> 'pyarrow.Table':
+        """Executes the full query and return the results as an Apache Arrow table with a column for each projection.
+
+        The columns are named ``<tag>.<field>``. This requires the ``pyarrow`` package to be installed and only works
+        for projections of fields, since entities cannot be converted to Arrow arrays.
+
+        :param batch_size: the number of rows to fetch from the backend at once.
+        :returns: instance of ``pyarrow.Table``.
+        :raises ImportError: if the ``pyarrow`` package is not installed.
+        """
+        try:
+            import pyarrow
+        except ImportError as exc:
+            raise ImportError('the `pyarrow` package is required to return the results as an Arrow table') from exc
+
+        return pyarrow.table(self._get_columns(batch_size))
+
     def all(self, batch_size: Optional[int] = None, flat: bool = False) -> Union[List[List[Any]], List[Any]]:
         """Executes the full query with the order of the rows as returned by the backend.
 
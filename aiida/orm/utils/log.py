@@ -9,10 +9,61 @@
 ###########################################################################
 """Module for logging methods/classes that need the ORM."""
 import logging
+import queue
+import threading
+import time
+import traceback
+from typing import Optional
+
+LOGGER = logging.getLogger(__name__)
+
+# Markers put on the queue of the ``DBLogHandler`` to have the background thread write its batch right away
+_FLUSH = object()
+_STOP = object()
 
 
 class DBLogHandler(logging.Handler):
-    """A custom db log handler for writing logs tot he database"""
+    """A custom db log handler for writing logs tot he database
+
+    By default, each record is stored synchronously when it is emitted. If ``batch_size`` is non-zero, the records are
+    put on a queue instead, which is written to the database in bulk by a background thread, as soon as ``batch_size``
+    records are waiting or the oldest waiting record is ``flush_interval`` seconds old. If the queue holds
+    ``max_queue_size`` records, records below the ``WARNING`` level are dropped, while other records block the caller
+    for up to ``block_timeout`` seconds before they are dropped. The queue is written completely by ``flush`` and
+    ``close``, the latter of which is called when the logging is reconfigured or the interpreter exits.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        level=logging.NOTSET,
+        batch_size: int = 0,
+        flush_interval: float = 1.,
+        max_queue_size: int = 10000,
+        block_timeout: float = 1.
+    ):
+        """Construct a new handler.
+
+        :param level: the level of the handler.
+        :param batch_size: maximum number of records written at once, or 0 to write each record when it is emitted.
+        :param flush_interval: maximum time in seconds that a record waits on the queue before it is written.
+        :param max_queue_size: maximum number of records that can wait on the queue.
+        :param block_timeout: maximum time in seconds that a record at or above the ``WARNING`` level waits for space on
+            a full queue, before it is dropped.
+        """
+        super().__init__(level)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._block_timeout = block_timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of records that were dropped because the queue was full."""
+        return self._dropped
 
     def emit(self, record):
         if record.exc_info:
@@ -26,18 +77,182 @@ class DBLogHandler(logging.Handler):
         try:
             try:
                 backend = record.__dict__.pop('backend')
-                orm.Log.objects(backend).create_entry_from_record(record)
             except KeyError:
                 # The backend should be set. We silently absorb this error
-                pass
+                return
+
+            if not self._batch_size:
+                orm.Log.objects(backend).create_entry_from_record(record)
+                return
+
+            # The fields are determined right away, since the record can refer to objects that may still change
+            fields = orm.Log.objects(backend).get_fields_from_record(record)
+
+            if fields is not None:
+                self._enqueue(backend, fields, record.levelno)
 
         except Exception:  # pylint: disable=broad-except
             # To avoid loops with the error handler, I just print.
             # Hopefully, though, this should not happen!
-            import traceback
             traceback.print_exc()
             raise
 
+    def flush(self):
+        """Write all the records waiting on the queue to the database."""
+        if not self._batch_size:
+            return
+
+        thread = self._get_thread()
+
+        if thread is not None:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+        else:
+            self._write(self._get_waiting())
+
+    def close(self):
+        """Write all the records waiting on the queue to the database and stop the background thread."""
+        self._stopped.set()
+        thread = self._get_thread()
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+        self._write(self._get_waiting())
+        super().close()
+
+    def _get_thread(self) -> Optional[threading.Thread]:
+        """Return the background thread if it is running and is not the current thread, otherwise ``None``."""
+        with self._thread_lock:
+            thread = self._thread
+
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            return thread
+
+        return None
+
+    def _enqueue(self, backend, fields, levelno):
+        """Put the fields of a log entry on the queue, dropping it if the queue remains full.
+
+        :param backend: the backend in which to store the log entry.
+        :param fields: the fields of the log entry.
+        :param levelno: the level of the record, which determines whether the caller may block on a full queue.
+        """
+        if self._stopped.is_set():
+            self._write([(backend, fields)])
+            return
+
+        self._start_thread()
+
+        try:
+            if levelno >= logging.WARNING:
+                self._queue.put((backend, fields), timeout=self._block_timeout)
+            else:
+                self._queue.put_nowait((backend, fields))
+        except queue.Full:
+            self._dropped += 1
+
+    def _start_thread(self):
+        """Start the background thread that writes the queue, if it is not running, for example after a fork."""
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='DBLogHandler', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Write the records on the queue in batches until the handler is closed."""
+        backends = {}
+        reported = 0
+        stopped = False
+
+        try:
+            while not stopped:
+                batch, received, stopped = self._get_batch()
+
+                try:
+                    self._write(batch)
+                finally:
+                    for _ in range(received):
+                        self._queue.task_done()
+
+                for backend, _ in batch:
+                    backends[id(backend)] = backend
+
+                if self._dropped > reported:
+                    LOGGER.warning('DBLogHandler dropped %d log records, queue full', self._dropped - reported)
+                    reported = self._dropped
+        finally:
+            for backend in backends.values():
+                backend.release_thread_session()
+
+    def _get_batch(self):
+        """Wait for the next batch of records on the queue.
+
+        The batch is complete once it holds ``batch_size`` records, its first record has waited for ``flush_interval``
+        seconds, or when the handler is flushed or closed.
+
+        :return: tuple of the entries in the batch, the number of items taken from the queue and whether the handler is
+            closed.
+        """
+        batch = []
+        item = self._queue.get()
+        received = 1
+        deadline = time.monotonic() + self._flush_interval
+
+        while item is not _FLUSH and item is not _STOP:
+            batch.append(item)
+
+            if len(batch) >= self._batch_size:
+                break
+
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+
+            received += 1
+
+        return batch, received, item is _STOP
+
+    def _get_waiting(self):
+        """Return all the records that are waiting on the queue, removing them from the queue."""
+        waiting = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return waiting
+            if item is not _FLUSH and item is not _STOP:
+                waiting.append(item)
+            self._queue.task_done()
+
+    @staticmethod
+    def _write(entries):
+        """Write log entries to the database in bulk, grouped by backend.
+
+        If the bulk insert fails, for example because one of the entries cannot be serialized, the entries are written
+        one by one, such that only the invalid entries are lost.
+
+        :param entries: list of tuples of the backend and the fields of a log entry.
+        """
+        from aiida.common.utils import get_new_uuid
+        from aiida.orm.entities import EntityTypes
+
+        backends = {}
+        for backend, fields in entries:
+            backends.setdefault(id(backend), (backend, []))[1].append(fields)
+
+        for backend, rows in backends.values():
+            try:
+                backend.bulk_insert(EntityTypes.LOG, [dict(fields, uuid=get_new_uuid()) for fields in rows])
+            except Exception:  # pylint: disable=broad-except
+                for fields in rows:
+                    try:
+                        backend.bulk_insert(EntityTypes.LOG, [dict(fields, uuid=get_new_uuid())])
+                    except Exception:  # pylint: disable=broad-except
+                        LOGGER.exception('failed to write a log entry to the database')
+
 
 def get_dblogger_extra(node):
     """Return the additional information necessary to attach any log records to the given node instance.
@@ -12,6 +12,7 @@ Contain utility classes for "managers", i.e., classes that allow
 to access members of other classes via TAB-completable attributes
 (e.g. the class underlying `calculation.inputs` to allow to do `calculation.inputs.<label>`).
 """
+from collections.abc import Mapping
 import warnings
 
 from aiida.common import AttributeDict
@@ -53,8 +54,15 @@ class NodeLinksManager:
     def _construct_attribute_dict(self, incoming):
         """Construct an attribute dict from all links of the node, recreating nested namespaces from flat link labels.
 
+        For a stored node, the leaves of the attribute dict are the primary keys of the linked nodes, which are taken
+        from the snapshot of the links of the node, see :meth:`_get_snapshot`, and can be loaded with
+        :meth:`_load_nodes`. For an unstored node, the leaves are the linked nodes themselves.
+
         :param incoming: if True, inspect incoming links, otherwise inspect outgoing links.
         """
+        if self._node.is_stored:
+            return self._get_snapshot().nested
+
         if incoming:
             links = self._node.get_incoming(link_type=self._link_type)
         else:
@@ -62,6 +70,75 @@ class NodeLinksManager:
 
         return AttributeDict(links.nested())
 
+    def _get_snapshot(self):
+        """Return the snapshot of the links of the stored node, creating it if it does not exist or is outdated.
+
+        The snapshot is stored on the node instance, such that it is shared by all managers of the node. A snapshot
+        that was created once no more links could be added to the node, i.e. the node was sealed or the links are the
+        inputs of a process node, is kept as long as the node instance. Otherwise, the snapshot is validated against
+        the number of links in the database, which is considerably cheaper than loading the links again.
+
+        :return: the snapshot of the links.
+        """
+        # This import is here to avoid circular imports
+        from aiida.orm import ProcessNode
+
+        key = (self._link_type, self._incoming)
+        snapshot = self._node._links_snapshots.get(key)  # pylint: disable=protected-access
+
+        if snapshot is not None and snapshot.permanent:
+            return snapshot
+
+        # Determine whether the snapshot is permanent before querying for the links, since they could still be added
+        # in the meantime, if the node is not yet sealed.
+        permanent = getattr(self._node, 'is_sealed', False) or (self._incoming and isinstance(self._node, ProcessNode))
+
+        if snapshot is not None and snapshot.count == self._get_links_count():
+            snapshot.permanent = permanent
+            return snapshot
+
+        snapshot = _LinksSnapshot(self._get_links_builder().all(), self._link_type, permanent)
+        self._node._links_snapshots[key] = snapshot  # pylint: disable=protected-access
+
+        return snapshot
+
+    def _get_links_builder(self):
+        """Return a query builder for the links of the node, projecting the ``id`` of the node and label of the link.
+
+        :return: instance of :class:`~aiida.orm.QueryBuilder`.
+        """
+        # This import is here to avoid circular imports
+        from aiida.orm import Node, QueryBuilder
+
+        builder = QueryBuilder(backend=self._node.backend)
+        builder.append(Node, filters={'id': self._node.pk}, tag='main')
+        builder.append(
+            Node,
+            project=['id'],
+            edge_project=['label'],
+            edge_filters={'type': self._link_type.value},
+            **{'with_outgoing' if self._incoming else 'with_incoming': 'main'}
+        )
+        return builder
+
+    def _get_links_count(self):
+        """Return the number of links of the node stored in the database."""
+        return self._get_links_builder().count()
+
+    def _load_nodes(self, value):
+        """Replace the primary keys in the value returned by the attribute dict with the linked nodes.
+
+        The nodes are loaded with a single query and kept in the snapshot of the links, such that each node is loaded
+        at most once.
+
+        :param value: a primary key, or nested mapping of primary keys, as returned by the attribute dict.
+        :return: the node, or an attribute dict of nodes.
+        """
+        if not self._node.is_stored:
+            return value
+
+        return self._get_snapshot().load(value, self._node.backend)
+
     def _get_keys(self):
         """Return the valid link labels, used e.g. to make getattr() work"""
         attribute_dict = self._construct_attribute_dict(self._incoming)
@@ -108,7 +185,7 @@ class NodeLinksManager:
                 )  # pylint: disable=no-member
                 namespaces = label.split(self._namespace_separator)
                 try:
-                    return functools.reduce(lambda d, namespace: d.get(namespace), namespaces, attribute_dict)
+                    node = functools.reduce(lambda d, namespace: d.get(namespace), namespaces, attribute_dict)
                 except TypeError as exc:
                     # This can be raised if part of the `namespaces` correspond to an actual leaf node, but is treated
                     # like a namespace
@@ -117,9 +194,10 @@ class NodeLinksManager:
                     # This will be raised if any of the intermediate namespaces don't exist, and so the label node does
                     # not exist.
                     raise NotExistent from exc
+                return self._load_nodes(node)
             raise NotExistent from exception
 
-        return node
+        return self._load_nodes(node)
 
     def __dir__(self):
         """
@@ -194,6 +272,53 @@ class NodeLinksManager:
         return f'<{self.__class__.__name__}: {str(self)}>'
 
 
+class _LinksSnapshot:
+    """Snapshot of the links of a given type of a stored node, with the linked nodes being loaded lazily."""
+
+    def __init__(self, links, link_type, permanent):
+        """Construct a new snapshot.
+
+        :param links: list of tuples of the primary key of the linked node and the link label.
+        :param link_type: the link type of the links.
+        :param permanent: whether the snapshot remains valid, because no more links can be added.
+        """
+        from aiida.orm.utils.links import LinkManager, LinkTriple
+
+        self.count = len(links)
+        self.permanent = permanent
+        self.nested = AttributeDict(LinkManager([LinkTriple(pk, link_type, label) for pk, label in links]).nested())
+        self._nodes = {}
+
+    def load(self, value, backend):
+        """Replace the primary keys in the given value with the corresponding nodes, loading those not yet loaded.
+
+        :param value: a primary key, or nested mapping of primary keys.
+        :param backend: the backend from which to load the nodes.
+        :return: the node, or an attribute dict of nodes.
+        """
+        from aiida.orm import Node, QueryBuilder
+
+        def get_pks(value):
+            if isinstance(value, Mapping):
+                for item in value.values():
+                    yield from get_pks(item)
+            elif value is not None:
+                yield value
+
+        def replace(value):
+            if isinstance(value, Mapping):
+                return AttributeDict({key: replace(item) for key, item in value.items()})
+            return self._nodes.get(value, value)
+
+        missing = [pk for pk in get_pks(value) if pk not in self._nodes]
+
+        if missing:
+            builder = QueryBuilder(backend=backend).append(Node, filters={'id': {'in': missing}}, project=['id', '*'])
+            self._nodes.update(builder.all())
+
+        return replace(value)
+
+
 class AttributeManager:
     """
     An object used internally to return the attributes as a dictionary.
@@ -10,6 +10,12 @@
 """Module to manage loading entrypoints."""
 import enum
 import functools
+import hashlib
+import json
+import os
+import pathlib
+import sys
+import tempfile
 import traceback
 from typing import Any, List, Optional, Sequence, Set, Tuple
 from warnings import warn
@@ -28,10 +34,124 @@ __all__ = ('load_entry_point', 'load_entry_point_from_string', 'parse_entry_poin
 ENTRY_POINT_GROUP_PREFIX = 'aiida.'
 ENTRY_POINT_STRING_SEPARATOR = ':'
 
+ENTRY_POINTS_CACHE_VERSION = 1
+
 
 @functools.lru_cache(maxsize=1)
-def eps():
-    return _eps()
+def eps() -> EntryPoints:
+    """Return all the entry points that are registered in the environment.
+
+    Scanning the metadata of all installed distributions is slow if many distributions are installed. Therefore, the
+    entry points are stored in a cache file in the configuration directory, see :func:`get_entry_points_cache_filepath`,
+    which is used as long as the fingerprint of the environment, see :func:`get_environment_fingerprint`, is unchanged.
+    """
+    filepath = get_entry_points_cache_filepath()
+    fingerprint = get_environment_fingerprint()
+
+    if filepath is not None:
+        try:
+            with filepath.open('r', encoding='utf8') as handle:
+                cache = json.load(handle)
+            if cache['version'] == ENTRY_POINTS_CACHE_VERSION and cache['fingerprint'] == fingerprint:
+                return EntryPoints(EntryPoint(name, value, group) for name, value, group in cache['entry_points'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    all_eps = _eps()
+    entry_points = EntryPoints(
+        entry_point for group in sorted(all_eps.groups) for entry_point in all_eps.select(group=group)
+    )
+
+    if filepath is not None:
+        cache = {
+            'version': ENTRY_POINTS_CACHE_VERSION,
+            'fingerprint': fingerprint,
+            'entry_points': [[ep.name, ep.value, ep.group] for ep in entry_points],
+        }
+        try:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=filepath.parent, delete=False, encoding='utf8') as handle:
+                json.dump(cache, handle)
+            os.replace(handle.name, filepath)
+        except OSError:
+            pass
+
+    return entry_points
+
+
+def get_entry_points_cache_filepath() -> Optional[pathlib.Path]:
+    """Return the path of the entry points cache file for the current python environment.
+
+    The cache file is stored in the ``cache`` directory of the configuration directory, with a name that is unique for
+    the python executable and its ``sys.path``, such that python environments that share the configuration directory do
+    not invalidate each other's cache.
+
+    :return: the path of the cache file, or None if the cache is disabled, which is the case if the
+        ``AIIDA_DISABLE_ENTRY_POINTS_CACHE`` environment variable is set.
+    """
+    if os.environ.get('AIIDA_DISABLE_ENTRY_POINTS_CACHE'):
+        return None
+
+    from aiida.manage.configuration import settings
+
+    environment = hashlib.sha256(json.dumps([sys.executable, sys.path]).encode('utf8')).hexdigest()[:16]
+
+    return pathlib.Path(settings.AIIDA_CONFIG_FOLDER) / 'cache' / f'entry_points-{environment}.json'
+
+
+def get_environment_fingerprint() -> str:
+    """Return a fingerprint of the distributions installed in the python environment.
+
+    The fingerprint is computed from the modification times of the site directories on ``sys.path`` and of the
+    ``entry_points.txt`` of the distribution metadata directories they contain. These change whenever a distribution is
+    installed, updated or removed, but can be determined without reading the metadata of the distributions.
+
+    Other directories on ``sys.path`` are not considered, notably the current working directory, which can be large and
+    would make the fingerprint depend on the directory in which the interpreter is started. Changes to the metadata of
+    distributions in such directories, for example of legacy development installs, therefore do not invalidate the
+    entry points cache, which can be disabled with the ``AIIDA_DISABLE_ENTRY_POINTS_CACHE`` environment variable.
+
+    :return: the hexadecimal digest of the fingerprint.
+    """
+    hasher = hashlib.sha256()
+
+    for path in get_site_directories():
+        try:
+            entries = sorted(os.scandir(path), key=lambda entry: entry.name)
+            hasher.update(f'{path}:{os.stat(path).st_mtime_ns};'.encode('utf8'))
+        except OSError:
+            continue
+
+        for entry in entries:
+            if entry.name.endswith(('.dist-info', '.egg-info')):
+                mtimes = []
+                for filepath in (entry.path, os.path.join(entry.path, 'entry_points.txt')):
+                    try:
+                        mtimes.append(os.stat(filepath).st_mtime_ns)
+                    except OSError:
+                        mtimes.append(None)
+                hasher.update(f'{entry.name}:{mtimes};'.encode('utf8'))
+
+    return hasher.hexdigest()
+
+
+def get_site_directories() -> List[str]:
+    """Return the absolute directories on ``sys.path`` in which distributions are installed.
+
+    These are the site directories of the interpreter and of the user, and any other ``site-packages`` or
+    ``dist-packages`` directory, for example those added through a ``.pth`` file or the ``PYTHONPATH``.
+
+    :return: the directories in the order in which they appear on ``sys.path``.
+    """
+    import site
+
+    site_directories = set(getattr(site, 'getsitepackages', list)())
+    site_directories.add(site.getusersitepackages())
+
+    return [
+        path for path in sys.path if os.path.isabs(path) and
+        (path in site_directories or os.path.basename(path) in ('site-packages', 'dist-packages'))
+    ]
 
 
 class EntryPointFormat(enum.Enum):
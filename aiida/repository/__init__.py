@@ -14,9 +14,12 @@
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .backend import *
-from .common import *
-from .repository import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .backend import *
+    from .common import *
+    from .repository import *
 
 __all__ = (
     'AbstractRepositoryBackend',
@@ -27,4 +30,32 @@ __all__ = (
     'SandboxRepositoryBackend',
 )
 
+_LAZY_IMPORTS = {
+    'AbstractRepositoryBackend': 'backend',
+    'DiskObjectStoreRepositoryBackend': 'backend',
+    'File': 'common',
+    'FileType': 'common',
+    'Repository': 'repository',
+    'SandboxRepositoryBackend': 'backend',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
@@ -6,9 +6,12 @@
 # yapf: disable
 # pylint: disable=wildcard-import
 
-from .abstract import *
-from .disk_object_store import *
-from .sandbox import *
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abstract import *
+    from .disk_object_store import *
+    from .sandbox import *
 
 __all__ = (
     'AbstractRepositoryBackend',
@@ -16,4 +19,29 @@ __all__ = (
     'SandboxRepositoryBackend',
 )
 
+_LAZY_IMPORTS = {
+    'AbstractRepositoryBackend': 'abstract',
+    'DiskObjectStoreRepositoryBackend': 'disk_object_store',
+    'SandboxRepositoryBackend': 'sandbox',
+}
+
+
+def __getattr__(name):
+    """Import the names of ``__all__`` and the submodules of this package when they are first accessed."""
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Return the names of the module, including those of ``__all__`` that have not been imported yet."""
+    return sorted(set(globals()) | set(__all__))
+
+
 # yapf: enable
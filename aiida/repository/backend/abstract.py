@@ -28,6 +28,10 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
     and persistent. Persisting the key or mapping it onto a virtual file hierarchy is again up to the client upstream.
     """
 
+    # The interface includes optional methods with default implementations, which backends can override to provide
+    # faster access to the objects, so it necessarily has more public methods than the default limit.
+    # pylint: disable=too-many-public-methods
+
     @property
     @abc.abstractmethod
     def uuid(self) -> Optional[str]:
@@ -167,6 +171,19 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         with self.open(key) as handle:  # pylint: disable=not-context-manager
             return handle.read()
 
+    def get_object_filepath(self, key: str) -> Optional[pathlib.Path]:
+        """Return the path of a file on the local file system whose content is exactly that of the object.
+
+        This allows clients to memory-map the content of an object. The file should only be read and never be modified.
+        Backends that do not store objects as separate files, always return ``None``, which is the default.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :return: the absolute filepath or ``None`` if the object is not stored as a separate file.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        if not self.has_object(key):
+            raise FileNotFoundError(f'object with key `{key}` does not exist.')
+
     @abc.abstractmethod
     def iter_object_streams(self, keys: List[str]) -> Iterator[Tuple[str, BinaryIO]]:
         """Return an iterator over the (read-only) byte streams of objects identified by key.
@@ -193,6 +210,19 @@ class AbstractRepositoryBackend(metaclass=abc.ABCMeta):
         with self.open(key) as handle:  # pylint: disable=not-context-manager
             return chunked_file_hash(handle, hashlib.sha256)
 
+    def get_object_hashes(self, keys: List[str]) -> List[str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        The default implementation calls ``get_object_hash`` for each key. Implementations for which the hashes can be
+        determined more efficiently in bulk should override this method.
+
+        :param keys: list of fully qualified identifiers for the objects within the repository.
+        :return: list of hashes, in the same order as the keys provided.
+        :raise FileNotFoundError: if any of the files does not exist.
+        :raise OSError: if a file could not be opened.
+        """
+        return [self.get_object_hash(key) for key in keys]
+
     @abc.abstractmethod
     def delete_objects(self, keys: List[str]) -> None:
         """Delete the objects from the repository.
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 """Implementation of the ``AbstractRepositoryBackend`` using the ``disk-objectstore`` as the backend."""
 import contextlib
+import pathlib
 import shutil
 import typing as t
 
-from disk_objectstore import Container
+from disk_objectstore import Container, ObjectType
 
 from aiida.common.lang import type_check
 
@@ -105,6 +106,25 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
             with container.get_object_stream(key) as handle:
                 yield handle  # type: ignore[misc]
 
+    def get_object_filepath(self, key: str) -> t.Optional[pathlib.Path]:
+        """Return the path of the loose file of an object, or ``None`` if the object is packed.
+
+        .. note:: the loose file of an object is deleted once the object is packed during maintenance. On POSIX systems,
+            a file that is memory-mapped or opened remains readable after it has been deleted.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :return: the absolute filepath or ``None`` if the object is not stored as a loose file.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        super().get_object_filepath(key)
+
+        with self._container as container:
+            with container.get_object_stream_and_meta(key) as (handle, meta):
+                if meta['type'] == ObjectType.LOOSE:
+                    return pathlib.Path(handle.name)
+
+        return None
+
     def iter_object_streams(self, keys: t.List[str]) -> t.Iterator[t.Tuple[str, t.BinaryIO]]:
         with self._container.get_objects_stream_and_meta(keys) as triplets:
             for key, stream, _ in triplets:
@@ -138,6 +158,22 @@ class DiskObjectStoreRepositoryBackend(AbstractRepositoryBackend):
                 return super().get_object_hash(key)
         return key
 
+    def get_object_hashes(self, keys: t.List[str]) -> t.List[str]:
+        """Return the SHA-256 hashes of the objects stored under the given keys.
+
+        If the container uses SHA-256 keys, the keys are the hashes, so only a single existence check is required.
+
+        :param keys: list of fully qualified identifiers for the objects within the repository.
+        :raise FileNotFoundError: if any of the files does not exist.
+        """
+        with self._container as container:
+            if container.hash_type != 'sha256':
+                return super().get_object_hashes(keys)
+            missing = [key for key, exists in zip(keys, container.has_objects(keys)) if not exists]
+        if missing:
+            raise FileNotFoundError(', '.join(missing))
+        return list(keys)
+
     def maintain( # type: ignore[override] # pylint: disable=arguments-differ,too-many-branches
         self,
         dry_run: bool = False,
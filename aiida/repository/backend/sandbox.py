@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Implementation of the ``AbstractRepositoryBackend`` using a sandbox folder on disk as the backend."""
 import contextlib
+import hashlib
 import os
+import pathlib
 import shutil
-from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 import uuid
 
 from aiida.common.folders import SandboxFolder
@@ -16,8 +18,12 @@ __all__ = ('SandboxRepositoryBackend',)
 class SandboxRepositoryBackend(AbstractRepositoryBackend):
     """Implementation of the ``AbstractRepositoryBackend`` using a sandbox folder on disk as the backend."""
 
+    _CHUNK_SIZE = 524288
+
     def __init__(self):
         self._sandbox: Optional[SandboxFolder] = None
+        # SHA-256 hashes of the objects, computed while they are written, such that they never have to be read again
+        self._hashes: Dict[str, str] = {}
 
     def __str__(self) -> str:
         """Return the string representation of this repository."""
@@ -71,6 +77,7 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
                 pass
             finally:
                 self._sandbox = None
+                self._hashes = {}
 
     def _put_object_from_filelike(self, handle: BinaryIO) -> str:
         """Store the byte contents of a file in the repository.
@@ -81,9 +88,17 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         """
         key = str(uuid.uuid4())
         filepath = os.path.join(self.sandbox.abspath, key)
+        hasher = hashlib.sha256()
 
         with open(filepath, 'wb') as target:
-            shutil.copyfileobj(handle, target)
+            while True:
+                chunk = handle.read(self._CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                target.write(chunk)
+
+        self._hashes[key] = hasher.hexdigest()
 
         return key
 
@@ -101,6 +116,10 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         with self.sandbox.open(key, mode='rb') as handle:
             yield handle
 
+    def get_object_filepath(self, key: str) -> Optional[pathlib.Path]:
+        super().get_object_filepath(key)
+        return pathlib.Path(self.sandbox.abspath) / key
+
     def iter_object_streams(self, keys: List[str]) -> Iterator[Tuple[str, BinaryIO]]:
         for key in keys:
             with self.open(key) as handle:  # pylint: disable=not-context-manager
@@ -110,10 +129,24 @@ class SandboxRepositoryBackend(AbstractRepositoryBackend):
         super().delete_objects(keys)
         for key in keys:
             os.remove(os.path.join(self.sandbox.abspath, key))
+            self._hashes.pop(key, None)
 
     def list_objects(self) -> Iterable[str]:
         return self.sandbox.get_content_list()
 
+    def get_object_hash(self, key: str) -> str:
+        """Return the SHA-256 hash of an object stored under the given key.
+
+        The hash is computed when the object is written, so the content of the object does not have to be read again.
+
+        :param key: fully qualified identifier for the object within the repository.
+        :raise FileNotFoundError: if the file does not exist.
+        """
+        try:
+            return self._hashes[key]
+        except KeyError:
+            return super().get_object_hash(key)
+
     def maintain(self, dry_run: bool = False, live: bool = True, **kwargs) -> None:
         raise NotImplementedError
 
@@ -114,17 +114,25 @@ class Repository:
     def hash(self) -> str:
         """Generate a hash of the repository's contents.
 
-        .. warning:: this will read the content of all file objects contained within the virtual hierarchy into memory.
+        The hashes of the file objects are retrieved from the backend in a single call to
+        :meth:`~aiida.repository.backend.abstract.AbstractRepositoryBackend.get_object_hashes`, such that backends that
+        know the hashes of their objects, for example because they are content-addressed or have computed them when the
+        objects were written, do not have to read the content of the objects.
 
         :return: the hash representing the contents of the repository.
         """
         objects: Dict[str, Any] = {}
+        paths: List[str] = []
+        keys: List[str] = []
         for root, dirnames, filenames in self.walk():
             objects['__dirnames__'] = dirnames
             for filename in filenames:
                 key = self.get_file(root / filename).key
                 assert key is not None, 'Expected FileType.File to have a key'
-                objects[str(root / filename)] = self.backend.get_object_hash(key)
+                paths.append(str(root / filename))
+                keys.append(key)
+
+        objects.update(zip(paths, self.backend.get_object_hashes(keys)))
 
         return make_hash(objects)
 
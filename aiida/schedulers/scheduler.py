@@ -9,6 +9,7 @@
 ###########################################################################
 """Implementation of `Scheduler` base class."""
 import abc
+import re
 
 from aiida.common import exceptions, log
 from aiida.common.escaping import escape_for_bash
@@ -31,6 +32,11 @@ class Scheduler(metaclass=abc.ABCMeta):
 
     _logger = log.AIIDA_LOGGER.getChild('scheduler')
 
+    # Maximum number of scripts submitted with a single command by `submit_from_scripts`, to keep the command well
+    # within the limits on the length of a command line.
+    _SUBMIT_BATCH_SIZE = 100
+    _SUBMIT_SEPARATOR = '__AIIDA_SUBMIT_SEPARATOR__'
+
     # A list of features
     # Features that should be defined in the plugins:
     # 'can_query_by_user': True if I can pass the 'user' argument to
@@ -364,6 +370,80 @@ class Scheduler(metaclass=abc.ABCMeta):
         result = self.transport.exec_command_wait(self._get_submit_command(escape_for_bash(submit_script)))
         return self._parse_submit_output(*result)
 
+    def submit_from_scripts(self, working_directories_and_scripts):
+        """Submit multiple submission scripts to the scheduler, using a single remote command per batch of scripts.
+
+        The submit commands are executed one after the other, each in its own working directory, and their outputs and
+        exit codes are separated, such that they can be parsed individually by `_parse_submit_output`. The failure of
+        one submission therefore does not affect the others. Plugins that override `submit_from_script` get each script
+        submitted separately through their override instead.
+
+        :param working_directories_and_scripts: list of tuples with the working directory and the path of the submission
+            script relative to it.
+        :return: list with, for each script, a string with the job ID in a valid format to be used for querying, or the
+            exception raised when parsing the output of its submit command.
+        """
+        working_directories_and_scripts = list(working_directories_and_scripts)
+        results = []
+
+        if len(working_directories_and_scripts) == 1 or self._overrides_submit_from_script():
+            for working_directory, submit_script in working_directories_and_scripts:
+                try:
+                    results.append(self.submit_from_script(working_directory, submit_script))
+                except Exception as exception:  # pylint: disable=broad-except
+                    results.append(exception)
+            return results
+
+        for start in range(0, len(working_directories_and_scripts), self._SUBMIT_BATCH_SIZE):
+            batch = working_directories_and_scripts[start:start + self._SUBMIT_BATCH_SIZE]
+            results.extend(self._submit_batch_from_scripts(batch))
+
+        return results
+
+    def _overrides_submit_from_script(self):
+        """Return whether the plugin overrides ``submit_from_script``, such that it cannot be submitted in batch."""
+        return type(self).submit_from_script is not Scheduler.submit_from_script
+
+    def _submit_batch_from_scripts(self, working_directories_and_scripts):
+        """Submit the submission scripts to the scheduler with a single remote command.
+
+        :param working_directories_and_scripts: list of tuples with the working directory and the path of the submission
+            script relative to it.
+        :return: list with, for each script, the job ID or the exception raised when parsing the output.
+        """
+        separator = self._SUBMIT_SEPARATOR
+        commands = []
+
+        for working_directory, submit_script in working_directories_and_scripts:
+            submit_command = self._get_submit_command(escape_for_bash(submit_script))
+            commands.append(
+                f'( cd {escape_for_bash(working_directory)} && ( {submit_command} ) ); retval=$?; '
+                f'echo; echo "{separator} $retval"; echo >&2; echo {separator} >&2; '
+            )
+
+        _, stdout, stderr = self.transport.exec_command_wait(''.join(commands))
+
+        # Splitting on the separators with the exit code in a capturing group, gives [stdout, retval, stdout, ...]
+        stdout_parts = re.split(f'\n{separator} (\\d+)\n', stdout)
+        stderr_parts = re.split(f'\n{separator}\n', stderr)
+        results = []
+
+        for index in range(len(working_directories_and_scripts)):
+            if 2 * index + 1 >= len(stdout_parts) or index >= len(stderr_parts) - 1:
+                results.append(
+                    SchedulerError(f'No output found for the submission of the script {index} of the batch: {stderr}')
+                )
+                continue
+
+            retval = int(stdout_parts[2 * index + 1])
+
+            try:
+                results.append(self._parse_submit_output(retval, stdout_parts[2 * index], stderr_parts[index]))
+            except Exception as exception:  # pylint: disable=broad-except
+                results.append(exception)
+
+        return results
+
     def kill(self, jobid):
         """Kill a remote job and parse the return value of the scheduler to check if the command succeeded.
 
@@ -10,7 +10,22 @@
 """Abstraction for an archive file format."""
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Literal, Optional, Type, TypeVar, Union, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 if TYPE_CHECKING:
     from aiida.orm import QueryBuilder
@@ -106,6 +121,21 @@ class ArchiveWriterAbstract(ABC):
         :return: the key of the object
         """
 
+    def put_objects(self, objects: Iterable[Tuple[str, BinaryIO]], *, workers: int = 1) -> Iterator[str]:
+        """Add multiple objects to the archive, yielding the key of each object once it has been added.
+
+        Each stream is only read before the next object is taken from the iterable, such that the streams yielded by
+        ``AbstractRepositoryBackend.iter_object_streams`` can be passed directly.
+        The default implementation adds the objects one by one with ``put_object``.
+
+        :param objects: iterable of the key and the byte stream of each object
+        :param workers: the number of threads that the implementation may use to compress the objects
+        :return: iterator over the keys of the objects
+        """
+        # pylint: disable=unused-argument
+        for key, stream in objects:
+            yield self.put_object(stream, key=key)
+
     @abstractmethod
     def delete_object(self, key: str) -> None:
         """Delete the object from the archive.
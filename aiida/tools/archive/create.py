@@ -13,11 +13,13 @@
 The archive is a subset of the provenance graph,
 stored in a single file.
 """
+from contextlib import contextmanager
 from datetime import datetime
+import hashlib
 from pathlib import Path
 import shutil
 import tempfile
-from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from tabulate import tabulate
 
@@ -58,6 +60,8 @@ def create_archive(
     strip_checkpoints: bool = True,
     batch_size: int = 1000,
     compression: int = 6,
+    workers: int = 1,
+    checkpoint: bool = False,
     test_run: bool = False,
     backend: Optional[Backend] = None,
     **traversal_rules: bool
@@ -134,6 +138,16 @@ def create_archive(
 
     :param compression: level of compression to use (integer from 0 to 9)
 
+    :param workers: number of threads to compress the repository files with.
+        Files that do not compress, for example because they are already compressed, are stored without compression.
+
+    :param checkpoint: if True, create the archive in a ``<filename>.partial`` folder next to the output file,
+        which records the repository files that have been written to the archive.
+        If the export is interrupted, calling it again with the same output file resumes from the checkpoint,
+        such that only the remaining repository files are written.
+        The export starts from scratch if the nodes or the compression differ from those of the interrupted export.
+        The database is always exported again, which is fast compared to the repository files.
+
     :param batch_size: batch database query results in sub-collections to reduce memory usage
 
     :param test_run: if True, do not write to file
@@ -168,6 +182,9 @@ def create_archive(
     if compression not in range(10):
         raise ArchiveExportError('compression must be an integer between 0 and 9')
 
+    if workers < 1:
+        raise ArchiveExportError('workers must be a positive integer')
+
     # check file format
     archive_format = archive_format or ArchiveFormatSqlZip()
     type_check(archive_format, ArchiveFormatAbstract)
@@ -272,11 +289,18 @@ def create_archive(
     EXPORT_LOGGER.report(f'Creating archive with:\n{tabulate(count_summary)}')
 
     # Create and open the archive for writing.
-    # We create in a temp dir then move to final place at end,
+    # We create in a work dir then move to final place at end,
     # so that the user cannot end up with a half written archive on errors
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_filename = Path(tmpdir) / 'export.zip'
-        with archive_format.open(tmp_filename, mode='x', compression=compression) as writer:
+    with _open_work_dir(filename, checkpoint) as work_dir:
+        tmp_filename = work_dir / 'export.zip'
+        writer_kwargs: Dict[str, Any] = {}
+        if checkpoint:
+            # the checkpoint is only resumed for an export of the same nodes
+            writer_kwargs['checkpoint'] = work_dir / 'checkpoint.jsonl'
+            writer_kwargs['checkpoint_parameters'] = {'nodes': _hash_ids(entity_ids[EntityTypes.NODE])}
+        with archive_format.open(
+            tmp_filename, mode='w' if checkpoint else 'x', compression=compression, **writer_kwargs
+        ) as writer:
             # add metadata
             writer.update_metadata({
                 'ctime': datetime.now().isoformat(),
@@ -339,7 +363,9 @@ def create_archive(
 
             # stream node repository files to the archive
             if entity_ids[EntityTypes.NODE]:
-                _stream_repo_files(archive_format.key_format, writer, entity_ids[EntityTypes.NODE], backend, batch_size)
+                _stream_repo_files(
+                    archive_format.key_format, writer, entity_ids[EntityTypes.NODE], backend, batch_size, workers
+                )
 
             EXPORT_LOGGER.report('Finalizing archive creation...')
 
@@ -352,6 +378,36 @@ def create_archive(
     return filename
 
 
+@contextmanager
+def _open_work_dir(filename: Path, checkpoint: bool) -> Iterator[Path]:
+    """Return the folder to create the archive in, before it is moved to the output file.
+
+    Without a checkpoint, this is a temporary folder that is always removed.
+    With a checkpoint, this is a folder next to the output file, that is only removed once the archive is created,
+    such that an interrupted export can be resumed from it.
+    """
+    if not checkpoint:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+        return
+
+    work_dir = filename.parent / f'{filename.name}.partial'
+    if work_dir.exists():
+        EXPORT_LOGGER.report(f'Resuming archive creation from checkpoint: {work_dir}')
+    work_dir.mkdir(exist_ok=True)
+    try:
+        yield work_dir
+    except BaseException:
+        EXPORT_LOGGER.report(f'Archive creation interrupted, export to the same file again to resume from: {work_dir}')
+        raise
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _hash_ids(ids: Set[int]) -> str:
+    """Return a hash of a set of entity IDs, that is independent of their order."""
+    return hashlib.sha256(','.join(str(pk) for pk in sorted(ids)).encode('utf8')).hexdigest()
+
+
 def _collect_all_entities(
     querybuilder: QbType, entity_ids: Dict[EntityTypes, Set[int]], include_authinfos: bool, include_comments: bool,
     include_logs: bool, batch_size: int
@@ -565,7 +621,12 @@ def _collect_required_entities(
 
 
 def _stream_repo_files(
-    key_format: str, writer: ArchiveWriterAbstract, node_ids: Set[int], backend: Backend, batch_size: int
+    key_format: str,
+    writer: ArchiveWriterAbstract,
+    node_ids: Set[int],
+    backend: Backend,
+    batch_size: int,
+    workers: int = 1
 ) -> None:
     """Collect all repository object keys from the nodes, then stream the files to the archive."""
     keys = set(orm.Node.objects(backend).iter_repo_keys(filters={'id': {'in': list(node_ids)}}, batch_size=batch_size))
@@ -577,9 +638,8 @@ def _stream_repo_files(
             f'Backend repository key format incompatible: {repository.key_format!r} != {key_format!r}'
         )
     with get_progress_reporter()(desc='Archiving files: ', total=len(keys)) as progress:
-        for key, stream in repository.iter_object_streams(keys):
-            # to-do should we use assume the key here is correct, or always re-compute and check?
-            writer.put_object(stream, key=key)
+        # to-do should we use assume the key here is correct, or always re-compute and check?
+        for _ in writer.put_objects(repository.iter_object_streams(keys), workers=workers):
             progress.update()
 
 
@@ -8,6 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """AiiDA archive writer implementation."""
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 import functools
 import hashlib
@@ -16,8 +18,10 @@ import json
 from pathlib import Path
 import shutil
 import tempfile
-from typing import Any, BinaryIO, Dict, List, Literal, Optional, Set, Union
+import time
+from typing import IO, Any, BinaryIO, Deque, Dict, Iterable, Iterator, List, Literal, Optional, Set, Tuple, Union
 import zipfile
+import zlib
 
 from archive_path import NOTSET, ZipPath, extract_file_in_zip, read_file_in_zip
 from sqlalchemy import insert, inspect
@@ -35,6 +39,21 @@ from aiida.tools.archive.exceptions import CorruptArchive, IncompatibleArchiveVe
 from . import backend as db
 from .common import DB_FILENAME, META_FILENAME, REPO_FOLDER, create_sqla_engine
 
+# size of the chunks in which objects are read and compressed by the worker threads of ``put_objects``
+CHUNK_SIZE = 2**20
+
+# number of chunks per worker thread that can be read and compressed ahead of those that are written to the archive
+CHUNKS_PER_WORKER = 4
+
+# objects whose first chunk does not compress below this fraction of its size are stored without compression
+STORE_RATIO = 0.95
+
+# attributes of the ``zipfile.ZipInfo`` of an object that are recorded in the checkpoint file
+CHECKPOINT_FIELDS = (
+    'filename', 'date_time', 'compress_type', 'flag_bits', 'external_attr', 'CRC', 'compress_size', 'file_size',
+    'header_offset'
+)
+
 
 @functools.lru_cache(maxsize=10)
 def _get_model_from_entity(entity_type: EntityTypes):
@@ -55,8 +74,25 @@ def _get_model_from_entity(entity_type: EntityTypes):
     return model, column_names
 
 
+def _compress_chunk(chunk: bytes, level: int, final: bool) -> bytes:
+    """Compress a chunk of an object to raw deflate data, that can be concatenated with the data of the other chunks.
+
+    Each chunk is compressed independently and, unless it is the final chunk, ends on a byte boundary with a sync flush,
+    such that the concatenated data of all chunks is a valid deflate stream of the whole object.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(chunk) + compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
 class ArchiveWriterSqlZip(ArchiveWriterAbstract):
-    """AiiDA archive writer implementation."""
+    """AiiDA archive writer implementation.
+
+    If a checkpoint file is given, every repository object that is written to the archive is recorded in it.
+    If the writing is interrupted, a new writer for the same path and checkpoint file restores the archive to the
+    recorded objects, such that only the remaining objects have to be written.
+    The first line of the checkpoint file records the compression and the ``checkpoint_parameters``, and the archive
+    is only restored if they are the same for the new writer, otherwise it is written from scratch.
+    """
 
     meta_name = META_FILENAME
     db_name = DB_FILENAME
@@ -69,11 +105,16 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
         mode: Literal['x', 'w', 'a'] = 'x',
         compression: int = 6,
         work_dir: Optional[Path] = None,
+        checkpoint: Optional[Union[str, Path]] = None,
+        checkpoint_parameters: Optional[Dict[str, Any]] = None,
         _debug: bool = False,
         _enforce_foreign_keys: bool = True,
     ):
         super().__init__(path, fmt, mode=mode, compression=compression)
         self._init_work_dir = work_dir
+        self._checkpoint_path = None if checkpoint is None else Path(checkpoint)
+        self._checkpoint: Optional[IO[bytes]] = None
+        self._checkpoint_header = {'compression': compression, 'parameters': checkpoint_parameters or {}}
         self._in_context = False
         self._enforce_foreign_keys = _enforce_foreign_keys
         self._debug = _debug
@@ -98,14 +139,23 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
         }
         self._work_dir = Path(tempfile.mkdtemp()) if self._init_work_dir is None else Path(self._init_work_dir)
         self._central_dir = {}
+        mode = self._mode
+        if self._checkpoint_path is not None and self._checkpoint_path.exists() and self._path.exists():
+            if self._restore_checkpoint():
+                mode = 'a'
         self._zip_path = ZipPath(
             self._path,
-            mode=self._mode,
+            mode=mode,
             compression=zipfile.ZIP_DEFLATED if self._compression else zipfile.ZIP_STORED,
             compresslevel=self._compression,
             info_order=(self.meta_name, self.db_name),
             name_to_info=self._central_dir,
         )
+        if self._checkpoint_path is not None:
+            self._checkpoint = self._checkpoint_path.open('ab' if mode == 'a' else 'wb')
+            if mode != 'a':
+                self._checkpoint.write(json.dumps(self._checkpoint_header).encode('utf8') + b'\n')
+                self._checkpoint.flush()
         engine = create_sqla_engine(
             self._work_dir / self.db_name, enforce_foreign_keys=self._enforce_foreign_keys, echo=self._debug
         )
@@ -130,11 +180,69 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
         if self._zip_path:
             self._zip_path.close()
             self._central_dir = {}
+        if self._checkpoint is not None:
+            self._checkpoint.close()
         if self._work_dir is not None and self._init_work_dir is None:
             shutil.rmtree(self._work_dir, ignore_errors=True)
-        self._zip_path = self._work_dir = self._conn = None
+        self._zip_path = self._work_dir = self._conn = self._checkpoint = None
         self._in_context = False
 
+    def _restore_checkpoint(self) -> bool:
+        """Restore the archive to the repository objects that are recorded in the checkpoint file.
+
+        Anything that was written to the archive after the last recorded object is truncated and a central directory
+        is written for the recorded objects, such that the archive can be opened in append mode.
+
+        :return: whether the archive was restored, which is not the case if the header of the checkpoint file differs
+        """
+        assert self._checkpoint_path is not None
+        size = self._path.stat().st_size
+        infos: List[zipfile.ZipInfo] = []
+        end = 0
+        with self._checkpoint_path.open('rb') as handle:
+            header = handle.readline()
+            if not header.endswith(b'\n') or json.loads(header) != self._checkpoint_header:
+                return False
+            position = len(header)
+            for line in handle:
+                # the last line is incomplete if the writing was interrupted while recording it
+                if not line.endswith(b'\n'):
+                    break
+                *values, entry_end = json.loads(line)
+                if entry_end > size:
+                    break
+                info = zipfile.ZipInfo(values[0], tuple(values[1]))
+                for field, value in zip(CHECKPOINT_FIELDS[2:], values[2:]):
+                    setattr(info, field, value)
+                infos.append(info)
+                position += len(line)
+                end = max(end, entry_end)
+        with self._checkpoint_path.open('r+b') as handle:
+            handle.truncate(position)
+        with self._path.open('r+b') as handle:
+            handle.truncate(end)
+            handle.seek(end)
+            with zipfile.ZipFile(handle, mode='w') as archive:
+                for info in infos:
+                    archive.filelist.append(info)
+                    archive.NameToInfo[info.filename] = info
+        return True
+
+    def _write_checkpoint(self, name: str) -> None:
+        """Record the object with the given name in the checkpoint file, after it has been written to the archive."""
+        if self._checkpoint is None:
+            return
+        assert self._zip_path is not None
+        archive = self._zip_path.root
+        assert archive.fp is not None
+        info = self._central_dir[name]
+        # make sure the object is written to the file before it is recorded
+        archive.fp.flush()
+        end = archive.start_dir  # type: ignore[attr-defined]
+        record = [getattr(info, field) for field in CHECKPOINT_FIELDS] + [end]
+        self._checkpoint.write(json.dumps(record).encode('utf8') + b'\n')
+        self._checkpoint.flush()
+
     def update_metadata(self, data: Dict[str, Any], overwrite: bool = False) -> None:
         if not overwrite and set(self._metadata).intersection(set(data)):
             raise ValueError(f'Cannot overwrite existing keys: {set(self._metadata).intersection(set(data))}')
@@ -199,8 +307,107 @@ class ArchiveWriterSqlZip(ArchiveWriterAbstract):
             stream.seek(0)
         if f'{REPO_FOLDER}/{key}' not in self._central_dir:
             self._stream_binary(f'{REPO_FOLDER}/{key}', stream, buffer_size=buffer_size)
+            self._write_checkpoint(f'{REPO_FOLDER}/{key}')
         return key
 
+    def put_objects(self, objects: Iterable[Tuple[str, BinaryIO]], *, workers: int = 1) -> Iterator[str]:
+        """Add multiple objects to the archive, yielding the key of each object once it has been added.
+
+        If ``workers`` is larger than one, the objects are read in chunks of ``CHUNK_SIZE`` bytes, that are compressed
+        independently by a pool of worker threads, while the chunks are written to the archive in order.
+        Objects that do not compress, for example because they are already compressed, are stored without compression.
+
+        :param objects: iterable of the key and the byte stream of each object
+        :param workers: the number of threads to compress the objects with
+        :return: iterator over the keys of the objects
+        """
+        if workers < 2 or not self._compression:
+            yield from super().put_objects(objects, workers=workers)
+            return
+
+        self._assert_in_context()
+        assert self._zip_path is not None
+        handle = self._zip_path.root.fp
+        assert handle is not None
+        pending: Deque[Tuple[str, bytes, bool, Future]] = deque()
+        names: Set[str] = set()
+        info: Optional[zipfile.ZipInfo] = None
+        zip64 = False
+
+        def write_pending(limit: int) -> Iterator[str]:
+            """Write the pending chunks to the archive, until at most ``limit`` chunks are pending."""
+            nonlocal info, zip64
+            while len(pending) > limit:
+                key, chunk, final, future = pending.popleft()
+                compressed = future.result()
+                if info is None:
+                    zip64 = not final
+                    stored = len(compressed) >= STORE_RATIO * len(chunk)
+                    compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+                    info = self._start_entry(f'{REPO_FOLDER}/{key}', compress_type, zip64)
+                data = chunk if info.compress_type == zipfile.ZIP_STORED else compressed
+                handle.write(data)
+                info.CRC = zlib.crc32(chunk, info.CRC)
+                info.file_size += len(chunk)
+                info.compress_size += len(data)
+                if final:
+                    self._finish_entry(info, zip64)
+                    info = None
+                    yield key
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for key, stream in objects:
+                name = f'{REPO_FOLDER}/{key}'
+                if name in self._central_dir or name in names:
+                    yield key
+                    continue
+                names.add(name)
+                # the stream is read completely here, since it may no longer be valid once the next object is taken
+                chunk = stream.read(CHUNK_SIZE)
+                while True:
+                    following = stream.read(CHUNK_SIZE)
+                    final = not following
+                    future = executor.submit(_compress_chunk, chunk, self._compression, final)
+                    pending.append((key, chunk, final, future))
+                    yield from write_pending(workers * CHUNKS_PER_WORKER)
+                    if final:
+                        break
+                    chunk = following
+            yield from write_pending(0)
+
+    def _start_entry(self, name: str, compress_type: int, zip64: bool) -> zipfile.ZipInfo:
+        """Start an entry of the archive, whose data is written directly to its file, and return its ``ZipInfo``.
+
+        The local header is written with zero sizes and checksum, which are updated by ``_finish_entry``.
+        """
+        # pylint: disable=protected-access
+        assert self._zip_path is not None
+        archive = self._zip_path.root
+        assert archive.fp is not None
+        info = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[0:6])
+        info.compress_type = compress_type
+        info.external_attr = 0o600 << 16
+        info.CRC = info.compress_size = info.file_size = 0
+        archive._writecheck(info)  # type: ignore[attr-defined]
+        archive._didModify = True  # type: ignore[attr-defined]
+        archive.fp.seek(archive.start_dir)  # type: ignore[attr-defined]
+        info.header_offset = archive.start_dir  # type: ignore[attr-defined]
+        archive.fp.write(info.FileHeader(zip64))
+        return info
+
+    def _finish_entry(self, info: zipfile.ZipInfo, zip64: bool) -> None:
+        """Finish an entry started by ``_start_entry``, once all of its data has been written."""
+        assert self._zip_path is not None
+        archive = self._zip_path.root
+        assert archive.fp is not None
+        archive.start_dir = archive.fp.tell()  # type: ignore[attr-defined]
+        archive.fp.seek(info.header_offset)
+        archive.fp.write(info.FileHeader(zip64))
+        archive.fp.seek(archive.start_dir)  # type: ignore[attr-defined]
+        archive.filelist.append(info)
+        archive.NameToInfo[info.filename] = info
+        self._write_checkpoint(info.filename)
+
     def delete_object(self, key: str) -> None:
         raise IOError(f'Cannot delete objects in {self._mode!r} mode')
 
@@ -12,8 +12,10 @@
 import glob
 import io
 import os
+import queue
 import re
-from stat import S_ISDIR, S_ISREG
+from stat import S_ISDIR, S_ISLNK, S_ISREG
+import threading
 
 import click
 import paramiko
@@ -221,7 +223,25 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                 'help': 'SSH key policy if host is not known.',
                 'non_interactive_default': True
             }
-        )
+        ),
+        (
+            'sftp_channels', {
+                'default': 1,
+                'type': click.IntRange(min=1),
+                'prompt': 'Number of SFTP channels',
+                'help': 'Number of SFTP channels to open on the connection to transfer multiple files concurrently.',
+                'non_interactive_default': True
+            }
+        ),
+        (
+            'transfer_mode', {
+                'default': 'sftp',
+                'type': click.Choice(['sftp', 'tar']),
+                'prompt': 'File retrieval mode',
+                'help': 'Retrieve multiple files individually over SFTP, or packed remotely in a single tar stream.',
+                'non_interactive_default': True
+            }
+        ),
     ]
 
     # Max size of log message to print in _exec_command_internal.
@@ -397,6 +417,10 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
            if False, do not load the system host keys
         :param key_policy: (optional, default = paramiko.RejectPolicy())
            the policy to use for unknown keys
+        :param sftp_channels: (optional, default 1)
+           the number of SFTP channels used by `get_many` and `put_many` to transfer files concurrently
+        :param transfer_mode: (optional, default 'sftp')
+           if 'tar', `get_many` packs the remote files in a tar stream instead of retrieving them one by one
 
         Other parameters valid for the ssh connect function (see the
         self._valid_connect_params list) are passed to the connect
@@ -406,6 +430,8 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         super().__init__(*args, **kwargs)
 
         self._sftp = None
+        self._sftp_pool = []
+        self._sftp_local = threading.local()
         self._proxy = None
         self._proxies = []
 
@@ -429,6 +455,14 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                 'are: RejectPolicy, WarningPolicy, AutoAddPolicy'
             )
 
+        self._sftp_channels = int(kwargs.pop('sftp_channels', 1))
+        if self._sftp_channels < 1:
+            raise ValueError('The number of SFTP channels should be at least 1')
+
+        self._transfer_mode = kwargs.pop('transfer_mode', 'sftp')
+        if self._transfer_mode not in ('sftp', 'tar'):
+            raise ValueError('Unknown value of the transfer mode, allowed values are: sftp, tar')
+
         self._connect_args = {}
         for k in self._valid_connect_params:
             try:
@@ -571,12 +605,32 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         if not self._is_open:
             raise InvalidOperation('Cannot close the transport: it is already closed')
 
+        while self._sftp_pool:
+            self._sftp_pool.pop().close()
         self._sftp.close()
         self._client.close()
         self._close_proxies()
 
         self._is_open = False
 
+    @property
+    def is_alive(self):
+        """Return whether the transport is open and its SSH connection is still active."""
+        if not self._is_open:
+            return False
+
+        transport = self._client.get_transport()
+
+        if transport is None or not transport.is_active():
+            return False
+
+        try:
+            transport.send_ignore()
+        except (EOFError, OSError, paramiko.SSHException):
+            return False
+
+        return True
+
     @property
     def sshclient(self):
         if not self._is_open:
@@ -585,9 +639,62 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
     @property
     def sftp(self):
+        """Return the SFTP client of the current thread, which is the main one unless called from a transfer worker."""
         if not self._is_open:
             raise TransportInternalError('Error, sftp method called for SshTransport without opening the channel first')
-        return self._sftp
+        return getattr(self._sftp_local, 'sftp', None) or self._sftp
+
+    def _get_sftp_pool(self):
+        """Return the SFTP clients used to transfer files concurrently, opening the missing ones on first use.
+
+        The clients are channels multiplexed on the same SSH connection as the main SFTP client, with their working
+        directory set to the one of the main client, and are kept open until the transport is closed.
+
+        :return: list of ``paramiko.SFTPClient`` instances, including the main one.
+        """
+        cwd = self.getcwd()
+        while len(self._sftp_pool) < self._sftp_channels - 1:
+            sftp = self.sshclient.open_sftp()
+            self._sftp_pool.append(sftp)
+        for sftp in self._sftp_pool:
+            sftp.chdir(cwd)
+        return [self._sftp] + self._sftp_pool
+
+    def _run_concurrently(self, method, list_of_pairs, *args, **kwargs):
+        """Call the given transfer method for each pair, distributing the pairs over the pool of SFTP channels.
+
+        Each worker thread uses its own SFTP channel through the :attr:`sftp` property, so the method can be any method
+        of this transport that only uses the SFTP client, such as :meth:`get` or :meth:`put`.
+
+        :param method: the bound method to call as ``method(first, second, *args, **kwargs)`` for each pair.
+        :param list_of_pairs: list of tuples with the first two arguments of the method.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Transfers started from a worker thread, e.g. a `gettree` within `get_many`, stay on the channel of that thread
+        if self._sftp_channels == 1 or len(list_of_pairs) <= 1 or getattr(self._sftp_local, 'sftp', None) is not None:
+            for first, second in list_of_pairs:
+                method(first, second, *args, **kwargs)
+            return
+
+        channels = queue.Queue()
+        for sftp in self._get_sftp_pool():
+            channels.put(sftp)
+
+        def transfer(first, second):
+            sftp = channels.get()
+            self._sftp_local.sftp = sftp
+            try:
+                method(first, second, *args, **kwargs)
+            finally:
+                self._sftp_local.sftp = None
+                channels.put(sftp)
+
+        with ThreadPoolExecutor(max_workers=channels.qsize()) as executor:
+            futures = [executor.submit(transfer, first, second) for first, second in list_of_pairs]
+
+        for future in futures:
+            future.result()
 
     def __str__(self):
         """
@@ -977,6 +1084,8 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
             remotepath = os.path.join(remotepath, os.path.split(localpath)[1])
             self.mkdir(remotepath)  # create a nested folder
 
+        file_pairs = []
+
         for this_source in os.walk(localpath):
             # Get the relative path
             this_basename = os.path.relpath(path=this_source[0], start=localpath)
@@ -993,7 +1102,24 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
             for this_file in this_source[2]:
                 this_local_file = os.path.join(localpath, this_basename, this_file)
                 this_remote_file = os.path.join(remotepath, this_basename, this_file)
-                self.putfile(this_local_file, this_remote_file)
+                file_pairs.append((this_local_file, this_remote_file))
+
+        self._run_concurrently(self.putfile, file_pairs)
+
+    def put_many(self, list_of_pairs, callback=None, dereference=True, overwrite=True, ignore_nonexisting=False):  # pylint: disable=arguments-differ,too-many-arguments
+        """
+        Put multiple files or folders from local to remote.
+
+        If more than one SFTP channel is configured, the pairs are transferred concurrently over the pool of channels.
+
+        :param list_of_pairs: iterable of ``(localpath, remotepath)`` tuples, see :meth:`put` for their meaning
+        :param dereference: follow symbolic links (boolean).
+            Default = True (default behaviour in paramiko). False is not implemented.
+        :param overwrite: if True overwrites files and folders (boolean).
+            Default = True.
+        :param ignore_nonexisting: if True, local paths that do not exist are ignored.
+        """
+        self._run_concurrently(self.put, list(list_of_pairs), callback, dereference, overwrite, ignore_nonexisting)
 
     def get(self, remotepath, localpath, callback=None, dereference=True, overwrite=True, ignore_nonexisting=False):  # pylint: disable=too-many-branches,arguments-differ,too-many-arguments
         """
@@ -1132,16 +1258,162 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
             localpath = os.path.join(localpath, os.path.split(remotepath)[1])
             os.mkdir(localpath)  # create a nested folder
 
-        item_list = self.listdir(remotepath)
-        dest = str(localpath)
+        self._run_concurrently(self.getfile, self._get_tree_file_pairs(remotepath, str(localpath)))
+
+    def _get_tree_file_pairs(self, remotepath, localpath):
+        """
+        Create the local folders of a remote folder recursively and return the pairs of files to retrieve.
+
+        :param remotepath: the remote folder
+        :param localpath: the existing local folder that corresponds to the remote folder
+        :return: list of ``(remotepath, localpath)`` tuples of the files within the remote folder
+        """
+        file_pairs = []
+        folders = [(remotepath, localpath)]
+
+        while folders:
+            remote_folder, local_folder = folders.pop()
+
+            # The attributes of the listing avoid a `stat` call per item, which is only needed to follow symlinks
+            for attributes in self.sftp.listdir_attr(remote_folder):
+                item = str(attributes.filename)
+                remote_item = os.path.join(remote_folder, item)
+                local_item = os.path.join(local_folder, item)
+
+                if S_ISDIR(attributes.st_mode) or (S_ISLNK(attributes.st_mode) and self.isdir(remote_item)):
+                    os.mkdir(local_item)
+                    folders.append((remote_item, local_item))
+                else:
+                    file_pairs.append((remote_item, local_item))
+
+        return file_pairs
+
+    def get_many(self, list_of_pairs, callback=None, dereference=True, overwrite=True, ignore_nonexisting=False):  # pylint: disable=arguments-differ,too-many-arguments
+        """
+        Get multiple files or folders from remote to local.
+
+        If more than one SFTP channel is configured, the pairs are transferred concurrently over the pool of channels.
+        In the ``tar`` transfer mode, the remote paths are first packed on the remote in a single tar stream that is
+        unpacked locally, such that the latency of the connection is paid once instead of for every file. The pairs
+        that cannot be retrieved through the tar stream, for example because the remote path contains a pattern or
+        does not exist, are retrieved through SFTP instead.
+
+        :param list_of_pairs: iterable of ``(remotepath, localpath)`` tuples, see :meth:`get` for their meaning
+        :param dereference: follow symbolic links.
+            Default = True (default behaviour in paramiko).
+            False is not implemented.
+        :param overwrite: if True overwrites files and folders.
+            Default = True.
+        :param ignore_nonexisting: if True, remote paths that do not exist are ignored.
+        """
+        if not dereference:
+            raise NotImplementedError
+
+        list_of_pairs = list(list_of_pairs)
+
+        if self._transfer_mode == 'tar':
+            list_of_pairs = self._get_many_tar(list_of_pairs, overwrite)
+
+        self._run_concurrently(self.get, list_of_pairs, callback, dereference, overwrite, ignore_nonexisting)
+
+    def _get_many_tar(self, list_of_pairs, overwrite=True):  # pylint: disable=too-many-branches,too-many-locals
+        """
+        Retrieve the given pairs through a single tar stream, packed on the remote and unpacked locally.
 
-        for item in item_list:
-            item = str(item)
+        Symbolic links are followed, as for the SFTP transfers. The paths are placed locally with the same rules as
+        :meth:`get`, except that the remote paths cannot contain patterns.
 
-            if self.isdir(os.path.join(remotepath, item)):
-                self.gettree(os.path.join(remotepath, item), os.path.join(dest, item))
+        :param list_of_pairs: list of ``(remotepath, localpath)`` tuples
+        :param overwrite: if True overwrites files and folders.
+        :return: the pairs that were not retrieved, because their remote path contains a pattern or is not part of the
+            tar stream, for example because it does not exist.
+        :raise ValueError: if a local path is invalid
+        :raise OSError: if unintentionally overwriting
+        """
+        import shutil
+        import tarfile
+        import tempfile
+
+        cwd = self.getcwd()
+        members = {}
+        remaining = []
+
+        for remotepath, localpath in list_of_pairs:
+            if not os.path.isabs(localpath):
+                raise ValueError('The localpath must be an absolute path')
+
+            member = os.path.normpath(os.path.join(cwd, remotepath)).lstrip('/')
+
+            if self.has_magic(remotepath) or not member:
+                remaining.append((remotepath, localpath))
             else:
-                self.getfile(os.path.join(remotepath, item), os.path.join(dest, item))
+                members.setdefault(member, []).append((remotepath, localpath))
+
+        if not members:
+            return remaining
+
+        with tempfile.TemporaryDirectory() as sandbox:
+            stream = os.path.join(sandbox, 'stream.tar')
+            extracted = os.path.join(sandbox, 'extracted')
+
+            # The tar stream is written to disk as it is received, rather than kept in memory, since it can be large.
+            # The paths are passed relative to the root through stdin, to not be limited by the maximum command length
+            with open(stream, 'wb') as handle:
+                retval, stderr = self._exec_command_wait_to_handle(
+                    'tar -c -h -f - -C / -T -', handle, stdin=''.join(f'{member}\n' for member in members)
+                )
+
+            if retval != 0:
+                stderr = stderr.decode('utf-8', errors='replace').strip()
+                self.logger.debug(f'tar exited with status {retval}: {stderr}')
+
+            try:
+                with tarfile.open(stream, mode='r:') as archive:
+                    archive.extractall(extracted, members=self._get_safe_tar_members(archive))
+            except tarfile.TarError as exception:
+                self.logger.warning(f'failed to unpack the tar stream, retrieving the files through SFTP: {exception}')
+                return list_of_pairs
+
+            for member, pairs in members.items():
+                source = os.path.join(extracted, member)
+
+                for remotepath, localpath in pairs:
+                    if not os.path.exists(source):
+                        remaining.append((remotepath, localpath))
+                        continue
+
+                    if os.path.isdir(source):
+                        if os.path.exists(localpath) and not overwrite:
+                            raise OSError("Can't overwrite existing files")
+                        if os.path.isfile(localpath):
+                            raise OSError('Cannot copy a directory into a file')
+                        if os.path.isdir(localpath):  # localpath exists already: copy the folder inside of it!
+                            localpath = os.path.join(localpath, os.path.basename(member))
+                            if os.path.exists(localpath):
+                                raise FileExistsError(f'Destination already exists: {localpath}')
+                    else:
+                        if os.path.isdir(localpath):
+                            localpath = os.path.join(localpath, os.path.basename(member))
+                        if os.path.isfile(localpath) and not overwrite:
+                            raise OSError('Destination already exists: not overwriting it')
+
+                    # Copy rather than move, since the same member can be the source of multiple pairs
+                    if os.path.isdir(source):
+                        shutil.copytree(source, localpath)
+                    else:
+                        shutil.copyfile(source, localpath)
+
+        return remaining
+
+    @staticmethod
+    def _get_safe_tar_members(archive):
+        """Yield the regular files and folders of the tar archive that would be extracted within the target folder."""
+        for member in archive:
+            if not (member.isfile() or member.isdir()):
+                continue
+            if os.path.isabs(member.name) or '..' in member.name.split('/'):
+                continue
+            yield member
 
     def get_attribute(self, path):
         """
@@ -1374,7 +1646,7 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
 
         return stdin, stdout, stderr, channel
 
-    def exec_command_wait_bytes(self, command, stdin=None, combine_stderr=False, bufsize=-1):  # pylint: disable=arguments-differ, too-many-branches
+    def exec_command_wait_bytes(self, command, stdin=None, combine_stderr=False, bufsize=-1):  # pylint: disable=arguments-differ
         """
         Executes the specified command and waits for it to finish.
 
@@ -1388,6 +1660,23 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         :return: a tuple with (return_value, stdout, stderr) where stdout and stderr
             are both bytes and the return_value is an int.
         """
+        stdout = io.BytesIO()
+        retval, stderr = self._exec_command_wait_to_handle(command, stdout, stdin, combine_stderr, bufsize)
+        return (retval, stdout.getvalue(), stderr)
+
+    def _exec_command_wait_to_handle(self, command, stdout_handle, stdin=None, combine_stderr=False, bufsize=-1):  # pylint: disable=too-many-arguments,too-many-branches
+        """
+        Executes the specified command and waits for it to finish, writing its stdout to the given handle.
+
+        :param command: the command to execute
+        :param stdout_handle: a binary file-like object to which the stdout of the command is written
+        :param stdin: (optional,default=None) see docstring of self.exec_command_wait_bytes()
+        :param combine_stderr: (optional, default=False) see docstring of
+                   self._exec_command_internal()
+        :param bufsize: same meaning of paramiko.
+
+        :return: a tuple with (return_value, stderr) where stderr is bytes and the return_value is an int.
+        """
         import socket
         import time
 
@@ -1414,7 +1703,6 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         ssh_stdin.channel.shutdown_write()
 
         # Now I get the output
-        stdout_bytes = []
         stderr_bytes = []
         # 100kB buffer (note that this should be smaller than the window size of paramiko)
         # Also, apparently if the data is coming slowly, the read() command will not unlock even for
@@ -1441,7 +1729,7 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                 chunk_exists = True
                 try:
                     piece = stdout.read(internal_bufsize)
-                    stdout_bytes.append(piece)
+                    stdout_handle.write(piece)
                 except socket.timeout:
                     # There was a timeout: I continue as there should still be data
                     pass
@@ -1467,7 +1755,7 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
                     # in case the data arrived between the previous calls and this check.
                     # So we do a final read. Since the execution is over, I think all data is in the buffers,
                     # so we can just read the whole buffer without loops
-                    stdout_bytes.append(stdout.read())
+                    stdout_handle.write(stdout.read())
                     stderr_bytes.append(stderr.read())
                     # And we go out of the `while True` loop
                     break
@@ -1480,7 +1768,7 @@ class SshTransport(Transport):  # pylint: disable=too-many-public-methods
         # However, if I am here, the exit status is ready so this should be returning very quickly
         retval = channel.recv_exit_status()
 
-        return (retval, b''.join(stdout_bytes), b''.join(stderr_bytes))
+        return (retval, b''.join(stderr_bytes))
 
     def gotocomputer_command(self, remotedir):
         """
@@ -143,6 +143,15 @@ class Transport(abc.ABC):
     def is_open(self):
         return self._is_open
 
+    @property
+    def is_alive(self):
+        """Return whether the transport is open and can still be used.
+
+        Transports whose connection can drop while they are open, for example because of a network interruption,
+        should override this with a cheap check of their connection.
+        """
+        return self._is_open
+
     @abc.abstractmethod
     def open(self):
         """
@@ -471,6 +480,20 @@ class Transport(abc.ABC):
         :param str localpath: local_folder_path
         """
 
+    def get_many(self, list_of_pairs, *args, **kwargs):
+        """
+        Retrieve multiple files or folders from remote sources to local destinations.
+
+        The default implementation calls :meth:`get` for each pair in turn, but transports can override it to transfer
+        the files more efficiently, for example concurrently.
+
+        :param list_of_pairs: iterable of ``(remotepath, localpath)`` tuples, each of which is passed to :meth:`get`
+        :param args: additional positional arguments passed to :meth:`get`
+        :param kwargs: additional keyword arguments passed to :meth:`get`
+        """
+        for remotepath, localpath in list_of_pairs:
+            self.get(remotepath, localpath, *args, **kwargs)
+
     @abc.abstractmethod
     def getcwd(self):
         """
@@ -644,6 +667,20 @@ class Transport(abc.ABC):
         :param str remotepath: path to remote folder
         """
 
+    def put_many(self, list_of_pairs, *args, **kwargs):
+        """
+        Put multiple files or folders from local sources to remote destinations.
+
+        The default implementation calls :meth:`put` for each pair in turn, but transports can override it to transfer
+        the files more efficiently, for example concurrently.
+
+        :param list_of_pairs: iterable of ``(localpath, remotepath)`` tuples, each of which is passed to :meth:`put`
+        :param args: additional positional arguments passed to :meth:`put`
+        :param kwargs: additional keyword arguments passed to :meth:`put`
+        """
+        for localpath, remotepath in list_of_pairs:
+            self.put(localpath, remotepath, *args, **kwargs)
+
     @abc.abstractmethod
     def remove(self, path):
         """
@@ -13,7 +13,8 @@
 The purpose of these tests is to benchmark and compare importing and exporting
 parts of the database.
 """
-from io import StringIO
+from io import BytesIO, StringIO
+import os
 
 import pytest
 
@@ -89,6 +90,31 @@ def test_export(benchmark, tmp_path, depth, breadth, num_objects):
     assert out_path.exists()
 
 
+@pytest.mark.parametrize('workers', (1, 4), ids=('workers-1', 'workers-4'))
+@pytest.mark.usefixtures('aiida_profile_clean')
+@pytest.mark.benchmark(group='import-export')
+def test_export_objects(benchmark, tmp_path, workers):
+    """Benchmark exporting nodes with large repository files, that are compressed by one or multiple threads."""
+    nodes = []
+    for index in range(10):
+        node = Dict(dict={'index': index})
+        node.put_object_from_filelike(BytesIO(' '.join(str(i) for i in range(200000)).encode()), 'compressible')
+        node.put_object_from_filelike(BytesIO(os.urandom(10**6)), 'incompressible')
+        nodes.append(node.store())
+    out_path = tmp_path / 'test.aiida'
+    kwargs = get_export_kwargs(filename=str(out_path), workers=workers)
+
+    def _setup():
+        if out_path.exists():
+            out_path.unlink()
+
+    def _run():
+        create_archive(nodes, **kwargs)
+
+    benchmark.pedantic(_run, setup=_setup, iterations=1, rounds=12, warmup_rounds=1)
+    assert out_path.exists()
+
+
 @pytest.mark.parametrize('depth,breadth,num_objects', TREE.values(), ids=TREE.keys())
 @pytest.mark.benchmark(group='import-export')
 def test_import(aiida_profile, benchmark, tmp_path, depth, breadth, num_objects):
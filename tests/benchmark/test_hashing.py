@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for hashing large numeric attribute payloads.
+
+The purpose of these tests is to benchmark the hashing of sequences of numbers and numpy arrays, as they are found in
+the attributes of ``Dict`` and ``List`` nodes with parsed results, with and without hashing the numbers in bulk.
+"""
+from unittest import mock
+
+import numpy
+import pytest
+
+from aiida.common import hashing
+
+GROUP_NAME = 'hashing'
+
+NUMBER_OF_VALUES = 10**5
+
+
+def get_payloads():
+    """Return the payloads to hash, each containing ``NUMBER_OF_VALUES`` numbers."""
+    generator = numpy.random.default_rng(seed=0)
+    forces = generator.normal(size=(NUMBER_OF_VALUES // 3, 3))
+    return {
+        'floats': generator.normal(size=NUMBER_OF_VALUES).tolist(),
+        'integers': generator.integers(-10**6, 10**6, size=NUMBER_OF_VALUES).tolist(),
+        'nested': {
+            'forces': forces.tolist()
+        },
+        'array': forces,
+    }
+
+
+PAYLOADS = get_payloads()
+
+
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=5)
+@pytest.mark.parametrize('bulk', (True, False), ids=('bulk', 'per-element'))
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_make_hash(benchmark, payload, bulk):
+    """Benchmark ``make_hash`` for a large numeric payload, with and without hashing the numbers in bulk.
+
+    Without the bulk hashing, a numpy array is hashed as the nested list of its elements, which has the same hash.
+    """
+    obj = PAYLOADS[payload]
+    obj_as_list = obj.tolist() if isinstance(obj, numpy.ndarray) else obj
+
+    with mock.patch.object(hashing, '_bulk_digests', return_value=None):
+        expected = hashing.make_hash(obj_as_list)
+
+    if bulk:
+        result = benchmark(hashing.make_hash, obj)
+    else:
+        with mock.patch.object(hashing, '_bulk_digests', return_value=None):
+            result = benchmark(lambda: hashing.make_hash(obj_as_list))
+
+    assert result == expected
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Performance benchmark tests for the startup time of ``aiida`` and ``verdi``.
+
+The purpose of these tests is to benchmark the time it takes to import the package and to run ``verdi``, which are
+executed in a fresh interpreter such that the modules that were already imported by the test suite do not interfere.
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+GROUP_NAME = 'import'
+
+CODE_VERDI_HELP = 'from aiida.cmdline.commands.cmd_verdi import verdi; verdi()'
+
+# Generous upper bound in seconds for the startup time, which is only meant to catch severe regressions
+STARTUP_TIME_LIMIT = 5
+
+
+def run_python(code, *args):
+    """Run the code in a new interpreter and return the completed process."""
+    return subprocess.run([sys.executable, '-c', code, *args], capture_output=True, check=True, text=True)
+
+
+def get_imported_modules(code):
+    """Return the names of the modules that were imported after executing the code in a new interpreter."""
+    completed = run_python(f'import json, sys; {code}; print(json.dumps(list(sys.modules)))')
+    return set(json.loads(completed.stdout.splitlines()[-1]))
+
+
+@pytest.mark.parametrize(
+    'code, unexpected', (
+        ('import aiida', ('jsonschema', 'kiwipy', 'plumpy', 'sqlalchemy', 'aiida.orm', 'aiida.engine')),
+        ('from aiida.cmdline.commands.cmd_verdi import verdi', ('kiwipy', 'plumpy', 'sqlalchemy', 'aiida.orm')),
+        ('from aiida import orm', ('sqlalchemy', 'disk_objectstore', 'aiida.engine', 'aiida.cmdline.commands.cmd_')),
+    )
+)
+def test_lazy_imports(code, unexpected):
+    """Test that importing does not import modules that are not needed, which would slow down the startup time."""
+    modules = get_imported_modules(code)
+    assert not [module for module in modules if module.startswith(unexpected)]
+
+
+def test_verdi_help_lazy_commands():
+    """Test that ``verdi --help`` lists the sub commands without importing their modules."""
+    code = f'import atexit, json, sys; atexit.register(lambda: print(json.dumps(list(sys.modules)))); {CODE_VERDI_HELP}'
+    completed = run_python(code, '--help')
+    modules = set(json.loads(completed.stdout.splitlines()[-1]))
+
+    assert 'process' in completed.stdout
+    commands = {module for module in modules if module.startswith('aiida.cmdline.commands.cmd_')}
+    assert not commands - {'aiida.cmdline.commands.cmd_verdi'}
+
+
+@pytest.mark.benchmark(group=GROUP_NAME, min_rounds=5)
+@pytest.mark.parametrize(
+    'code, args', (
+        ('import aiida', ()),
+        ('from aiida import orm', ()),
+        (CODE_VERDI_HELP, ('--help',)),
+    ),
+    ids=('import-aiida', 'import-orm', 'verdi-help')
+)
+def test_startup(benchmark, code, args):
+    """Benchmark the time to start a new interpreter and import ``aiida`` or ``aiida.orm``, or to run ``verdi``."""
+    benchmark.pedantic(run_python, args=(code, *args), rounds=5, warmup_rounds=1)
+    assert benchmark.stats.stats.min < STARTUP_TIME_LIMIT
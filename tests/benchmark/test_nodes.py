@@ -13,12 +13,14 @@
 The purpose of these tests is to benchmark and compare basic node interactions,
 such as storage and deletion from the database and repository.
 """
+from contextlib import nullcontext
 from io import StringIO
 
 import pytest
+from sqlalchemy import event
 
 from aiida.common import NotExistent
-from aiida.orm import Data, load_node
+from aiida.orm import Data, QueryBuilder, load_node
 
 GROUP_NAME = 'node'
 
@@ -128,3 +130,75 @@ def test_delete_with_object(benchmark):
     pk = benchmark.pedantic(_run, setup=get_data_node_and_object, iterations=1, rounds=100, warmup_rounds=1)
     with pytest.raises(NotExistent):
         load_node(pk)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+@pytest.mark.benchmark(group=GROUP_NAME)
+@pytest.mark.parametrize('snapshot', (False, True), ids=('refresh', 'snapshot'))
+def test_read_fields(benchmark, snapshot):
+    """Benchmark for reading the fields of stored nodes, with and without the snapshot mode of the storage.
+
+    The number of executed queries per round is recorded in the ``extra_info`` of the benchmark.
+    """
+    backend = Data.objects.backend
+    for _ in range(100):
+        get_data_node()
+    nodes = QueryBuilder().append(Data).all(flat=True)
+    statements = []
+
+    def _run():
+        with backend.snapshot() if snapshot else nullcontext():
+            return [(node.label, node.attributes, node.extras) for node in nodes]
+
+    def _record(*_):
+        statements.append(None)
+
+    engine = backend.get_session().bind
+    event.listen(engine, 'before_cursor_execute', _record)
+    try:
+        fields = benchmark.pedantic(_run, iterations=1, rounds=20, warmup_rounds=1)
+    finally:
+        event.remove(engine, 'before_cursor_execute', _record)
+
+    benchmark.extra_info['queries'] = len(statements) // 21
+    assert len(fields) == 100
+    assert benchmark.extra_info['queries'] == (0 if snapshot else 300)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+@pytest.mark.benchmark(group=GROUP_NAME)
+@pytest.mark.parametrize('columns', (False, True), ids=('rows', 'columns'))
+def test_query_projections(benchmark, columns):
+    """Benchmark for querying scalar projections of nodes, returned as rows or as batches of columns."""
+    for _ in range(100):
+        get_data_node()
+    builder = QueryBuilder().append(Data, tag='data', project=['id', 'uuid', 'label', 'attributes.1'])
+
+    def _run():
+        if columns:
+            return sum(len(batch['data.id']) for batch in builder.iter_columns(batch_size=50))
+        return len(builder.all(batch_size=50))
+
+    count = benchmark.pedantic(_run, iterations=1, rounds=50, warmup_rounds=1)
+    assert count == 100
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+@pytest.mark.benchmark(group=GROUP_NAME)
+@pytest.mark.parametrize('plan_cache', (False, True), ids=('build', 'plan-cache'))
+def test_get_link_triples(benchmark, plan_cache):
+    """Benchmark for querying the incoming links of nodes, with and without reusing the query from the plan cache."""
+    from aiida.orm.implementation.sqlalchemy.querybuilder import SqlaQueryBuilder
+
+    nodes = [get_data_node()[1]['node'] for _ in range(10)]
+
+    def _run():
+        triples = []
+        for node in nodes:
+            if not plan_cache:
+                SqlaQueryBuilder.clear_plan_cache()
+            triples.append(node.get_incoming().all())
+        return triples
+
+    triples = benchmark.pedantic(_run, iterations=1, rounds=50, warmup_rounds=1)
+    assert len(triples) == 10
@@ -185,6 +185,32 @@ class TestVerdiProcess(AiidaTestCase):
             self.assertClickResultNoException(result)
             self.assertEqual(len(get_result_lines(result)), 1)
 
+    def test_list_page_size(self):
+        """Test that the list command retrieving the entries in pages gives the same result."""
+        for arguments in (['-a'], ['-a', '-O', 'id', '-D', 'desc'], ['-a', '-D', 'desc', '-l', '5'], ['-S', 'created']):
+            options = ['-r', '-P', 'pk', 'process_state'] + arguments
+            expected = self.cli_runner.invoke(cmd_process.process_list, options)
+            self.assertClickResultNoException(expected)
+
+            for page_size in ['1', '2', '5', '100']:
+                result = self.cli_runner.invoke(cmd_process.process_list, options + ['--page-size', page_size])
+                self.assertClickResultNoException(result)
+                # The width of the columns is determined by the first page, so only compare the values
+                self.assertEqual([line.split() for line in get_result_lines(result)],
+                                 [line.split() for line in get_result_lines(expected)])
+
+        result = self.cli_runner.invoke(cmd_process.process_list, ['--page-size', '5'])
+        self.assertClickResultNoException(result)
+        self.assertIn('Total results: 6', result.output)
+
+    def test_list_count_approximate(self):
+        """Test that the list command reports the approximate number of all matching entries."""
+        result = self.cli_runner.invoke(
+            cmd_process.process_list, ['-a', '-l', '2', '--page-size', '1', '--count-approximate']
+        )
+        self.assertClickResultNoException(result)
+        self.assertIn('Total results: 2 of approximately ', result.output)
+
     def test_process_show(self):
         """Test verdi process show"""
         workchain_one = WorkChainNode()
@@ -458,3 +484,33 @@ def test_pause_play_kill(cmd_try_all, run_cli_command):
     result = run_cli_command(process_kill, ['--wait', str(calc.pk)])
     assert calc.is_terminated
     assert calc.is_killed
+
+
+@pytest.mark.parametrize(
+    'plan, expected', (
+        ('Seq Scan on db_dbnode db_dbnode_1  (cost=0.00..1.10 rows=42 width=4)', 42),
+        ('Result  (cost=0.00..0.01)', 2),
+        (NotImplementedError, 2),
+    )
+)
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_get_count_approximate(monkeypatch, plan, expected):
+    """Test that the approximate count is parsed from the query plan, and falls back to the exact count otherwise."""
+    from aiida.cmdline.utils.query.calculation import CalculationQueryBuilder
+    from aiida.orm import QueryBuilder
+
+    def analyze_query(self, execute=True, verbose=False):  # pylint: disable=unused-argument
+        assert not execute
+        if plan is NotImplementedError:
+            raise NotImplementedError
+        return plan
+
+    for _ in range(2):
+        WorkFunctionNode().store()
+
+    builder = CalculationQueryBuilder()
+    assert builder.get_count() == 2
+    assert builder.get_count(approximate=True) >= 0
+
+    monkeypatch.setattr(QueryBuilder, 'analyze_query', analyze_query)
+    assert builder.get_count(approximate=True) == expected
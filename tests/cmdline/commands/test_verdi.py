@@ -63,6 +63,22 @@ def test_verbosity_options():
             # There are not subcommands so this is a leaf command, verify it has the verbosity option
             assert 'verbosity' in [p.name for p in command.params], f'`{command.name} does not have verbosity option'
 
+    # The sub commands of ``verdi`` are only registered once they are loaded
+    for name in cmd_verdi.VERDI_COMMANDS:
+        cmd_verdi.verdi.load_command(name)
+
     leaf_commands = []
     ctx = click.Context(cmd_verdi.verdi)
     recursively_check_leaf_commands(ctx, cmd_verdi.verdi, leaf_commands)
+
+
+def test_lazy_commands():
+    """Test that the lazily loaded commands of ``verdi`` are registered by their module with the declared short help."""
+    ctx = click.Context(cmd_verdi.verdi)
+
+    assert set(cmd_verdi.VERDI_COMMANDS).issubset(cmd_verdi.verdi.list_commands(ctx))
+
+    for name, (module, short_help) in cmd_verdi.VERDI_COMMANDS.items():
+        command = cmd_verdi.verdi.get_command(ctx, name)
+        assert command.callback.__module__.startswith(module)
+        assert command.get_short_help_str(limit=1000) == short_help
@@ -16,6 +16,7 @@ from datetime import datetime
 from decimal import Decimal
 import hashlib
 import itertools
+from unittest import mock
 import uuid
 
 import numpy as np
@@ -183,6 +184,45 @@ class MakeHashTest(unittest.TestCase):
         )  # pylint: disable=no-member
         self.assertEqual(make_hash(np.int64(42)), '9468692328de958d7a8039e8a2eb05cd6888b7911bbc3794d0dfebd8df3482cd')  # pylint: disable=no-member
 
+    def test_numeric_sequences(self):
+        """Test that sequences of numbers, which are hashed in bulk, have the same hash as when hashed per element."""
+        from aiida.common import hashing
+
+        special = [float('inf'), float('-inf'), float('nan')]
+        sequences = [
+            [0., -0., 1.5, -2.25e-300, 1e300] + special,
+            [1, -2, 10**40, 0],
+            (1, 2.5, -3, 4.),
+            [1, True, None, 2.],
+            [[1., 2., 3.], [4., 5., 6.]],
+        ]
+        hashes = [make_hash(sequence) for sequence in sequences]
+
+        with mock.patch.object(hashing, '_bulk_digests', return_value=None):
+            self.assertEqual(hashes, [make_hash(sequence) for sequence in sequences])
+
+        self.assertEqual(make_hash([-0.]), make_hash([0.]))
+        self.assertEqual(make_hash([3.141, 42]), make_hash([Decimal('3.141'), np.int64(42)]))  # pylint: disable=no-member
+        self.assertNotEqual(make_hash([1, 0]), make_hash([True, False]))
+
+    def test_numpy_arrays(self):
+        """Test that numpy arrays have the same hash as the nested list of their elements."""
+        arrays = [
+            np.arange(24, dtype=float).reshape(2, 3, 4) / 7.,
+            np.arange(-5, 5),
+            np.array([[1, 2]], dtype=np.uint8),
+            np.array([0.1, 0.2], dtype=np.float32),
+            np.array(3.5),
+            np.zeros((2, 0)),
+            np.array([True, False]),
+            np.array(['a', 'b']),
+            np.array([1 + 2j]),
+        ]
+
+        for array in arrays:
+            with self.subTest(array=array):
+                self.assertEqual(make_hash(array), make_hash(array.tolist()))
+
     def test_decimal(self):
         self.assertEqual(
             make_hash(Decimal('3.141')), 'b3302aad550413e14fe44d5ead10b3aeda9884055fca77f9368c48517916d4be'
@@ -179,3 +179,33 @@ def test_upload_local_copy_list(fixture_sandbox, aiida_localhost, aiida_local_co
     expected_hierarchy['files']['file_x'] = 'content_x'
     expected_hierarchy['files']['file_y'] = 'content_y'
     assert expected_hierarchy == written_hierarchy
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_submit_calculations(aiida_localhost, tmp_path):
+    """Test that ``submit_calculations`` submits the calculations without a job id in batch and sets their job ids."""
+    from aiida.orm import CalcJobNode
+
+    nodes = []
+
+    for index in range(3):
+        workdir = tmp_path / str(index)
+        workdir.mkdir()
+        (workdir / 'aiida.sh').write_text('exit 0\n')
+
+        node = CalcJobNode(computer=aiida_localhost)
+        node.set_remote_workdir(str(workdir))
+        node.set_option('submit_script_filename', 'aiida.sh')
+        nodes.append(node.store())
+
+    # A calculation that already has a job id should not be submitted again
+    nodes[0].set_job_id('1234')
+
+    with LocalTransport() as transport:
+        results = execmanager.submit_calculations(nodes, transport)
+
+    assert results[0] == '1234'
+    assert results[1].isdigit()
+    assert results[2].isdigit()
+    assert results[1] != results[2]
+    assert [node.get_job_id() for node in nodes] == results
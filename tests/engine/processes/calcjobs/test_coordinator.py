@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.engine.processes.calcjobs.coordinator` module."""
+import time
+
+import pytest
+
+from aiida.engine.processes.calcjobs.coordinator import JobsPollCoordinator
+from aiida.schedulers.datastructures import JobInfo, JobState
+
+
+@pytest.fixture
+def filepath(tmp_path):
+    """Return the path of the database shared by the coordinators."""
+    return tmp_path / 'jobs.sqlite'
+
+
+def get_job_info(job_id, job_state=JobState.RUNNING):
+    """Return a `JobInfo` instance."""
+    job_info = JobInfo()
+    job_info.job_id = job_id
+    job_info.job_state = job_state
+    return job_info
+
+
+def test_acquire(filepath):
+    """Test that only one coordinator at a time can acquire the lease for a given authinfo."""
+    coordinator_a = JobsPollCoordinator(filepath)
+    coordinator_b = JobsPollCoordinator(filepath)
+
+    assert coordinator_a.acquire(1, minimum_interval=0)
+    assert coordinator_a.acquire(1, minimum_interval=0)
+    assert not coordinator_b.acquire(1, minimum_interval=0)
+    assert coordinator_b.acquire(2, minimum_interval=0)
+
+    coordinator_a.release(1)
+    assert coordinator_b.acquire(1, minimum_interval=0)
+
+
+def test_acquire_expired_lease(filepath):
+    """Test that the lease can be acquired by another coordinator once it expired."""
+    coordinator_a = JobsPollCoordinator(filepath, lease_duration=0)
+    coordinator_b = JobsPollCoordinator(filepath)
+
+    assert coordinator_a.acquire(1, minimum_interval=0)
+    assert coordinator_b.acquire(1, minimum_interval=0)
+
+
+def test_publish(filepath):
+    """Test that the snapshot published by one coordinator is returned by the others."""
+    coordinator_a = JobsPollCoordinator(filepath)
+    coordinator_b = JobsPollCoordinator(filepath)
+
+    assert coordinator_b.get_snapshot(1) is None
+
+    polled_at = time.time()
+    assert coordinator_a.acquire(1, minimum_interval=60)
+    coordinator_a.publish(1, polled_at, {'10': get_job_info('10'), '11': get_job_info('11', JobState.QUEUED)})
+
+    snapshot_polled_at, jobs = coordinator_b.get_snapshot(1)
+    assert snapshot_polled_at == polled_at
+    assert sorted(jobs) == ['10', '11']
+    assert jobs['11'].job_state == JobState.QUEUED
+
+    # The minimum interval since the last snapshot has not yet elapsed
+    assert not coordinator_a.acquire(1, minimum_interval=60)
+    assert not coordinator_b.acquire(1, minimum_interval=60)
+    assert coordinator_b.acquire(1, minimum_interval=0)
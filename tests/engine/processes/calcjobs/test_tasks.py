@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+# pylint: disable=redefined-outer-name
+"""Tests for the :mod:`aiida.engine.processes.calcjobs.tasks` module."""
+import asyncio
+
+import pytest
+
+from aiida.common.datastructures import CalcJobState
+from aiida.common.exceptions import TransportTaskException
+from aiida.engine.daemon import execmanager
+from aiida.engine.processes.calcjobs import tasks
+from aiida.engine.processes.calcjobs.manager import JobManager
+from aiida.engine.transports import TransportQueue
+from aiida.engine.utils import InterruptableFuture
+from aiida.orm import CalcJobNode
+from aiida.schedulers import SchedulerError
+
+
+@pytest.fixture
+def job_manager():
+    """Return a ``JobManager`` with a transport queue on the current event loop."""
+    return JobManager(TransportQueue(asyncio.get_event_loop()))
+
+
+@pytest.fixture
+def retry_options(monkeypatch):
+    """Make the submit task retry a failed submission once without waiting."""
+    options = {tasks.RETRY_INTERVAL_OPTION: 0.01, tasks.MAX_ATTEMPTS_OPTION: 2}
+    monkeypatch.setattr(tasks, 'get_config_option', options.__getitem__)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_task_submit_job(aiida_localhost, job_manager, monkeypatch):
+    """Test that concurrent ``task_submit_job`` calls are submitted in a single batch and set the scheduler state."""
+    batches = []
+
+    def submit_calculations(calculations, transport):  # pylint: disable=unused-argument
+        batches.append([calculation.pk for calculation in calculations])
+        for calculation in calculations:
+            calculation.set_job_id(str(calculation.pk))
+        return [str(calculation.pk) for calculation in calculations]
+
+    monkeypatch.setattr(execmanager, 'submit_calculations', submit_calculations)
+
+    nodes = [CalcJobNode(computer=aiida_localhost).store() for _ in range(2)]
+    submissions = [tasks.task_submit_job(node, job_manager, InterruptableFuture()) for node in nodes]
+    results = asyncio.get_event_loop().run_until_complete(asyncio.gather(*submissions))
+
+    assert results == [str(node.pk) for node in nodes]
+    assert batches == [[node.pk for node in nodes]]
+    assert all(node.get_state() == CalcJobState.WITHSCHEDULER for node in nodes)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean', 'retry_options')
+def test_task_submit_job_retry(aiida_localhost, job_manager, monkeypatch):
+    """Test that ``task_submit_job`` retries a submission that failed within its batch."""
+    results = [[SchedulerError('submission failed')], ['1234']]
+    monkeypatch.setattr(execmanager, 'submit_calculations', lambda calculations, transport: results.pop(0))
+
+    node = CalcJobNode(computer=aiida_localhost).store()
+    submission = tasks.task_submit_job(node, job_manager, InterruptableFuture())
+
+    assert asyncio.get_event_loop().run_until_complete(submission) == '1234'
+    assert node.get_state() == CalcJobState.WITHSCHEDULER
+
+
+@pytest.mark.usefixtures('aiida_profile_clean', 'retry_options')
+def test_task_submit_job_failed(aiida_localhost, job_manager, monkeypatch):
+    """Test that ``task_submit_job`` raises once the submission failed for the maximum number of attempts."""
+    monkeypatch.setattr(
+        execmanager, 'submit_calculations', lambda calculations, transport: [SchedulerError('submission failed')]
+    )
+
+    node = CalcJobNode(computer=aiida_localhost).store()
+    submission = tasks.task_submit_job(node, job_manager, InterruptableFuture())
+
+    with pytest.raises(TransportTaskException):
+        asyncio.get_event_loop().run_until_complete(submission)
+
+    assert node.get_state() is None
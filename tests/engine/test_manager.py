@@ -10,12 +10,17 @@
 """Tests for the classes in `aiida.engine.processes.calcjobs.manager`."""
 
 import asyncio
+import contextlib
 import time
 
+import pytest
+
 from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.daemon import execmanager
 from aiida.engine.processes.calcjobs.manager import JobManager, JobsList
 from aiida.engine.transports import TransportQueue
-from aiida.orm import AuthInfo, User
+from aiida.orm import AuthInfo, CalcJobNode, User
+from aiida.schedulers import SchedulerError
 
 
 class TestJobManager(AiidaTestCase):
@@ -75,3 +80,140 @@ class TestJobsList(AiidaTestCase):
         last_updated = time.time()
         jobs_list = JobsList(self.auth_info, self.transport_queue, last_updated=last_updated)
         self.assertEqual(jobs_list.last_updated, last_updated)
+
+    def test_shared_snapshot(self):
+        """Test that the jobs list uses the snapshot published by another daemon worker through the coordinator."""
+        import tempfile
+
+        from aiida.engine.processes.calcjobs.coordinator import JobsPollCoordinator
+        from aiida.schedulers.datastructures import JobInfo, JobState
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            filepath = f'{dirpath}/jobs.sqlite'
+            jobs_list = JobsList(self.auth_info, self.transport_queue, coordinator=JobsPollCoordinator(filepath))
+
+            with jobs_list.request_job_info_update('10') as request_running, \
+                jobs_list.request_job_info_update('11') as request_finished:
+
+                job_info = JobInfo()
+                job_info.job_id = '10'
+                job_info.job_state = JobState.RUNNING
+
+                other_worker = JobsPollCoordinator(filepath)
+                self.assertTrue(other_worker.acquire(self.auth_info.pk, minimum_interval=0))
+                other_worker.publish(self.auth_info.pk, time.time(), {'10': job_info})
+
+                self.loop.run_until_complete(asyncio.wait_for(request_running, timeout=5))
+
+                self.assertEqual(request_running.result().job_state, JobState.RUNNING)
+                self.assertIsNone(request_finished.result())
+
+    def test_shared_snapshot_does_not_block(self):
+        """Test that waiting for the database of the coordinator does not block the other tasks on the event loop."""
+        import tempfile
+
+        from aiida.engine.processes.calcjobs.coordinator import JobsPollCoordinator
+
+        with tempfile.TemporaryDirectory() as dirpath:
+            coordinator = JobsPollCoordinator(f'{dirpath}/jobs.sqlite')
+            jobs_list = JobsList(self.auth_info, self.transport_queue, coordinator=coordinator)
+
+            def get_snapshot(authinfo_id):  # pylint: disable=unused-argument
+                # Simulate another worker holding the lock of the database
+                time.sleep(0.5)
+                return time.time(), {}
+
+            coordinator.get_snapshot = get_snapshot
+            ticks = []
+
+            async def tick(task):
+                while not task.done():
+                    ticks.append(time.time())
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.ensure_future(jobs_list._get_jobs_from_coordinator())  # pylint: disable=protected-access
+            self.loop.run_until_complete(asyncio.gather(task, tick(task)))
+
+            self.assertEqual(task.result(), {})
+            self.assertGreater(len(ticks), 10)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_request_job_submission(aiida_localhost, monkeypatch):
+    """Test that the submissions requested while waiting for the transport are submitted together in a single batch."""
+    batches = []
+
+    def submit_calculations(calculations, transport):  # pylint: disable=unused-argument
+        batches.append([calculation.pk for calculation in calculations])
+        return [SchedulerError('submission failed') if index == 1 else str(index) for index in range(len(calculations))]
+
+    monkeypatch.setattr(execmanager, 'submit_calculations', submit_calculations)
+
+    loop = asyncio.get_event_loop()
+    jobs_list = JobsList(aiida_localhost.get_authinfo(User.objects.get_default()), TransportQueue(loop))
+    nodes = [CalcJobNode(computer=aiida_localhost).store() for _ in range(4)]
+
+    with contextlib.ExitStack() as stack:
+        requests = [stack.enter_context(jobs_list.request_job_submission(node)) for node in nodes[:3]]
+
+        # A request whose context is left before the submission is cancelled and should not be submitted
+        with jobs_list.request_job_submission(nodes[3]) as cancelled:
+            pass
+
+        loop.run_until_complete(asyncio.wait(requests, timeout=5))
+
+    assert cancelled.cancelled()
+    assert batches == [[node.pk for node in nodes[:3]]]
+    assert requests[0].result() == '0'
+    assert isinstance(requests[1].exception(), SchedulerError)
+    assert requests[2].result() == '2'
+
+    # Without any other pending requests, a new request is submitted straight away in a batch of its own
+    with jobs_list.request_job_submission(nodes[3]) as request:
+        loop.run_until_complete(asyncio.wait_for(request, timeout=5))
+
+    assert batches[-1] == [nodes[3].pk]
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_request_job_submission_open_transport(aiida_localhost, monkeypatch):
+    """Test that the submissions requested within the batch window are submitted together if the transport is open.
+
+    The request of a transport that is kept open resolves straight away, so the requests made after the first one are
+    only part of the same batch because the submission waits for the batch window.
+    """
+    batches = []
+
+    def submit_calculations(calculations, transport):  # pylint: disable=unused-argument
+        batches.append([calculation.pk for calculation in calculations])
+        return [str(calculation.pk) for calculation in calculations]
+
+    monkeypatch.setattr(execmanager, 'submit_calculations', submit_calculations)
+
+    authinfo = aiida_localhost.get_authinfo(User.objects.get_default())
+    transport_queue = TransportQueue(keep_alive_timeout=10)
+    loop = transport_queue.loop
+    jobs_list = JobsList(authinfo, transport_queue, submit_batch_window=0.5)
+    nodes = [CalcJobNode(computer=aiida_localhost).store() for _ in range(4)]
+
+    async def open_transport():
+        with transport_queue.request_transport(authinfo) as request:
+            await request
+
+    async def submit(node, delay):
+        await asyncio.sleep(delay)
+        with jobs_list.request_job_submission(node) as request:
+            return await request
+
+    try:
+        loop.run_until_complete(open_transport())
+        assert transport_queue.metrics['idle'] == 1
+
+        submissions = [submit(node, 0.05 * index) for index, node in enumerate(nodes)]
+        results = loop.run_until_complete(asyncio.wait_for(asyncio.gather(*submissions), timeout=5))
+    finally:
+        transport_queue.close()
+
+    assert results == [str(node.pk) for node in nodes]
+    assert batches == [[node.pk for node in nodes]]
+    assert transport_queue.metrics['opened'] == 1
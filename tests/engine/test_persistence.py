@@ -67,3 +67,21 @@ class TestAiiDAPersister(AiidaTestCase):
 
         self.persister.delete_checkpoint(process.pid)
         self.assertEqual(process.node.checkpoint, None)
+
+    def test_checkpoint_formats(self):
+        """Test that checkpoints are written in the configured format and can be loaded in either format."""
+        from aiida.orm.utils import serialize
+
+        process = DummyProcess()
+
+        for checkpoint_format in AiiDAPersister.CHECKPOINT_FORMATS:
+            persister = AiiDAPersister(checkpoint_format=checkpoint_format)
+            bundle_saved = persister.save_checkpoint(process)
+            is_binary = serialize.is_serialized_binary(process.node.checkpoint)
+            self.assertEqual(is_binary, checkpoint_format == 'pickle')
+            self.assertDictEqual(bundle_saved, self.persister.load_checkpoint(process.node.pk))
+
+    def test_invalid_checkpoint_format(self):
+        """Test that an invalid checkpoint format raises."""
+        with self.assertRaises(ValueError):
+            AiiDAPersister(checkpoint_format='invalid')
@@ -10,12 +10,15 @@
 # pylint: disable=redefined-outer-name
 """Module to test process runners."""
 import asyncio
+import functools
 import threading
 
 import plumpy
 import pytest
 
+from aiida.common.exceptions import NotExistent
 from aiida.engine import Process
+from aiida.engine.runners import ProcessFinishRegistry
 from aiida.manage import get_manager
 from aiida.orm import WorkflowNode
 
@@ -44,6 +47,19 @@ def the_hans_klok_comeback(loop):
     loop.stop()
 
 
+class BroadcastCommunicator:
+    """Communicator that only keeps track of the broadcast subscribers that are added to it."""
+
+    def __init__(self):
+        self.subscribers = {}
+
+    def add_broadcast_subscriber(self, subscriber, identifier):
+        self.subscribers[identifier] = subscriber
+
+    def remove_broadcast_subscriber(self, identifier):
+        del self.subscribers[identifier]
+
+
 @pytest.mark.requires_rmq
 @pytest.mark.usefixtures('aiida_profile_clean')
 def test_call_on_process_finish(create_runner):
@@ -71,3 +87,77 @@ def test_call_on_process_finish(create_runner):
 
     assert not future.exception()
     assert future.result()
+
+
+@pytest.mark.requires_rmq
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_call_on_process_finish_many(create_runner):
+    """Test that the callbacks of many processes are dispatched by a single registry, including terminated ones."""
+    runner = create_runner()
+    loop = runner.loop
+    processes = [Proc(runner=runner) for _ in range(5)]
+    terminated = WorkflowNode()
+    terminated.set_process_state(plumpy.ProcessState.FINISHED)
+    terminated.store()
+    called = []
+
+    def callback(pk):
+        called.append(pk)
+        if len(called) == len(processes) + 2:
+            loop.stop()
+
+    for proc in processes:
+        runner.call_on_process_finish(proc.node.pk, functools.partial(callback, proc.node.pk))
+
+    runner.call_on_process_finish(terminated.pk, functools.partial(callback, terminated.pk))
+    runner.call_on_process_finish(terminated.pk, functools.partial(callback, terminated.pk))
+
+    registry = runner._process_finish_registry  # pylint: disable=protected-access
+    assert isinstance(registry, ProcessFinishRegistry)
+    assert registry.pending == {proc.node.pk for proc in processes} | {terminated.pk}
+
+    for proc in processes:
+        loop.create_task(proc.step_until_terminated())
+
+    loop.call_later(5, the_hans_klok_comeback, loop)
+    loop.run_forever()
+
+    assert sorted(called) == sorted([proc.node.pk for proc in processes] + [terminated.pk] * 2)
+    assert not registry.pending
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_process_finish_registry_close():
+    """Test that closing the registry removes its broadcast subscriber from the communicator."""
+    loop = asyncio.new_event_loop()
+    communicator = BroadcastCommunicator()
+    registry = ProcessFinishRegistry(loop, communicator, poll_interval=60)
+    node = WorkflowNode().store()
+
+    registry.add(node.pk, lambda: None)
+    registry.add(node.pk, lambda: None)
+    assert len(communicator.subscribers) == 1
+
+    registry.close()
+    assert not communicator.subscribers
+
+    # The registry subscribes again if a callback is added after it was closed
+    registry.add(node.pk, lambda: None)
+    assert len(communicator.subscribers) == 1
+    registry.close()
+    loop.close()
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_process_finish_registry_not_existent():
+    """Test that adding a callback for a process that does not exist raises straight away."""
+    loop = asyncio.new_event_loop()
+    communicator = BroadcastCommunicator()
+    registry = ProcessFinishRegistry(loop, communicator, poll_interval=60)
+
+    with pytest.raises(NotExistent):
+        registry.add(-1, lambda: None)
+
+    assert not registry.pending
+    assert not communicator.subscribers
+    loop.close()
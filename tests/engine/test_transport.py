@@ -133,3 +133,47 @@ class TestTransportQueue(AiidaTestCase):
 
         finally:
             transport_class._DEFAULT_SAFE_OPEN_INTERVAL = original_interval  # pylint: disable=protected-access
+
+    def test_keep_alive(self):
+        """Test that an unused transport is kept open and reused within the keep alive timeout."""
+        queue = TransportQueue(keep_alive_timeout=0.2)
+        loop = queue.loop
+
+        async def test():
+            with queue.request_transport(self.authinfo) as request:
+                return await request
+
+        trans1 = loop.run_until_complete(test())
+        self.assertTrue(trans1.is_open)
+        self.assertEqual(queue.metrics['idle'], 1)
+
+        trans2 = loop.run_until_complete(test())
+        self.assertIs(trans1, trans2)
+        self.assertEqual(queue.metrics['opened'], 1)
+        self.assertEqual(queue.metrics['reused'], 1)
+
+        loop.run_until_complete(asyncio.sleep(0.3))
+        self.assertFalse(trans2.is_open)
+        self.assertEqual(queue.metrics['closed_idle'], 1)
+        self.assertEqual(queue.metrics['open'], 0)
+
+    def test_keep_alive_health_check(self):
+        """Test that an unused transport that is no longer alive is replaced by a new one."""
+        queue = TransportQueue(keep_alive_timeout=10)
+        loop = queue.loop
+
+        async def test():
+            with queue.request_transport(self.authinfo) as request:
+                return await request
+
+        trans1 = loop.run_until_complete(test())
+        trans1.close()
+
+        trans2 = loop.run_until_complete(test())
+        self.assertIsNot(trans1, trans2)
+        self.assertTrue(trans2.is_open)
+        self.assertEqual(queue.metrics['health_check_failed'], 1)
+
+        queue.close()
+        self.assertFalse(trans2.is_open)
+        self.assertEqual(queue.metrics['open'], 0)
@@ -16,7 +16,13 @@ import pytest
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.engine import calcfunction, workfunction
-from aiida.engine.utils import InterruptableFuture, exponential_backoff_retry, interruptable_task, is_process_function
+from aiida.engine.utils import (
+    InterruptableFuture,
+    ProcessStateChangeTimestamps,
+    exponential_backoff_retry,
+    interruptable_task,
+    is_process_function,
+)
 
 ITERATION = 0
 MAX_ITERATIONS = 3
@@ -225,3 +231,46 @@ class TestInterruptableTask():
 
         result = await task_fut
         assert result == 'NOT ME!!!'
+
+
+@pytest.mark.asyncio
+async def test_process_state_change_timestamps():
+    """Test that ``ProcessStateChangeTimestamps`` coalesces the writes of the settings within the interval."""
+
+    class Backend:
+        """Backend that records the global variables that are set."""
+
+        def __init__(self):
+            self.written = []
+
+        def set_global_variable(self, key, value, description):  # pylint: disable=unused-argument
+            self.written.append((key, value))
+
+    backend = Backend()
+    loop = asyncio.get_event_loop()
+    timestamps = ProcessStateChangeTimestamps()
+
+    # The first change is written immediately, the subsequent ones within the interval are coalesced
+    for value in ('a', 'b', 'c'):
+        timestamps.set(backend, 'key', value, 'description', 0.1, loop)
+    timestamps.set(backend, 'other', 'a', 'description', 0.1, loop)
+    assert backend.written == [('key', 'a'), ('other', 'a')]
+
+    await asyncio.sleep(0.2)
+    assert backend.written == [('key', 'a'), ('other', 'a'), ('key', 'c')]
+
+    # Pending changes are written when flushing
+    timestamps.set(backend, 'key', 'd', 'description', 60, loop)
+    timestamps.set(backend, 'key', 'e', 'description', 60, loop)
+    assert backend.written[-1] == ('key', 'c')
+    timestamps.flush()
+    assert backend.written[-1] == ('key', 'e')
+
+    # Pending changes are written together with a change that is flushed
+    timestamps.set(backend, 'other', 'b', 'description', 60, loop)
+    timestamps.set(backend, 'key', 'f', 'description', 60, loop, flush=True)
+    assert backend.written[-2:] == [('other', 'b'), ('key', 'f')]
+
+    # Without an interval, every change is written
+    timestamps.set(backend, 'key', 'g', 'description', 0, loop)
+    assert backend.written[-1] == ('key', 'g')
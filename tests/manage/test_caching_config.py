@@ -265,6 +265,35 @@ def test_disable_caching_global(configure_caching):
             assert not get_use_cache(identifier=specific_identifier)
 
 
+def test_memoized_decisions(configure_caching):
+    """Check that the memoized decisions are invalidated by the context managers and changes of the configuration."""
+    from aiida.manage.configuration import get_config
+
+    identifier = 'aiida.calculations:core.arithmetic.add'
+
+    with configure_caching({'default_enabled': False, 'enabled_for': ['aiida.calculations:*']}):
+        assert get_use_cache(identifier=identifier)
+
+        with disable_caching(identifier=identifier):
+            assert not get_use_cache(identifier=identifier)
+
+        assert get_use_cache(identifier=identifier)
+
+        config = get_config()
+        config.set_option('caching.disabled_for', ['aiida.calculations:core.*'])
+        assert not get_use_cache(identifier=identifier)
+
+        config.set_option('caching.disabled_for', ['aiida.calculations:*'])
+
+        # The ambiguous configuration should raise for each call and not just the first one
+        for _ in range(2):
+            with pytest.raises(exceptions.ConfigurationError):
+                get_use_cache(identifier=identifier)
+
+        config.unset_option('caching.disabled_for')
+        assert get_use_cache(identifier=identifier)
+
+
 @pytest.mark.parametrize(
     'identifier', [
         'aiida.spam:Ni', 'aiida.calculations:With:second_separator', 'aiida.sp*:Ni', 'aiida.sp*!bar',
@@ -8,12 +8,16 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Unit tests for the ORM Backend class."""
+import contextlib
+
 import pytest
+from sqlalchemy import event, text
 
 from aiida import orm
 from aiida.common import exceptions
 from aiida.common.links import LinkType
 from aiida.orm.entities import EntityTypes
+from aiida.orm.implementation.sqlalchemy import utils
 
 
 class TestBackend:
@@ -170,3 +174,50 @@ class TestBackend:
             orm.Node.objects.get(id=node_pk)
         assert len(calc_node.get_outgoing().all()) == 0
         assert len(group.nodes) == 0
+
+    @contextlib.contextmanager
+    def count_queries(self):
+        """Return a list that records the SQL statements that are executed within the context."""
+        statements = []
+        engine = self.backend.get_session().bind
+
+        def record(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', record)
+
+    def test_snapshot(self):
+        """Test that fields of immutable nodes are served from the loaded row in snapshot mode until refreshed."""
+        data = orm.Int(1).store()
+        sealed = orm.CalcFunctionNode().store()
+        sealed.seal()
+        unsealed = orm.WorkflowNode().store()
+
+        with self.count_queries() as statements:
+            for _ in range(3):
+                for node in (data, sealed, unsealed):
+                    assert node.label == ''
+                    assert isinstance(node.attributes, dict)
+        assert len(statements) >= 18
+
+        with self.backend.snapshot():
+            with self.count_queries() as statements:
+                for _ in range(3):
+                    for node in (data, sealed, unsealed):
+                        assert node.label == ''
+                        assert isinstance(node.attributes, dict)
+            # Only the fields of the unsealed process node are still refreshed
+            assert len(statements) == 6
+
+            session = self.backend.get_session()
+            session.execute(text('UPDATE db_dbnode SET label = :label WHERE id = :pk'), {'label': 'new', 'pk': data.pk})
+            assert data.label == ''
+
+            data.refresh()
+            assert data.label == 'new'
+
+        assert not self.backend.get_session().info[utils.SNAPSHOT_SESSION_KEY]
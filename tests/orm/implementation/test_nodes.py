@@ -771,3 +771,19 @@ class TestBackendNode(AiidaTestCase):
         # Reload the node yet again and verify that the `attribute_three` attribute is still there
         rereloaded = self.backend.nodes.get(node.pk)
         self.assertIn('attribute_three', rereloaded.attributes.keys())
+
+    def test_iter_hash_matches(self):
+        """Test the `BackendNodeCollection.iter_hash_matches` method."""
+        node_type = 'data.core.int.Int.'
+        matching = self.backend.nodes.create(node_type=node_type, user=self.user).store()
+        matching.set_extra('_aiida_hash', 'abc')
+        invalid = self.backend.nodes.create(node_type=node_type, user=self.user).store()
+        invalid.set_extra_many({'_aiida_hash': 'abc', '_aiida_valid_cache': False})
+        other_hash = self.backend.nodes.create(node_type=node_type, user=self.user).store()
+        other_hash.set_extra('_aiida_hash', 'def')
+        other_type = self.backend.nodes.create(node_type='data.core.float.Float.', user=self.user).store()
+        other_type.set_extra('_aiida_hash', 'abc')
+
+        matches = list(self.backend.nodes.iter_hash_matches(node_type, 'abc'))
+        self.assertEqual([match.pk for match in matches], [matching.pk])
+        self.assertEqual(list(self.backend.nodes.iter_hash_matches(node_type, 'xyz')), [])
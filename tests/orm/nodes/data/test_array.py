@@ -28,3 +28,64 @@ def test_read_stored():
 
     loaded = load_node(node.uuid)
     assert numpy.array_equal(loaded.get_array('array'), array)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_set_array_npy_format():
+    """Test that ``set_array`` writes the array in the same format as ``numpy.save``."""
+    import io
+
+    for array in [numpy.arange(12).reshape(3, 4), numpy.asfortranarray(numpy.ones((3, 4))), numpy.arange(10)[::2]]:
+        node = ArrayData()
+        node.set_array('array', array)
+
+        expected = io.BytesIO()
+        numpy.save(expected, array, allow_pickle=False)
+        assert node.get_object_content('array.npy', mode='rb') == expected.getvalue()
+
+    with pytest.raises(ValueError):
+        ArrayData().set_array('array', numpy.array([None, 1]))
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_get_array_mmap_mode():
+    """Test the ``mmap_mode`` argument of ``ArrayData.get_array``."""
+    array = numpy.arange(24).reshape(4, 6)
+    node = ArrayData()
+    node.set_array('array', array)
+    node.store()
+
+    loaded = load_node(node.pk)
+    mapped = loaded.get_array('array', mmap_mode='r')
+    assert isinstance(mapped, numpy.memmap)
+    assert numpy.array_equal(mapped, array)
+    assert not loaded._cached_arrays  # pylint: disable=protected-access
+
+    with pytest.raises(ValueError):
+        loaded.get_array('array', mmap_mode='r+')
+
+    with pytest.raises(KeyError):
+        loaded.get_array('non_existent', mmap_mode='r')
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+@pytest.mark.parametrize('mappable', (True, False))
+@pytest.mark.parametrize(
+    'index', (0, -1, slice(1, 3), slice(None, None, -2), (slice(0, 2), 1), (2, slice(1, None)), Ellipsis)
+)
+def test_get_array_slice(monkeypatch, mappable, index):
+    """Test ``ArrayData.get_array_slice`` both for memory-mapped and streamed arrays."""
+    array = numpy.arange(60).reshape(5, 3, 4)
+    node = ArrayData()
+    node.set_array('array', array)
+    node.store()
+
+    loaded = load_node(node.pk)
+
+    if not mappable:
+        monkeypatch.setattr(loaded, '_get_array_filepath', lambda name: None)
+
+    assert numpy.array_equal(loaded.get_array_slice('array', index), array[index])
+
+    with pytest.raises(IndexError):
+        loaded.get_array_slice('array', 5)
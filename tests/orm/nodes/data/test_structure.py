@@ -8,8 +8,11 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Tests for StructureData-related functions."""
+import numpy
+import pytest
 
-from aiida.orm.nodes.data.structure import get_formula
+from aiida.orm import StructureData, load_node
+from aiida.orm.nodes.data.structure import Kind, Site, get_formula, has_ase
 
 
 def test_get_formula_hill():
@@ -23,3 +26,102 @@ def test_get_formula_hill():
     for symbol_list, expected_result in symbol_lists:
         assert get_formula(symbol_list, mode='hill', separator=' ') == expected_result
         assert get_formula(symbol_list, mode='hill_compact', separator=' ') == expected_result
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_site_arrays():
+    """Test that ``set_site_arrays`` results in the same sites as appending them, and ``get_site_arrays``."""
+    positions = numpy.random.rand(10, 3)
+    kind_indices = numpy.array([0, 1] * 5)
+
+    reference = StructureData(cell=numpy.eye(3) * 5)
+    structure = StructureData(cell=numpy.eye(3) * 5)
+
+    for target in (reference, structure):
+        target.append_kind(Kind(symbols='Fe', name='Fe1'))
+        target.append_kind(Kind(symbols='O'))
+
+    for position, index in zip(positions, kind_indices):
+        reference.append_site(Site(kind_name=reference.get_kind_names()[index], position=position))
+
+    structure.set_site_arrays(positions, kind_indices)
+    assert structure.attributes == reference.attributes
+    assert structure.get_site_kindnames() == reference.get_site_kindnames()
+    assert structure.get_composition() == {'Fe': 5, 'O': 5}
+
+    structure.store()
+    reference.store()
+    assert structure.get_hash() == reference.get_hash()
+
+    loaded = load_node(structure.pk)
+    loaded_positions, loaded_kind_indices = loaded.get_site_arrays()
+    assert numpy.array_equal(loaded_positions, positions)
+    assert numpy.array_equal(loaded_kind_indices, kind_indices)
+    assert not loaded_positions.flags.writeable
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+@pytest.mark.parametrize(
+    'positions, kind_indices', (
+        ([[0., 0.]], [0]),
+        ([[0., 0., 0.]], [1]),
+        ([[0., 0., 0.]], [0, 0]),
+        ([[0., 0., 0.]], [0.5]),
+    )
+)
+def test_set_site_arrays_invalid(positions, kind_indices):
+    """Test that ``set_site_arrays`` raises for invalid positions or kind indices."""
+    structure = StructureData()
+    structure.append_kind(Kind(symbols='Fe'))
+
+    with pytest.raises(ValueError):
+        structure.set_site_arrays(positions, kind_indices)
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_validate_sites():
+    """Test the validation of the sites."""
+    from aiida.common.exceptions import ValidationError
+
+    structure = StructureData()
+    structure.append_atom(symbols='Fe', position=(0, 0, 0))
+    structure.set_attribute('sites', [{'position': (0, 0), 'kind_name': 'Fe'}])
+
+    with pytest.raises(ValidationError, match='Unable to validate the sites'):
+        structure.store()
+
+    structure.set_attribute('sites', [{'position': (0, 0, 0), 'kind_name': 'O'}])
+
+    with pytest.raises(ValidationError, match='A site has kind O'):
+        structure.store()
+
+
+@pytest.mark.skipif(not has_ase(), reason='Unable to import ase')
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_get_ase_kinds():
+    """Test that ``get_ase`` sets the symbols, masses and tags of the kinds of all sites."""
+    structure = StructureData(cell=numpy.eye(3) * 5)
+    structure.append_atom(symbols='Fe', position=(0, 0, 0), name='Fe1')
+    structure.append_atom(symbols='Fe', position=(1, 0, 0), name='Fe2')
+    structure.append_atom(symbols='O', position=(2, 0, 0), mass=20.)
+    structure.append_atom(symbols='Fe', position=(3, 0, 0), name='Fe1')
+
+    atoms = structure.get_ase()
+    assert atoms.get_chemical_symbols() == ['Fe', 'Fe', 'O', 'Fe']
+    assert atoms.get_tags().tolist() == [1, 2, 0, 1]
+    assert atoms.get_masses()[2] == 20.
+    assert numpy.allclose(atoms.get_positions()[:, 0], [0, 1, 2, 3])
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_kinds_changed_in_place():
+    """Test that kinds changed in place, without changing their number, are used to append atoms and sites."""
+    structure = StructureData()
+    structure.append_atom(symbols='Fe', position=(0, 0, 0))
+    structure.attributes['kinds'][0]['name'] = 'Fe1'
+
+    structure.append_atom(symbols='Fe', position=(1, 1, 1))
+    assert structure.get_site_kindnames() == ['Fe', 'Fe1']
+
+    with pytest.raises(ValueError, match="No kind with name 'Fe'"):
+        structure.append_site(Site(kind_name='Fe', position=(2, 2, 2)))
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida-core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the :mod:`aiida.orm.nodes.store` module."""
+from io import BytesIO
+
+import pytest
+
+from aiida.common import LinkType, exceptions
+from aiida.manage.caching import enable_caching
+from aiida.orm import CalcFunctionNode, CalculationNode, Data, Int, store_many
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_store_many():
+    """Test that ``store_many`` stores nodes, their links and their hash like ``Node.store``."""
+    calculation = CalculationNode()
+    inputs = [Int(value) for value in range(3)]
+    for index, node in enumerate(inputs):
+        calculation.add_incoming(node, link_type=LinkType.INPUT_CALC, link_label=f'input_{index}')
+
+    output = Data()
+    output.put_object_from_filelike(BytesIO(b'content'), 'file')
+
+    stored = store_many([calculation])
+
+    assert stored[-1] == calculation
+    assert set(stored) == set(inputs + [calculation])
+    assert all(node.is_stored for node in stored)
+    assert not calculation.has_cached_links()
+
+    output.add_incoming(calculation, link_type=LinkType.CREATE, link_label='output')
+    assert store_many([output]) == [output]
+
+    for node in stored + [output]:
+        assert node.get_extra(node._HASH_EXTRA_KEY) == node.get_hash()  # pylint: disable=protected-access
+
+    assert sorted(calculation.get_incoming().all_link_labels()) == ['input_0', 'input_1', 'input_2']
+    assert calculation.get_outgoing().one().node.uuid == output.uuid
+    assert output.get_object_content('file') == 'content'
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_store_many_ignores_stored():
+    """Test that ``store_many`` ignores nodes that are already stored and duplicates."""
+    stored = Data().store()
+    unstored = Data()
+
+    assert store_many([stored, unstored, unstored]) == [unstored]
+    assert store_many([]) == []
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_store_many_validation():
+    """Test that ``store_many`` validates the nodes and rolls back if any of them is invalid."""
+    from aiida.orm import Node
+
+    valid = Data()
+
+    with pytest.raises(exceptions.StoringNotAllowed):
+        store_many([valid, Node()])
+
+    assert not valid.is_stored
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_store_many_from_cache():
+    """Test that ``store_many`` uses the cache like ``Node.store``."""
+    source = CalcFunctionNode()
+    source.set_process_state('finished')
+    source.set_exit_status(0)
+    source.store()
+    source.seal()
+
+    target = CalcFunctionNode()
+    target.set_process_state('finished')
+    target.set_exit_status(0)
+
+    with enable_caching():
+        store_many([target])
+
+    assert target.is_stored
+    assert target.get_cache_source() == source.uuid
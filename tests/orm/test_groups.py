@@ -163,6 +163,42 @@ class TestGroups(AiidaTestCase):
         group.remove_nodes([node_01, node_02])
         self.assertEqual(set(_.pk for _ in nodes), set(_.pk for _ in group.nodes))
 
+    def test_add_remove_nodes_by_pk(self):
+        """Test adding and removing nodes by primary key, in chunks."""
+        nodes = [orm.Data().store() for _ in range(10)]
+        pks = [node.pk for node in nodes]
+        group = orm.Group(label='test_add_remove_nodes_by_pk').store()
+
+        self.assertEqual(group.add_nodes_by_pk(pks[:5], chunk_size=2), 5)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(pks[:5]))
+
+        # Nodes that are already in the group are ignored, as are generators of primary keys
+        self.assertEqual(group.add_nodes_by_pk(iter(pks), chunk_size=3), 5)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(pks))
+
+        self.assertEqual(group.remove_nodes_by_pk(pks[:7], chunk_size=4), 7)
+        self.assertEqual(group.remove_nodes_by_pk(pks[:7]), 0)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(pks[7:]))
+
+    def test_add_remove_nodes_by_pk_query(self):
+        """Test adding and removing nodes by primary key, defined by a ``QueryBuilder``."""
+        nodes = [orm.Int(value).store() for value in range(10)]
+        group = orm.Group(label='test_add_remove_nodes_by_pk_query').store()
+
+        builder = orm.QueryBuilder().append(orm.Int, filters={'attributes.value': {'<': 6}}, project='id')
+        self.assertEqual(group.add_nodes_by_pk(builder, chunk_size=4), 6)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(node.pk for node in nodes[:6]))
+
+        builder = orm.QueryBuilder().append(orm.Int, filters={'attributes.value': {'<': 3}}, project='id')
+        self.assertEqual(group.remove_nodes_by_pk(builder, chunk_size=2), 3)
+        self.assertEqual(set(_.pk for _ in group.nodes), set(node.pk for node in nodes[3:6]))
+
+        with self.assertRaises(ValueError):
+            group.add_nodes_by_pk(orm.QueryBuilder().append(orm.Int, project=['id', 'uuid']))
+
+        with self.assertRaises(ValueError):
+            group.add_nodes_by_pk(orm.QueryBuilder().append(orm.Group, project='id'))
+
     def test_clear(self):
         """Test the `clear` method to remove all nodes."""
         node_01 = orm.Data().store()
@@ -249,6 +249,33 @@ class TestBackendLog(AiidaTestCase):
         self.assertEqual(logs[0].message, message)
         self.assertEqual(logs[1].message, message2)
 
+    def test_db_log_handler_batched(self):
+        """Verify that the db log handler writes the records in bulk from the queue when ``batch_size`` is set."""
+        from aiida.orm.logs import ASCENDING, OrderSpecifier
+        from aiida.orm.utils.log import DBLogHandler
+
+        node = orm.CalculationNode().store()
+        handler = DBLogHandler(batch_size=10, flush_interval=60.)
+        logger = logging.getLogger('test_db_log_handler_batched')
+        logger.addHandler(handler)
+
+        try:
+            for index in range(25):
+                logger.critical(f'message {index}', extra=orm.utils.log.get_dblogger_extra(node))
+
+            handler.flush()
+            logs = Log.objects.get_logs_for(node, order_by=[OrderSpecifier('id', ASCENDING)])
+            self.assertEqual([log.message for log in logs], [f'message {index}' for index in range(25)])
+            self.assertEqual(handler.dropped, 0)
+
+            # Records emitted after the handler is closed are written directly
+            handler.close()
+            logger.critical('closed', extra=orm.utils.log.get_dblogger_extra(node))
+            self.assertEqual(len(Log.objects.get_logs_for(node)), 26)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
     def test_log_querybuilder(self):
         """ Test querying for logs by joining on nodes in the QueryBuilder """
         from aiida.orm import QueryBuilder
@@ -672,6 +672,46 @@ class TestBasic:
         assert len(result) == 20
         assert result == list(chain.from_iterable(zip(pks, uuids)))
 
+    @staticmethod
+    def test_iter_columns():
+        """Test the `QueryBuilder.iter_columns()` method returns the same values as `QueryBuilder.iterall()`."""
+        for value in range(5):
+            orm.Int(value).store()
+
+        builder = orm.QueryBuilder().append(orm.Int, tag='int', project=['id', 'uuid', 'attributes.value', '*'])
+        builder.order_by({'int': 'id'})
+        rows = builder.all()
+
+        batches = list(builder.iter_columns(batch_size=2))
+        assert [len(batch['int.id']) for batch in batches] == [2, 2, 1]
+        assert list(batches[0]) == ['int.id', 'int.uuid', 'int.attributes.value', 'int.*']
+
+        columns = {name: list(chain.from_iterable(batch[name] for batch in batches)) for name in batches[0]}
+        assert list(zip(*columns.values())) == [tuple(row) for row in rows]
+        assert all(isinstance(uuid, str) for uuid in columns['int.uuid'])
+        assert all(isinstance(node, orm.Int) for node in columns['int.*'])
+
+        batches = list(builder.iter_columns(batch_size=None))
+        assert len(batches) == 1
+        assert list(zip(*batches[0].values())) == [tuple(row) for row in rows]
+
+    @staticmethod
+    def test_to_numpy():
+        """Test the `QueryBuilder.to_numpy()` method."""
+        pks = [orm.Int(value).store().pk for value in range(5)]
+        orm.List([1, 2]).store()
+
+        builder = orm.QueryBuilder().append(orm.Int, tag='int', project=['id', 'attributes.value'])
+        arrays = builder.order_by({'int': 'id'}).to_numpy(batch_size=2)
+        assert arrays['int.id'].tolist() == pks
+        assert arrays['int.attributes.value'].tolist() == list(range(5))
+        assert arrays['int.attributes.value'].dtype.kind == 'i'
+
+        builder = orm.QueryBuilder().append(orm.Data, tag='data', project=['attributes.list'])
+        arrays = builder.order_by({'data': 'id'}).to_numpy()
+        assert arrays['data.attributes.list'].dtype == object
+        assert arrays['data.attributes.list'].tolist() == [None] * 5 + [[1, 2]]
+
     def test_query_links(self):
         """Test querying for links"""
         d1, d2, d3, d4 = [orm.Data().store() for _ in range(4)]
@@ -847,6 +887,58 @@ class TestQueryBuilderCornerCases:
         qb = orm.QueryBuilder().append(orm.Data, filters={'or': [{}, {}]})
         assert qb.count() == 1
 
+    def test_large_in_filters(self, monkeypatch):
+        """Test that `in` filters with many values, which are passed as a single array parameter, are correct."""
+        from aiida.orm.implementation.sqlalchemy.querybuilder import main
+
+        nodes = [orm.Int(value).store() for value in range(5)]
+        monkeypatch.setattr(main, 'IN_FILTER_MAX_PARAMETERS', 2)
+
+        filters = {
+            'id': {
+                'in': {node.pk for node in nodes[:4]}
+            },
+            'uuid': {
+                'in': [node.uuid for node in nodes[1:]]
+            },
+            'attributes.value': {
+                '!in': [1, 3, 10]
+            },
+        }
+        qb = orm.QueryBuilder().append(orm.Int, filters=filters, project='id')
+        assert 'unnest' in qb.as_sql()
+        assert 'unnest' in qb.as_sql(inline=True)
+        assert sorted(qb.all(flat=True)) == [nodes[2].pk]
+
+    def test_plan_cache(self):
+        """Test that queries that only differ in the values of their filters reuse the query from the plan cache."""
+        from aiida.orm.implementation.sqlalchemy.querybuilder import SqlaQueryBuilder
+
+        nodes = [orm.Int(value).store() for value in range(3)]
+        SqlaQueryBuilder.clear_plan_cache()
+
+        def query(filters):
+            builder = orm.QueryBuilder().append(orm.Int, filters=filters, project='attributes.value')
+            return sorted(builder.all(flat=True))
+
+        assert query({'id': nodes[0].pk}) == [0]
+        assert SqlaQueryBuilder.get_plan_cache_info()[:2] == (0, 1)
+        assert query({'id': nodes[1].pk}) == [1]
+        assert query({'id': {'in': [nodes[1].pk, nodes[2].pk]}}) == [1, 2]
+        assert query({'id': {'in': [nodes[0].pk]}}) == [0]
+        assert query({'attributes.value': {'>': 0}, 'label': {'like': '%'}}) == [1, 2]
+        assert query({'attributes.value': {'>': 1}, 'label': {'like': '%'}}) == [2]
+        assert query({'attributes.value': {'>': 1.5}, 'label': {'like': '%'}}) == [2]
+        assert SqlaQueryBuilder.get_plan_cache_info()[:2] == (3, 4)
+
+        SqlaQueryBuilder.clear_plan_cache()
+        builder = orm.QueryBuilder().append(orm.Int, project='attributes.value').order_by({orm.Int: 'id'})
+        assert [builder.limit(2).offset(offset).all(flat=True) for offset in (0, 2)] == [[0, 1], [2]]
+        assert SqlaQueryBuilder.get_plan_cache_info()[:2] == (1, 1)
+
+        SqlaQueryBuilder.clear_plan_cache()
+        assert SqlaQueryBuilder.get_plan_cache_info()[:2] == (0, 0)
+
 
 @pytest.mark.usefixtures('aiida_profile_clean')
 class TestAttributes:
@@ -219,3 +219,36 @@ def test_link_manager_contains(aiida_profile_clean):
 
     with pytest.warns(Warning, match=r'The use of double underscores in keys is deprecated..*'):
         assert 'nested__namespace' not in calc.inputs
+
+
+def test_link_manager_snapshot(aiida_profile_clean, monkeypatch):
+    """Test that the ``LinkManager`` caches the links of stored nodes and loads the linked nodes lazily."""
+    from aiida.orm.utils.managers import NodeLinksManager
+
+    calc = orm.CalculationNode()
+    calc.add_incoming(orm.Data().store(), link_type=LinkType.INPUT_CALC, link_label='inp')
+    calc.store()
+
+    out1 = orm.Data().store()
+    out1.add_incoming(calc, link_type=LinkType.CREATE, link_label='out1')
+
+    # The linked nodes are only loaded once, also across different managers of the same node instance
+    assert calc.outputs.out1 is calc.outputs['out1']
+    assert calc.inputs.inp is calc.inputs.inp
+
+    # New links of an unsealed node invalidate the snapshot, also when added to another instance of the node
+    out2 = orm.Data().store()
+    out2.add_incoming(orm.load_node(calc.pk), link_type=LinkType.CREATE, link_label='out2')
+    assert set(calc.outputs) == {'out1', 'out2'}
+    assert calc.outputs.out2.uuid == out2.uuid
+
+    # Once the node is sealed, the snapshot is no longer validated against the database
+    calc.seal()
+    assert 'out2' in calc.outputs
+
+    def raise_error(_):
+        raise AssertionError('the snapshot of a sealed node should not be validated')
+
+    monkeypatch.setattr(NodeLinksManager, '_get_links_count', raise_error)
+    assert set(calc.outputs) == {'out1', 'out2'}
+    assert set(calc.inputs) == {'inp'}
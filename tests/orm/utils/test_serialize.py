@@ -164,3 +164,49 @@ def test_enum():
 
     deserialized = serialize.deserialize_unsafe(serialized)
     assert deserialized == enum
+
+
+def test_serialize_binary_round_trip(aiida_localhost):
+    """Test the round trip of ``serialize_binary`` and ``deserialize_binary_unsafe`` with AiiDA entities."""
+    from plumpy.utils import AttributesFrozendict
+
+    from aiida.common import AttributeDict
+
+    node = orm.Int(1).store()
+    group = orm.Group(label='binary').store()
+    data = {
+        'nodes': [node, node, orm.Str('a').store()],
+        'group': group,
+        'computer': aiida_localhost,
+        'enum': LinkType.RETURN,
+        'attribute_dict': AttributeDict({'a': 1}),
+        'frozendict': AttributesFrozendict({'b': node}),
+    }
+
+    serialized = serialize.serialize_binary(data)
+    assert isinstance(serialized, str)
+    assert serialize.is_serialized_binary(serialized)
+    assert not serialize.is_serialized_binary(serialize.serialize(data))
+
+    deserialized = serialize.deserialize_binary_unsafe(serialized)
+    assert [entity.uuid for entity in deserialized['nodes']] == [entity.uuid for entity in data['nodes']]
+    assert deserialized['nodes'][0] is deserialized['nodes'][1]
+    assert deserialized['group'].uuid == group.uuid
+    assert deserialized['computer'].uuid == aiida_localhost.uuid
+    assert deserialized['enum'] == LinkType.RETURN
+    assert isinstance(deserialized['attribute_dict'], AttributeDict)
+    assert deserialized['attribute_dict'].a == 1
+    assert isinstance(deserialized['frozendict'], AttributesFrozendict)
+    assert deserialized['frozendict'].b.uuid == node.uuid
+
+
+def test_serialize_binary_unstored_node():
+    """Test that ``serialize_binary`` raises for unstored nodes."""
+    with pytest.raises(ValueError):
+        serialize.serialize_binary(orm.Int(1))
+
+
+def test_deserialize_binary_invalid():
+    """Test that ``deserialize_binary_unsafe`` raises for strings that were not serialized with ``serialize_binary``."""
+    with pytest.raises(ValueError):
+        serialize.deserialize_binary_unsafe(serialize.serialize({'a': 1}))
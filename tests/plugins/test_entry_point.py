@@ -8,6 +8,8 @@
 # For further information please visit http://www.aiida.net               #
 ###########################################################################
 """Tests for the :mod:`~aiida.plugins.entry_point` module."""
+import json
+
 import pytest
 
 from aiida.common.warnings import AiidaDeprecationWarning
@@ -43,3 +45,54 @@ def test_get_entry_point_deprecated(group, name):
 
     with pytest.warns(AiidaDeprecationWarning, match=warning):
         get_entry_point(group, name)
+
+
+def test_eps_cache(tmp_path, monkeypatch):
+    """Test that ``eps`` caches the entry points in a file, which is used as long as the environment is unchanged."""
+    from importlib_metadata import EntryPoint
+
+    from aiida.plugins import entry_point
+
+    filepath = tmp_path / 'entry_points.json'
+    monkeypatch.setattr(entry_point, 'get_entry_points_cache_filepath', lambda: filepath)
+    monkeypatch.setattr(entry_point, 'get_environment_fingerprint', lambda: 'fingerprint')
+    entry_point.eps.cache_clear()
+
+    try:
+        all_eps = entry_point.eps()
+        assert filepath.exists()
+        assert 'core.arithmetic.add' in all_eps.select(group='aiida.calculations').names
+
+        # The cache file is used as long as the fingerprint is unchanged
+        cache = json.loads(filepath.read_text())
+        cache['entry_points'].append(['core.cached', 'aiida.orm:Data', 'aiida.data'])
+        filepath.write_text(json.dumps(cache))
+        entry_point.eps.cache_clear()
+        expected = EntryPoint('core.cached', 'aiida.orm:Data', 'aiida.data')
+        assert entry_point.get_entry_point('aiida.data', 'core.cached') == expected
+
+        # Changing the fingerprint causes the cache to be rebuilt
+        monkeypatch.setattr(entry_point, 'get_environment_fingerprint', lambda: 'changed')
+        entry_point.eps.cache_clear()
+        assert 'core.cached' not in entry_point.get_entry_point_names('aiida.data')
+        assert json.loads(filepath.read_text())['fingerprint'] == 'changed'
+    finally:
+        entry_point.eps.cache_clear()
+
+
+def test_get_site_directories(tmp_path, monkeypatch):
+    """Test that only the absolute site directories on ``sys.path`` are used for the environment fingerprint."""
+    import sys
+
+    from aiida.plugins import entry_point
+
+    site_packages = tmp_path / 'lib' / 'site-packages'
+    site_packages.mkdir(parents=True)
+
+    monkeypatch.setattr(sys, 'path', ['', 'lib/site-packages', str(tmp_path), str(site_packages)])
+    assert entry_point.get_site_directories() == [str(site_packages)]
+
+    # The fingerprint does not depend on the current working directory
+    fingerprint = entry_point.get_environment_fingerprint()
+    monkeypatch.chdir(tmp_path)
+    assert entry_point.get_environment_fingerprint() == fingerprint
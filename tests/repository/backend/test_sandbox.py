@@ -98,6 +98,15 @@ def test_open(repository, generate_directory):
         assert handle.read() == b'content_b'
 
 
+def test_get_object_filepath(repository):
+    """Test the ``Repository.get_object_filepath`` method."""
+    key = repository.put_object_from_filelike(io.BytesIO(b'content'))
+    assert repository.get_object_filepath(key).read_bytes() == b'content'
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_filepath('non_existant')
+
+
 def test_iter_object_streams(repository):
     """Test the ``Repository.iter_object_streams`` method."""
     key = repository.put_object_from_filelike(io.BytesIO(b'content'))
@@ -163,6 +172,25 @@ def test_get_object_hash(repository, generate_directory):
     assert repository.get_object_hash(key) == 'ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73'
 
 
+def test_get_object_hashes(repository, generate_directory):
+    """Test the ``Repository.get_object_hashes`` returns the expected values in the order of the keys."""
+    repository.initialise()
+    directory = generate_directory({'file_a': b'content', 'file_b': b'other'})
+
+    keys = []
+    for filename in ['file_a', 'file_b']:
+        with open(directory / filename, 'rb') as handle:
+            keys.append(repository.put_object_from_filelike(handle))
+
+    expected = [repository.get_object_hash(key) for key in keys]
+    assert repository.get_object_hashes(keys) == expected
+    assert repository.get_object_hashes(list(reversed(keys))) == list(reversed(expected))
+    assert repository.get_object_hashes([]) == []
+
+    with pytest.raises(FileNotFoundError):
+        repository.get_object_hashes(['non_existent'])
+
+
 def test_list_objects(repository, generate_directory):
     """Test the ``Repository.delete_object`` method."""
     repository.initialise()
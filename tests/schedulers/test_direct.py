@@ -72,3 +72,43 @@ def test_submit_script_with_num_cores_per_mpiproc(scheduler, template):
     )
     result = scheduler.get_submit_script(template)
     assert f'export OMP_NUM_THREADS={num_cores_per_mpiproc}' in result
+
+
+def test_submit_from_scripts(scheduler, tmp_path):
+    """Test that ``submit_from_scripts`` submits multiple scripts with one command and parses each job id."""
+    from aiida.transports.plugins.local import LocalTransport
+
+    working_directories = []
+    for index in range(3):
+        working_directory = tmp_path / str(index)
+        working_directory.mkdir()
+        (working_directory / 'submit.sh').write_text('exit 0\n')
+        working_directories.append(str(working_directory))
+
+    # The second working directory does not exist, so its submission should fail without affecting the others
+    working_directories[1] = str(tmp_path / 'non_existing')
+
+    with LocalTransport() as transport:
+        scheduler.set_transport(transport)
+        results = scheduler.submit_from_scripts([(directory, 'submit.sh') for directory in working_directories])
+
+    assert len(results) == 3
+    assert results[0].isdigit()
+    assert isinstance(results[1], SchedulerError)
+    assert results[2].isdigit()
+    assert results[0] != results[2]
+
+
+def test_submit_from_scripts_override(tmp_path):
+    """Test that ``submit_from_scripts`` submits the scripts separately if ``submit_from_script`` is overridden."""
+
+    class CustomScheduler(DirectScheduler):
+        """Scheduler that does more than running the submit command to submit a script."""
+
+        def submit_from_script(self, working_directory, submit_script):
+            return f'{working_directory}/{submit_script}'
+
+    scripts = [(str(tmp_path / str(index)), 'submit.sh') for index in range(3)]
+    results = CustomScheduler().submit_from_scripts(scripts)
+
+    assert results == [f'{directory}/{script}' for directory, script in scripts]
@@ -12,6 +12,8 @@
 The tests highlight the features of the archive abstraction.
 """
 from io import BytesIO
+import os
+import zipfile
 
 import pytest
 
@@ -99,3 +101,95 @@ def test_write_read(tmp_path):
         assert repository.has_objects([object_key2, 'other']) == [True, False]
         with repository.open(object_key2) as obj:
             assert obj.read() == b'other'
+
+
+@pytest.mark.parametrize('workers', (1, 2))
+def test_put_objects(tmp_path, monkeypatch, workers):
+    """Test adding objects with ``put_objects``, which compresses them in chunks if multiple workers are used."""
+    from aiida.tools.archive.implementations.sqlite import writer as writer_module
+
+    monkeypatch.setattr(writer_module, 'CHUNK_SIZE', 64)
+    archive_path = tmp_path / 'archive.aiida'
+    archive_format = ArchiveFormatSqlZip()
+    objects = {'empty': b'', 'small': b'abc', 'large': b'abcdefgh' * 100, 'random': os.urandom(200)}
+
+    with archive_format.open(archive_path, 'x') as writer:
+        keys = list(writer.put_objects(((key, BytesIO(content)) for key, content in objects.items()), workers=workers))
+        # adding the same object again should be a no-op (due to de-duplication)
+        assert list(writer.put_objects([('small', BytesIO(b'other'))], workers=workers)) == ['small']
+
+    assert keys == list(objects)
+
+    with zipfile.ZipFile(archive_path) as archive:
+        assert archive.testzip() is None
+        assert archive.getinfo('repo/large').compress_type == zipfile.ZIP_DEFLATED
+        if workers > 1:
+            # objects that do not compress are stored without compression
+            assert archive.getinfo('repo/random').compress_type == zipfile.ZIP_STORED
+
+    with archive_format.open(archive_path, 'r') as reader:
+        repository = reader.get_backend().get_repository()
+        assert set(repository.list_objects()) == set(objects)
+        for key, content in objects.items():
+            with repository.open(key) as obj:
+                assert obj.read() == content
+
+
+@pytest.mark.parametrize('workers', (1, 2))
+def test_write_checkpoint(tmp_path, workers):
+    """Test that writing to an archive with a checkpoint file resumes from the objects that were recorded."""
+    archive_path = tmp_path / 'archive.aiida'
+    checkpoint = tmp_path / 'checkpoint.jsonl'
+    archive_format = ArchiveFormatSqlZip()
+    objects = {f'key{index}': f'content{index}'.encode() * 100 for index in range(4)}
+
+    with pytest.raises(RuntimeError, match='interrupted'):
+        with archive_format.open(archive_path, 'w', checkpoint=checkpoint) as writer:
+            streams = ((key, BytesIO(content)) for key, content in objects.items())
+            for index, _ in enumerate(writer.put_objects(streams, workers=workers)):
+                if index == 1:
+                    raise RuntimeError('interrupted')
+
+    # simulate an interruption while writing an object and recording it in the checkpoint file
+    with archive_path.open('ab') as handle:
+        handle.write(b'incomplete')
+    with checkpoint.open('ab') as handle:
+        handle.write(b'["repo/incomplete"')
+
+    with archive_format.open(archive_path, 'w', checkpoint=checkpoint) as writer:
+        # the recorded objects are not written again
+        assert set(writer._central_dir) == {'repo/key0', 'repo/key1'}  # pylint: disable=protected-access
+        writer.put_object(BytesIO(b'other'), key='other')
+        streams = ((key, BytesIO(content)) for key, content in objects.items())
+        assert list(writer.put_objects(streams, workers=workers)) == list(objects)
+
+    assert len(checkpoint.read_text().splitlines()) == 6
+
+    with zipfile.ZipFile(archive_path) as archive:
+        assert archive.testzip() is None
+        assert len(archive.namelist()) == len(set(archive.namelist()))
+
+    with archive_format.open(archive_path, 'r') as reader:
+        repository = reader.get_backend().get_repository()
+        assert set(repository.list_objects()) == {*objects, 'other'}
+        for key, content in objects.items():
+            with repository.open(key) as obj:
+                assert obj.read() == content
+
+
+@pytest.mark.parametrize('kwargs', ({'compression': 0}, {'checkpoint_parameters': {'nodes': 'other'}}))
+def test_write_checkpoint_parameters(tmp_path, kwargs):
+    """Test that a checkpoint file is not resumed from if the writer has a different compression or parameters."""
+    archive_path = tmp_path / 'archive.aiida'
+    archive_format = ArchiveFormatSqlZip()
+    writer_kwargs = {'checkpoint': tmp_path / 'checkpoint.jsonl', 'checkpoint_parameters': {'nodes': 'hash'}}
+
+    with pytest.raises(RuntimeError, match='interrupted'):
+        with archive_format.open(archive_path, 'w', **writer_kwargs) as writer:
+            writer.put_object(BytesIO(b'content'), key='key')
+            raise RuntimeError('interrupted')
+
+    with archive_format.open(archive_path, 'w', **{**writer_kwargs, **kwargs}) as writer:
+        assert not writer._central_dir  # pylint: disable=protected-access
+
+    assert len(writer_kwargs['checkpoint'].read_text().splitlines()) == 1
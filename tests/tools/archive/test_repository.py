@@ -15,6 +15,7 @@ import pytest
 
 from aiida import orm
 from aiida.tools.archive import create_archive, import_archive
+from aiida.tools.archive.implementations.sqlite.writer import ArchiveWriterSqlZip
 
 
 @pytest.mark.usefixtures('aiida_profile_clean')
@@ -37,3 +38,63 @@ def test_export_repository(aiida_profile, tmp_path):
     assert loaded.repository_metadata == repository_metadata
     assert loaded.get_object_content('file_a', mode='rb') == b'file_a'
     assert loaded.get_object_content('relative/file_b', mode='rb') == b'file_b'
+
+
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_export_repository_workers(aiida_profile, tmp_path):
+    """Test exporting a node with files in the repository, which are compressed by multiple worker threads."""
+    content_random = os.urandom(1000)
+    node = orm.Data()
+    node.put_object_from_filelike(io.BytesIO(b'file_a' * 1000), 'file_a')
+    node.put_object_from_filelike(io.BytesIO(content_random), 'file_b')
+    node.store()
+    node_uuid = node.uuid
+
+    filepath = tmp_path / 'export.aiida'
+    create_archive([node], filename=filepath, workers=2)
+
+    aiida_profile.clear_profile()
+    import_archive(filepath)
+
+    loaded = orm.load_node(uuid=node_uuid)
+    assert loaded.get_object_content('file_a', mode='rb') == b'file_a' * 1000
+    assert loaded.get_object_content('file_b', mode='rb') == content_random
+
+
+@pytest.mark.parametrize('workers', (1, 2))
+@pytest.mark.usefixtures('aiida_profile_clean')
+def test_export_repository_checkpoint(aiida_profile, tmp_path, monkeypatch, workers):
+    """Test that an interrupted export with a checkpoint resumes from the files that were written to the archive."""
+    node = orm.Data()
+    for index in range(3):
+        node.put_object_from_filelike(io.BytesIO(f'file_{index}'.encode()), f'file_{index}')
+    node.store()
+    node_uuid = node.uuid
+
+    filepath = tmp_path / 'export.aiida'
+    put_objects = ArchiveWriterSqlZip.put_objects
+
+    def put_objects_interrupted(self, objects, **kwargs):
+        for key in put_objects(self, objects, **kwargs):
+            yield key
+            raise KeyboardInterrupt()
+
+    with monkeypatch.context() as context:
+        context.setattr(ArchiveWriterSqlZip, 'put_objects', put_objects_interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            create_archive([node], filename=filepath, workers=workers, checkpoint=True)
+
+    work_dir = tmp_path / 'export.aiida.partial'
+    assert not filepath.exists()
+    assert len((work_dir / 'checkpoint.jsonl').read_text().splitlines()) == 2
+
+    create_archive([node], filename=filepath, workers=workers, checkpoint=True)
+    assert filepath.exists()
+    assert not work_dir.exists()
+
+    aiida_profile.clear_profile()
+    import_archive(filepath)
+
+    loaded = orm.load_node(uuid=node_uuid)
+    for index in range(3):
+        assert loaded.get_object_content(f'file_{index}', mode='rb') == f'file_{index}'.encode()
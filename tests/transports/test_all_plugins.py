@@ -1194,6 +1194,36 @@ class TestPutGetTree(unittest.TestCase):
             with custom_transport as transport:
                 transport.gettree(os.path.join(dir_remote, 'sub/path'), os.path.join(dir_local, 'sub/path'))
 
+    @run_for_all_plugins
+    def test_put_get_many(self, custom_transport):  # pylint: disable=no-self-use
+        """Test `put_many` and `get_many` for a mix of files and folders."""
+        with tempfile.TemporaryDirectory() as dir_source, tempfile.TemporaryDirectory() as dir_remote, \
+            tempfile.TemporaryDirectory() as dir_local:
+
+            filenames = [f'file_{index}.txt' for index in range(10)]
+            for filename in filenames:
+                with open(os.path.join(dir_source, filename), 'w', encoding='utf8') as handle:
+                    handle.write(filename)
+
+            os.makedirs(os.path.join(dir_source, 'sub', 'path'))
+            with open(os.path.join(dir_source, 'sub', 'path', 'nested.txt'), 'w', encoding='utf8') as handle:
+                handle.write('nested')
+
+            with custom_transport as transport:
+                transport.put_many([
+                    (os.path.join(dir_source, name), os.path.join(dir_remote, name)) for name in filenames + ['sub']
+                ])
+                transport.get_many([(os.path.join(dir_remote, name), os.path.join(dir_local, name))
+                                    for name in filenames + ['sub', 'non_existing']],
+                                   ignore_nonexisting=True)
+
+            assert sorted(os.listdir(dir_local)) == sorted(filenames + ['sub'])
+            for filename in filenames:
+                with open(os.path.join(dir_local, filename), encoding='utf8') as handle:
+                    assert handle.read() == filename
+            with open(os.path.join(dir_local, 'sub', 'path', 'nested.txt'), encoding='utf8') as handle:
+                assert handle.read() == 'nested'
+
 
 class TestExecuteCommandWait(unittest.TestCase):
     """
@@ -12,6 +12,7 @@ import logging
 import unittest
 
 import paramiko
+import pytest
 
 from aiida.transports.plugins.ssh import SshTransport
 from aiida.transports.transport import TransportInternalError
@@ -142,3 +143,45 @@ def test_gotocomputer_proxyjump():
             """echo '  ** /remote_dir/' ; echo '  ** seems to have been deleted, I logout...' ; fi" """
         )
         assert cmd_str == expected_str
+
+
+@pytest.mark.parametrize('sftp_channels, transfer_mode', ((4, 'sftp'), (1, 'tar'), (4, 'tar')))
+def test_get_many(tmp_path, sftp_channels, transfer_mode):
+    """Test `get_many` with multiple SFTP channels and in the tar transfer mode."""
+    dir_remote = tmp_path / 'remote'
+    dir_local = tmp_path / 'local'
+    (dir_remote / 'sub' / 'path').mkdir(parents=True)
+    dir_local.mkdir()
+
+    filenames = [f'file_{index}.txt' for index in range(20)]
+    for filename in filenames:
+        (dir_remote / filename).write_text(filename)
+    (dir_remote / 'sub' / 'path' / 'nested.txt').write_text('nested')
+
+    with SshTransport(
+        machine='localhost',
+        timeout=30,
+        load_system_host_keys=True,
+        key_policy='AutoAddPolicy',
+        sftp_channels=sftp_channels,
+        transfer_mode=transfer_mode,
+    ) as transport:
+        transport.chdir(str(dir_remote))
+        transport.get_many([(name, str(dir_local / name)) for name in filenames + ['sub', 'non_existing']],
+                           ignore_nonexisting=True)
+
+        with pytest.raises(IOError):
+            transport.get_many([('non_existing', str(dir_local / 'non_existing'))])
+
+    assert sorted(path.name for path in dir_local.iterdir()) == sorted(filenames + ['sub'])
+    assert all((dir_local / filename).read_text() == filename for filename in filenames)
+    assert (dir_local / 'sub' / 'path' / 'nested.txt').read_text() == 'nested'
+
+
+def test_invalid_transfer_options():
+    """Test that invalid values for the transfer options raise."""
+    with pytest.raises(ValueError):
+        SshTransport(machine='localhost', sftp_channels=0)
+
+    with pytest.raises(ValueError):
+        SshTransport(machine='localhost', transfer_mode='scp')
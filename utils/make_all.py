@@ -75,11 +75,58 @@ def gather_all(cur_path: List[str],
     return all_list
 
 
-def write_inits(folder_path: str, all_dict: dict, skip_children: Dict[str, List[str]]) -> Dict[str, List[str]]:
+LAZY_GETATTR = """
+
+def __getattr__(name):
+    \"\"\"Import the names of ``__all__`` and the submodules of this package when they are first accessed.\"\"\"
+    import importlib
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(f'.{_LAZY_IMPORTS[name]}', __name__), name)
+    elif name in _LAZY_IMPORTS.values():
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    \"\"\"Return the names of the module, including those of ``__all__`` that have not been imported yet.\"\"\"
+    return sorted(set(globals()) | set(__all__))
+"""
+
+
+def lazy_content(mod_path: List[str], path_all_dict: dict, skip_children: dict, alls: List[str]) -> List[str]:
+    """Return the content of an ``__init__`` file that only imports the names of ``__all__`` when first accessed.
+
+    The wildcard imports are only executed for static type checkers. At runtime, the names are resolved by a module
+    level ``__getattr__`` (PEP 562), which also imports the direct submodules, as the wildcard imports would have.
+    """
+    lazy_imports = {}
+    for mod in sorted(path_all_dict.keys()):
+        for name in gather_all(mod_path + [mod], path_all_dict[mod], skip_children):
+            lazy_imports.setdefault(name, mod)
+
+    return (['', '# AUTO-GENERATED'] + ['', '# yapf: disable', '# pylint: disable=wildcard-import', ''] +
+            ['from typing import TYPE_CHECKING', '', 'if TYPE_CHECKING:'] +
+            [f'    from .{mod} import *' for mod in sorted(path_all_dict.keys())] + ['', '__all__ = ('] +
+            [f'    {a!r},' for a in sorted(set(alls))] + [')', '', '_LAZY_IMPORTS = {'] +
+            [f'    {name!r}: {mod!r},' for name, mod in sorted(lazy_imports.items())] + ['}'] +
+            LAZY_GETATTR.splitlines() + ['', '', '# yapf: enable', ''])
+
+
+def write_inits(
+    folder_path: str,
+    all_dict: dict,
+    skip_children: Dict[str, List[str]],
+    lazy: Optional[List[str]] = None
+) -> Dict[str, List[str]]:
     """Write __init__.py files for all subfolders.
 
+    :param lazy: folders whose ``__init__`` should only import the names of ``__all__`` when they are first accessed.
     :return: folders with non-unique imports
     """
+    lazy = lazy or []
     folder_path = Path(folder_path)
     non_unique = {}
     for path in folder_path.glob('**/__init__.py'):
@@ -113,10 +160,14 @@ def write_inits(folder_path: str, all_dict: dict, skip_children: Dict[str, List[
             if len(alls + list(path_all_dict)) != len(set(alls + list(path_all_dict))):
                 non_unique[rel_path] = [k for k, v in Counter(alls + list(path_all_dict)).items() if v > 1]
 
-            auto_content = (['', '# AUTO-GENERATED'] +
-                            ['', '# yapf: disable', '# pylint: disable=wildcard-import', ''] +
-                            [f'from .{mod} import *' for mod in sorted(path_all_dict.keys())] + ['', '__all__ = ('] +
-                            [f'    {a!r},' for a in sorted(set(alls))] + [')', '', '# yapf: enable', ''])
+            if rel_path in lazy:
+                auto_content = lazy_content(list(mod_path), path_all_dict, skip_children, alls)
+            else:
+                auto_content = (['', '# AUTO-GENERATED'] +
+                                ['', '# yapf: disable', '# pylint: disable=wildcard-import', ''] +
+                                [f'from .{mod} import *' for mod in sorted(path_all_dict.keys())] +
+                                ['', '__all__ = ('] + [f'    {a!r},' for a in sorted(set(alls))] +
+                                [')', '', '# yapf: enable', ''])
 
         start_content = []
         end_content = []
@@ -165,8 +216,19 @@ if __name__ == '__main__':
         # keep at aiida.tools.archive level
         'tools': ['archive'],
     }
+    # only import the names of ``__all__`` when first accessed, to reduce the import time of ``aiida`` and ``verdi``
+    _lazy = [
+        'cmdline',
+        'cmdline/params',
+        'cmdline/params/types',
+        'cmdline/utils',
+        'manage',
+        'manage/external',
+        'repository',
+        'repository/backend',
+    ]
     _all_dict, _bad_all = parse_all(_folder)
-    _non_unique = write_inits(_folder, _all_dict, _skip)
+    _non_unique = write_inits(_folder, _all_dict, _skip, _lazy)
     _bad_all.pop('missing', '')  # allow missing __all__
     if _bad_all:
         print('unparsable __all__:')
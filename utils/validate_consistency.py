@@ -123,8 +123,9 @@ def validate_verdi_documentation():
     message = 'Below is a list with all available subcommands.'
     block = [f"{header}\n{'=' * len(header)}\n{message}\n\n"]
 
-    for name, command in sorted(verdi.commands.items()):
-        ctx = click.Context(command, terminal_width=width)
+    for name in verdi.list_commands(ctx):
+        command = verdi.get_command(ctx, name)
+        command_ctx = click.Context(command, terminal_width=width)
 
         header_label = f'.. _reference:command-line:verdi-{name}:'
         header_string = f'``verdi {name}``'
@@ -134,7 +135,7 @@ def validate_verdi_documentation():
         block.append(f'{header_string}\n')
         block.append(f'{header_underline}\n\n')
         block.append('.. code:: console\n\n')  # Mark the beginning of a literal block
-        for line in ctx.get_help().split('\n'):
+        for line in command_ctx.get_help().split('\n'):
             if line:
                 block.append(f'    {line}\n')
             else: